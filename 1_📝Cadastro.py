@@ -2,54 +2,37 @@
 import streamlit as st
 from datetime import date
 
-# Dados de login: usuários e senhas
-users = {
-    "admin": "admin123",
-    "user1": "mypassword",
-    "user2": "streamlit"
-}
+import aplicacao
+import autenticacao
+import escrita
+import esquema
+import importacao
+import metricas
+import particoes
 
-# Função de autenticação
-def authenticate(username, password):
-    if username in users and users[username] == password:
-        return True
-    return False
+aplicacao.preparar()
+metricas.iniciar("cadastro")
 
-# Interface de login
-def login():
-    st.title("Área Restrita - Login")
-
-    username = st.text_input("Usuário")
-    password = st.text_input("Senha", type="password")
-    login_button = st.button("Entrar")
-
-    if login_button:
-        if authenticate(username, password):
-            st.session_state['authenticated'] = True
-            st.success("Login bem-sucedido!")
-        else:
-            st.error("Usuário ou senha incorretos!")
-
-# Verifica se o usuário está autenticado
-if 'authenticated' not in st.session_state:
-    st.session_state['authenticated'] = False
-
-# Função para validar e formatar datas no formato DD/MM/YYYY
-def formatar_data(data):
-    if isinstance(data, date):
-        return data.strftime('%d/%m/%Y')
-    return ""
-
-if not st.session_state['authenticated']:
-    login()
+# Verifica se o usuário está autenticado (login compartilhado por todas as páginas)
+if not autenticacao.usuario_logado():
+    autenticacao.tela_login()
 else:
     # Função para gravar os dados
     def gravar_dados(nome, telefone, cpf, cnpj, dt_contrato, tipo, orgao, auto, processo_nb, pagamento, valor, dt_entrada_ct, dt_efeito_sup):
         if nome and dt_contrato:
-            # Gravando no arquivo CSV com datas formatadas
-            with open("clientes.csv", "a", encoding="utf-8") as file:
-                file.write(f"{nome},{telefone},{cpf},{cnpj},{formatar_data(dt_contrato)},{tipo},{orgao},{auto},{processo_nb},{pagamento},{valor},{formatar_data(dt_entrada_ct)},{formatar_data(dt_efeito_sup)}")
-            st.session_state["Sucesso"] = True
+            particoes.da_sessao()
+            # Grava pela fila de escrita no banco do escritório escolhido e só retorna quando o registro está em disco
+            try:
+                with metricas.etapa("cadastro.gravar"):
+                    escrita.gravar_cliente({
+                        "Nome": nome, "Telefone": telefone, "CPF": cpf, "CNPJ": cnpj,
+                        "DT_contrato": dt_contrato, "Tipo_de_Processo": tipo, "Orgao": orgao,
+                        "Auto_infracao": auto, "Num_Processo": processo_nb, "Pagamento": pagamento,
+                        "Valor": valor, "DT_Entrada_CT": dt_entrada_ct, "DT_Efeito_Susp": dt_efeito_sup,
+                    })
+                st.session_state["Sucesso"] = True
+            except Exception:
+                st.session_state["Sucesso"] = False
         else:
             st.session_state["Sucesso"] = False
 
@@ -59,7 +42,10 @@ else:
         page_icon="🧾"
     )
 
+    escritorio = particoes.seletor()
     st.title("Cadastro de Cliente")
+    if len(particoes.ESCRITORIOS) > 1:
+        st.caption(f"Escritório: {escritorio}")
     st.divider()
 
     # Formulário de cadastro
@@ -71,11 +57,11 @@ else:
     # Permitir que o usuário selecione a data desejada
     dt_contrato = st.date_input("Data do contrato", value=date.today(), format="DD/MM/YYYY")
     
-    tipo = st.selectbox("Tipo de Processo", ["JARI", "CETRAN", "DEFESA PRÉVIA"])
-    orgao = st.selectbox("Orgão", ["DNIT", "GOINFRA", "SMM", "DETRAN", "PRF"])
+    tipo = st.selectbox("Tipo de Processo", esquema.TIPOS_PROCESSO)
+    orgao = st.selectbox("Orgão", esquema.ORGAOS)
     auto = st.text_input("Digite a auto infração:", key="auto_infracao")
     processo_nb = st.text_input("Número do Processo:", key="numero_processo")
-    pagamento = st.selectbox("Tipo de pagamento", ["DINHEIRO", "CARTAO", "PIX"])
+    pagamento = st.selectbox("Tipo de pagamento", esquema.PAGAMENTOS)
     valor = st.number_input("Valor", key="valor_do_serviço")
     dt_entrada_ct = st.date_input("Data da entrada do processo", value=date.today(), format="DD/MM/YYYY")
     dt_efeito_sup = st.date_input("Data do efeito suspensivo", value=date.today(), format="DD/MM/YYYY")
@@ -89,7 +75,52 @@ else:
         else:
             st.error("Houve algum problema no cadastro", icon="❌")
 
+    # Importação em lote a partir de planilha (CSV ou Excel)
+    st.divider()
+    st.subheader("Importar planilha de clientes")
+    st.caption(
+        "A planilha precisa das colunas Nome e DT_contrato; as demais colunas do cadastro são opcionais. "
+        "Linhas com dados inválidos são recusadas e listadas abaixo; as válidas são gravadas todas juntas."
+    )
+    planilha = st.file_uploader("Arquivo CSV ou XLSX", type=["csv", "xlsx"], key="planilha_importacao")
+
+    if planilha is not None and st.button("Importar clientes"):
+        aviso = st.empty()
+        try:
+            with metricas.etapa("cadastro.importar_leitura"):
+                linhas, recusadas = importacao.preparar_importacao(
+                    planilha, planilha.name, progresso=lambda lidas: aviso.info(f"{lidas} linhas lidas...")
+                )
+            with metricas.etapa("cadastro.importar_gravacao"):
+                gravadas = escrita.importar_linhas(linhas) if linhas else 0
+            metricas.contar("cadastro.linhas_importadas", gravadas)
+            metricas.contar("cadastro.linhas_recusadas", len(recusadas))
+            aviso.empty()
+            st.session_state["importacao"] = (gravadas, recusadas)
+        except Exception as erro:
+            aviso.empty()
+            st.session_state.pop("importacao", None)
+            st.error(f"Não foi possível importar a planilha: {erro}", icon="❌")
+
+    if "importacao" in st.session_state:
+        gravadas, recusadas = st.session_state["importacao"]
+        st.success(f"{gravadas} clientes importados", icon="✅")
+        if not recusadas.empty:
+            st.warning(f"{len(recusadas)} linhas recusadas")
+            st.dataframe(recusadas.head(1000), hide_index=True)
+            st.download_button(
+                "Baixar linhas recusadas",
+                importacao.relatorio_recusadas(recusadas),
+                file_name="linhas_recusadas.csv",
+                mime="text/csv",
+            )
+
     # Botão de logout
     if st.button("Sair"):
-        st.session_state['authenticated'] = False
+        autenticacao.sair()
         st.experimental_rerun()
+
+    # Tempos desta execução da página (painel só para administradores)
+    execucao = metricas.finalizar()
+    if autenticacao.eh_admin():
+        metricas.painel(execucao)
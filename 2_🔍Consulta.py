@@ -1,128 +1,121 @@
+import math
+
 import streamlit as st
-import pandas as pd
 import plotly.express as px
-from datetime import datetime
+
+import alertas
+import aplicacao
+import armazenamento
+import autenticacao
+import busca
+import cache_dados
+import escrita
+import formatacao
+import metricas
+import particoes
+import prazos
 
 # Configuração da página
 st.set_page_config(page_title="Consulta cadastro", page_icon="🔍")
-
-# Definindo o usuário e senha para a área restrita
-USERNAME = "admin"
-PASSWORD = "admin123"
-
-# Função para verificar login
-def check_login(username, password):
-    return username == USERNAME and password == PASSWORD
-
-# Página de login
-def login():
-    st.title("Área Restrita - Login")
-    st.text_input("Usuário", key="username")
-    st.text_input("Senha", type="password", key="password")
-    if st.button("Entrar"):
-        if check_login(st.session_state.username, st.session_state.password):
-            st.session_state.logged_in = True
-            st.success("Login realizado com sucesso!", icon="✅")
-        else:
-            st.error("Usuário ou senha incorretos", icon="❌")
-
-# Função para calcular o prazo com base na data atual
-def calcular_prazo(row):
-    if row['Status'] in ["DEFERIDO", "NEGADO"]:
-        return "Não há Prazo"  # Para Deferido e NEGADO, não conta prazo
-
-    try:
-        if pd.notnull(row['DT_Efeito_Susp']):
-            data_suspensao = pd.to_datetime(row['DT_Efeito_Susp'], dayfirst=True)
-            data_atual = datetime.now()
-            prazo = (data_suspensao - data_atual).days
-            if prazo < 0:
-                return f"Vencido há {-prazo} dias"
-            else:
-                return f"Faltam {prazo} dias"
-        return "Datas ausentes"
-    except:
-        return "Erro no cálculo"
-
-# Funções de formatação
-def formatar_telefone(telefone):
-    telefone = str(telefone)
-    if len(telefone) == 11:
-        return f"({telefone[:2]}) {telefone[2:7]}-{telefone[7:]}"
-    elif len(telefone) == 10:
-        return f"({telefone[:2]}) {telefone[2:6]}-{telefone[6:]}"
-    return telefone
-
-def formatar_cpf(cpf):
-    cpf = str(cpf).zfill(11)
-    return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
-
-def formatar_cnpj(cnpj):
-    cnpj = str(cnpj).zfill(14)
-    return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
-
-def formatar_valor(valor):
-    try:
-        return f"R$ {float(valor):,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-    except ValueError:
-        return valor
-
-# Verifica se o usuário está logado
-if "logged_in" not in st.session_state:
-    st.session_state.logged_in = False
-
-if not st.session_state.logged_in:
-    login()
+aplicacao.preparar()
+metricas.iniciar("consulta")
+
+# Salva só o que mudou na tabela (chamada pelo botão, antes da próxima execução da página).
+# O data_editor guarda as edições por posição da linha; a posição é traduzida para o id
+# do cliente com a lista de ids da página que o usuário estava vendo.
+def salvar_alteracoes():
+    particoes.da_sessao()
+    pagina = st.session_state['pagina_editada']
+    estado = st.session_state.get(pagina['chave'], {})
+    alteracoes, exclusoes = {}, []
+    for posicao, mudancas in estado.get('edited_rows', {}).items():
+        id_cliente = pagina['ids'][int(posicao)]
+        status_exibido = pagina['status'][int(posicao)]
+        if mudancas.get('Excluir'):
+            exclusoes.append(id_cliente)
+        elif mudancas.get('Status', status_exibido) != status_exibido:
+            alteracoes[id_cliente] = (status_exibido, mudancas['Status'])
+    with metricas.etapa("consulta.salvar"):
+        conflitos = escrita.salvar_edicoes(alteracoes, exclusoes)
+    st.session_state['resultado_salvar'] = (len(alteracoes) - len(conflitos), len(exclusoes), conflitos)
+    # Troca a chave do editor para começar a próxima página sem edições pendentes
+    st.session_state['edicoes_salvas'] = st.session_state.get('edicoes_salvas', 0) + 1
+
+# Colunas que podem ordenar a tabela (a ordenação é feita pelo banco)
+ORDENACOES = {
+    "id": "Ordem de cadastro",
+    "Nome": "Nome",
+    "DT_Efeito_Susp": "Prazo (efeito suspensivo)",
+    "Status": "Status",
+    "Valor": "Valor",
+}
+
+# Verifica se o usuário está logado (login compartilhado por todas as páginas)
+if not autenticacao.usuario_logado():
+    autenticacao.tela_login()
 else:
-    # Carrega os dados do CSV
-    try:
-        dados = pd.read_csv("clientes.csv")
-    except FileNotFoundError:
-        st.error("O arquivo 'clientes.csv' não foi encontrado.")
-        dados = pd.DataFrame()
-
-    # Garantir que a coluna Status seja tratada como string
-    if 'Status' in dados.columns:
-        dados['Status'] = dados['Status'].astype(str)
-
-    # Criar uma cópia para exibir com formatações
-    dados_formatados = dados.copy()
-
-    # Aplicar formatação específica
-    if 'Telefone' in dados_formatados.columns:
-        dados_formatados['Telefone'] = dados_formatados['Telefone'].apply(formatar_telefone)
-
-    if 'CPF' in dados_formatados.columns:
-        dados_formatados['CPF'] = dados_formatados['CPF'].apply(formatar_cpf)
-
-    if 'CNPJ' in dados_formatados.columns:
-        dados_formatados['CNPJ'] = dados_formatados['CNPJ'].apply(formatar_cnpj)
-
-    if 'Valor' in dados_formatados.columns:
-        dados_formatados['Valor'] = dados_formatados['Valor'].apply(formatar_valor)
-
-    campos_para_datas = ['DT_contrato', 'DT_Entrada_CT', 'DT_Efeito_Susp']
-    for campo in campos_para_datas:
-        if campo in dados_formatados.columns:
-            dados_formatados[campo] = pd.to_datetime(dados_formatados[campo], errors='coerce').apply(
-                lambda x: x.strftime('%d/%m/%Y') if pd.notnull(x) else ''
-            )
-
-    if 'DT_Efeito_Susp' in dados.columns:
-        # Calcular o prazo apenas para os registros que não são Deferido ou Indeferido
-        dados_formatados['prazo'] = dados.apply(calcular_prazo, axis=1)
-
+    # Só o banco do escritório escolhido é consultado
+    particoes.seletor()
     st.title("Clientes cadastrados")
     st.divider()
 
-    # Quantidade de prazos vencidos
-    vencidos = dados_formatados[dados_formatados['prazo'].str.contains("Vencido", na=False)]
+    # Clientes do escritório, do cache compartilhado pelas sessões (snapshot Parquet mais
+    # as alterações gravadas depois dele)
+    with metricas.etapa("consulta.carregar_clientes"):
+        clientes = cache_dados.obter_clientes()
+
+    # Quantidade de prazos vencidos (filtro numérico sobre os dias restantes, em todos os clientes)
+    with metricas.etapa("consulta.prazos_vencidos"):
+        vencidos = prazos.contar_vencidos(clientes)
     st.subheader("Análise de Prazos Vencidos")
-    st.metric(label="Total de Prazos Vencidos", value=len(vencidos))
+    st.metric(label="Total de Prazos Vencidos", value=vencidos)
 
     # Verificar se há prazos vencidos e exibir alerta
-    if len(vencidos) > 0:
-        st.warning(f"⚠️ Atenção! Existem {len(vencidos)} prazos vencidos. Verifique os registros.")
+    if vencidos > 0:
+        st.warning(f"⚠️ Atenção! Existem {vencidos} prazos vencidos. Verifique os registros.")
+
+    # Prazos que vencem em breve (lidos do índice de prazos mantido pelos alertas)
+    dias_alerta = st.number_input("Prazos que vencem nos próximos dias", min_value=0, max_value=90, value=7, step=1)
+    with metricas.etapa("consulta.alertas"):
+        proximos = alertas.vencendo(dias_alerta)
+        if proximos:
+            st.info(f"🔔 {len(proximos)} prazo(s) vencem nos próximos {dias_alerta} dias.")
+            with st.expander("Ver prazos próximos"):
+                proximos_dados = clientes.loc[[id_cliente for _, id_cliente in proximos if id_cliente in clientes.index]]
+                proximos_dados['dias_restantes'] = prazos.calcular_dias_restantes(proximos_dados)
+                proximos_formatados = formatacao.formatar_tabela(proximos_dados[['Nome', 'Telefone', 'Tipo_de_Processo', 'DT_Efeito_Susp']])
+                proximos_formatados['prazo'] = prazos.rotular_prazos(proximos_dados)
+                st.dataframe(proximos_formatados)
+
+    # Controles da tabela: ordenação, filtro e tamanho da página são resolvidos pelo banco;
+    # a contagem por Status (gráfico e total de clientes) é mantida pelo cache
+    with metricas.etapa("consulta.contar_status"):
+        status_count = cache_dados.contar_por_status()
+    col1, col2, col3, col4 = st.columns([2, 3, 1, 1])
+    ordenar_por = col1.selectbox("Ordenar por", list(ORDENACOES), format_func=ORDENACOES.get)
+    filtro_status = col2.multiselect("Filtrar por status", [s for s in status_count.index if s != "Sem status"])
+    tamanho_pagina = col3.selectbox("Linhas", [25, 50, 100], index=1)
+    decrescente = col4.checkbox("Decrescente")
+
+    total = int(status_count[filtro_status].sum()) if filtro_status else len(clientes)
+    total_paginas = max(1, math.ceil(total / tamanho_pagina))
+    pagina = st.number_input("Página", min_value=1, max_value=total_paginas, value=1, step=1)
+    st.caption(f"{total} clientes — página {pagina} de {total_paginas}")
+
+    # Busca só a página pedida (índice = id do cliente)
+    with metricas.etapa("consulta.carregar_pagina"):
+        dados = armazenamento.consultar_pagina(
+            pagina - 1, tamanho_pagina, ordenar_por, decrescente, status=filtro_status
+        )
+    dados['Status'] = dados['Status'].astype(object).fillna('').astype(str)
+
+    # Prazo e formatação só das linhas desta página
+    with metricas.etapa("consulta.calcular_prazos"):
+        dados['dias_restantes'] = prazos.calcular_dias_restantes(dados)
+    colunas_exibidas = ['Nome', 'Telefone', 'CPF', 'CNPJ', 'Valor', 'Tipo_de_Processo', 'Status']
+    with metricas.etapa("consulta.formatacao"):
+        dados_formatados = formatacao.formatar_tabela(dados[colunas_exibidas])
+        dados_formatados['prazo'] = prazos.rotular_prazos(dados)
 
     # Permitir a edição da coluna Status e adicionar coluna de seleção para excluir
     if 'Status' in dados.columns:
@@ -131,65 +124,78 @@ else:
 
         # Exibe o DataFrame
         # Adicionei uma vírgula entre 'Tipo_de_Processo' e 'Status'
-        dados_editaveis = st.data_editor(
-            dados_formatados[['Nome', 'Telefone', 'CPF', 'CNPJ', 'Valor', 'Tipo_de_Processo', 'Status', 'prazo', 'Excluir']],
-            num_rows="dynamic"
-        )
-
-        # Atualiza os dados de Status
-        if st.button("Salvar Alterações"):
-            dados['Status'] = dados_editaveis['Status']
-            dados.to_csv("clientes.csv", index=False)
-            st.success("Alterações salvas com sucesso!")
-
-        # Excluir clientes marcados
-        clientes_para_excluir = dados_editaveis[dados_editaveis['Excluir']].index.tolist()
-        if clientes_para_excluir:
-            dados = dados.drop(clientes_para_excluir)  # Excluir do DataFrame
-            dados.to_csv("clientes.csv", index=False)  # Salvar as alterações
-            st.success("Clientes excluídos com sucesso!")
+        # A chave muda quando as linhas exibidas mudam, para as edições nunca caírem em outro cliente
+        ids_pagina = dados_formatados.index.tolist()
+        chave_editor = f"editor_clientes_{hash(tuple(ids_pagina))}_{st.session_state.get('edicoes_salvas', 0)}"
+        st.session_state['pagina_editada'] = {
+            'chave': chave_editor, 'ids': ids_pagina, 'status': dados['Status'].tolist()
+        }
+        with metricas.etapa("consulta.data_editor"):
+            st.data_editor(
+                dados_formatados[['Nome', 'Telefone', 'CPF', 'CNPJ', 'Valor', 'Tipo_de_Processo', 'Status', 'prazo', 'Excluir']],
+                num_rows="fixed",
+                disabled=['Nome', 'Telefone', 'CPF', 'CNPJ', 'Valor', 'Tipo_de_Processo', 'prazo'],
+                key=chave_editor
+            )
+        st.caption("Altere o Status ou marque 'Excluir' e clique em Salvar Alterações.")
+
+        # Grava só as linhas alteradas ou marcadas para exclusão
+        st.button("Salvar Alterações", on_click=salvar_alteracoes)
+
+        if 'resultado_salvar' in st.session_state:
+            alterados, excluidos, conflitos = st.session_state.pop('resultado_salvar')
+            if alterados:
+                st.success(f"Alterações salvas com sucesso! ({alterados} cliente(s))")
+            if excluidos:
+                st.success(f"Clientes excluídos com sucesso! ({excluidos} cliente(s))")
+            if conflitos:
+                st.warning(f"⚠️ {len(conflitos)} cliente(s) foram alterados por outro usuário e não foram salvos: {conflitos}. Confira e tente novamente.")
+            if not (alterados or excluidos or conflitos):
+                st.info("Nenhuma alteração para salvar.")
 
     st.title("Localizar clientes cadastrados 🔎")
     st.divider()
 
-    st.session_state.localizar = st.text_input("Digite o nome do cliente para localizar")
-    if st.button("Pesquisar"):
-        # Filtrar os dados com base na pesquisa
-        dados_filtrados = dados[dados['Nome'].str.contains(st.session_state.localizar, case=False, na=False)]
-        if not dados_filtrados.empty:
-            # Aplicar formatações nos dados filtrados
-            if 'Telefone' in dados_filtrados.columns:
-                dados_filtrados['Telefone'] = dados_filtrados['Telefone'].apply(formatar_telefone)
-            if 'CPF' in dados_filtrados.columns:
-                dados_filtrados['CPF'] = dados_filtrados['CPF'].apply(formatar_cpf)
-            if 'CNPJ' in dados_filtrados.columns:
-                dados_filtrados['CNPJ'] = dados_filtrados['CNPJ'].apply(formatar_cnpj)
-            if 'Valor' in dados_filtrados.columns:
-                dados_filtrados['Valor'] = dados_filtrados['Valor'].apply(formatar_valor)
-
-            for campo in campos_para_datas:
-                if campo in dados_filtrados.columns:
-                    dados_filtrados[campo] = pd.to_datetime(dados_filtrados[campo], errors='coerce').apply(
-                        lambda x: x.strftime('%d/%m/%Y') if pd.notnull(x) else ''
-                    )
-
-            st.dataframe(dados_filtrados)
+    # Busca conforme o usuário digita: nome (sem acento), CPF, CNPJ, auto de infração ou processo
+    st.session_state.localizar = st.text_input(
+        "Digite o nome, CPF, CNPJ, auto de infração ou número do processo",
+        placeholder="Ex.: assuncao, 123.456, 8767"
+    )
+    consulta = st.session_state.localizar.strip()
+    if consulta and len(consulta) < busca.TAMANHO_MINIMO:
+        st.info(f"Digite ao menos {busca.TAMANHO_MINIMO} caracteres para buscar.")
+    elif consulta:
+        with metricas.etapa("consulta.busca"):
+            ids_encontrados = busca.buscar_clientes(consulta)
+        metricas.contar("consulta.buscas")
+        if ids_encontrados is None:
+            st.info("A busca está sendo preparada; tente novamente em alguns segundos.")
+        elif ids_encontrados:
+            # Carregar e formatar só os clientes encontrados
+            with metricas.etapa("consulta.resultados_busca"):
+                dados_filtrados = formatacao.formatar_tabela(clientes.loc[[i for i in ids_encontrados if i in clientes.index]])
+                st.dataframe(dados_filtrados)
         else:
             st.error("Cliente não encontrado", icon="❌")
 
     # Gráfico de Distribuição de Status
     st.subheader("Análise de Distribuição de Status")
-    if 'Status' in dados.columns:
-        status_count = dados['Status'].value_counts()
-        fig_status = px.pie(status_count, values=status_count, names=status_count.index, title="Distribuição de Status dos Clientes")
-        st.plotly_chart(fig_status)
+    if not status_count.empty:
+        with metricas.etapa("consulta.grafico_status"):
+            fig_status = px.pie(status_count, values=status_count, names=status_count.index, title="Distribuição de Status dos Clientes")
+            st.plotly_chart(fig_status)
     else:
-        st.info("A coluna 'Status' não está disponível para análise.")
+        st.info("Nenhum cliente cadastrado para análise.")
 
     if st.button("Sair"):
-        st.session_state['logged_in'] = False
+        autenticacao.sair()
         st.experimental_rerun()
 
+    # Tempos desta execução da página (painel só para administradores)
+    execucao = metricas.finalizar()
+    if autenticacao.eh_admin():
+        metricas.painel(execucao)
+
 
 
 
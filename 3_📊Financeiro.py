@@ -1,93 +1,68 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 from datetime import datetime
 
-# Dados de login: usuários e senhas
-USER_CREDENTIALS = {
-    "admin": "admin123",
-    "user1": "mypassword",
-    "user2": "streamlit"
-}
-
-# Função para verificar o login
-def check_login(username, password):
-    return USER_CREDENTIALS.get(username) == password
-
-# Carregar os dados CSV
-def load_data(file):
-    data = pd.read_csv(file, on_bad_lines='skip', sep=',')  # Usa ',' como separador padrão
-    if 'DT_contrato' in data.columns:
-        # Converte 'DT_contrato' para datetime no formato DD/MM/YYYY
-        data['DT_contrato'] = pd.to_datetime(data['DT_contrato'], errors='coerce', format='%d/%m/%Y')  
-    if 'Valor' in data.columns:
-        data['Valor'] = pd.to_numeric(data['Valor'], errors='coerce')  # Garante que 'Valor' seja numérico
-    return data
-
-# Função de login
-def login():
-    st.title("Login")
-    username = st.text_input("Usuário")
-    password = st.text_input("Senha", type="password")
-    login_button = st.button("Entrar")
-
-    if login_button:
-        if check_login(username, password):
-            st.session_state['logged_in'] = True
-            st.success("Login bem-sucedido!")
-            st.experimental_rerun()
-        else:
-            st.error("Usuário ou senha incorretos!")
-
-# Verifica se o usuário está logado
-if 'logged_in' not in st.session_state:
-    st.session_state['logged_in'] = False
-
-if not st.session_state['logged_in']:
-    login()
+import aplicacao
+import autenticacao
+import exportacao
+import formatacao
+import metricas
+import particoes
+import resumos
+
+aplicacao.preparar()
+metricas.iniciar("financeiro")
+
+# Nomes exibidos no gráfico para as formas de pagamento (as demais aparecem como cadastradas)
+NOMES_PAGAMENTO = {'DINHEIRO': 'Dinheiro', 'PIX': 'Pix', 'CARTAO': 'Cartão'}
+
+# Carregar o resumo mensal do período (lido do resumo mantido pelo banco, não dos registros);
+# com vários escritórios, cada banco é consultado em paralelo e os resumos são somados
+def load_data(start_date, end_date, escritorios):
+    resumo = resumos.consultar_resumo(start_date, end_date, escritorios)
+    return resumo.rename(columns={'mes': 'Mes_Ano', 'valor_total': 'Valor'})
+
+# Verifica se o usuário está logado (login compartilhado por todas as páginas)
+if not autenticacao.usuario_logado():
+    autenticacao.tela_login("Login")
 else:
-    # Usar o caminho correto do arquivo no seu sistema
-    data_file = 'clientes.csv'  # Caminho correto do arquivo enviado
-    data = load_data(data_file)
+    # Escritório em uso ou, no relatório consolidado, todos os escritórios
+    escritorios = [particoes.seletor()]
+    if len(particoes.ESCRITORIOS) > 1 and st.sidebar.checkbox("Somar todos os escritórios"):
+        escritorios = particoes.ESCRITORIOS
+
+    primeira_data = resumos.primeira_data_contrato(escritorios)
 
     # Título e descrição
     st.title("Dashboard Financeiro 📊")
     st.write("Este dashboard exibe uma análise financeira baseada nos dados de faturamento.")
 
-    # Verificar se as colunas necessárias existem
-    if 'Valor' in data.columns and 'Pagamento' in data.columns and 'DT_contrato' in data.columns:
+    # Verificar se há contratos cadastrados
+    if primeira_data is not None:
         
         # **Seleção de Período**
         st.subheader("Selecione o período de análise")
         
-        # Garantir que as datas estejam no formato DD/MM/YYYY
-        min_date = data['DT_contrato'].min().strftime('%d/%m/%Y')
-        max_date = datetime.now().strftime('%d/%m/%Y')
-        
         # Selecionar a data inicial e final
-        start_date = st.date_input("Data de início (DD/MM/YYYY)", value=data['DT_contrato'].min(), 
-                                   min_value=data['DT_contrato'].min(), max_value=datetime.now(), 
+        start_date = st.date_input("Data de início (DD/MM/YYYY)", value=primeira_data, 
+                                   min_value=primeira_data, max_value=datetime.now(), 
                                    format="DD/MM/YYYY")
         
         end_date = st.date_input("Data de término (DD/MM/YYYY)", value=datetime.now(), 
                                  min_value=start_date, max_value=datetime.now(), format="DD/MM/YYYY")
 
-        # Filtrar os dados pelo intervalo de datas selecionado
-        filtered_data = data[(data['DT_contrato'] >= pd.to_datetime(start_date)) & (data['DT_contrato'] <= pd.to_datetime(end_date))]
+        # Resumo mensal do intervalo de datas selecionado (uma linha por mês e combinação de campos)
+        with metricas.etapa("financeiro.resumo"):
+            filtered_data = load_data(start_date, end_date, escritorios)
 
         if filtered_data.empty:
             st.warning("Não há dados para o período selecionado.")
+            metricas.finalizar()
+            st.stop()
         else:
-            # Adicionar uma coluna 'Mes_Ano' para facilitar o agrupamento por mês
-            filtered_data['Mes_Ano'] = filtered_data['DT_contrato'].dt.to_period('M')
-
-            # Agrupamento por forma de pagamento e mês
-            pagamentos_dinheiro = filtered_data[filtered_data['Pagamento'] == 'DINHEIRO'].groupby('Mes_Ano')['Valor'].sum().reset_index()
-            pagamentos_pix = filtered_data[filtered_data['Pagamento'] == 'PIX'].groupby('Mes_Ano')['Valor'].sum().reset_index()
-            pagamentos_cartao = filtered_data[filtered_data['Pagamento'] == 'CARTAO'].groupby('Mes_Ano')['Valor'].sum().reset_index()
-
-            # Total de pagamentos (independente da forma de pagamento)
-            total_pagamentos = filtered_data.groupby('Mes_Ano')['Valor'].sum().reset_index()
+            # Faturamento por mês com uma coluna por forma de pagamento e o 'Total' (em cache por período)
+            with metricas.etapa("financeiro.faturamento"):
+                pagamentos = resumos.faturamento_por_pagamento(start_date, end_date, escritorios)
 
         # Menu de navegação
         section = st.sidebar.selectbox("Selecione a Seção", ["Faturamento", "Análise de Dados", "Relatórios Financeiros"])
@@ -97,36 +72,32 @@ else:
             st.header("Faturamento")
             st.write("Visualize e analise os dados de todos os clientes cadastrados.")
             
-            # Exibição da Tabela de Dados
-            st.dataframe(filtered_data)
-
-            # Gráfico de Faturamento ao longo do tempo com 3 linhas
-            if 'DT_contrato' in data.columns and 'Valor' in data.columns:
-                fig = px.line()
-
-                # Adicionar os três tipos de pagamentos no gráfico
-                fig.add_scatter(x=pagamentos_dinheiro['Mes_Ano'].astype(str), y=pagamentos_dinheiro['Valor'], mode='lines', name='Dinheiro')
-                fig.add_scatter(x=pagamentos_pix['Mes_Ano'].astype(str), y=pagamentos_pix['Valor'], mode='lines', name='Pix')
-                fig.add_scatter(x=pagamentos_cartao['Mes_Ano'].astype(str), y=pagamentos_cartao['Valor'], mode='lines', name='Cartão')
-
-                # Adicionar o total de todos os pagamentos
-                fig.add_scatter(x=total_pagamentos['Mes_Ano'].astype(str), y=total_pagamentos['Valor'], mode='lines', name='Total')
-
-                # Personalizar layout em português com as datas no formato DD/MM/YYYY
-                fig.update_layout(
-                    title=f'Faturamento de {start_date.strftime("%d/%m/%Y")} até {end_date.strftime("%d/%m/%Y")} (Por Tipo de Pagamento)',
-                    xaxis_title='Mês/Ano',
-                    yaxis_title='Valor (R$)',
-                    legend_title_text='Forma de Pagamento'
-                )
-
-                # Formatar as datas no eixo X como DD/MM/YYYY
-                fig.update_xaxes(tickformat="%d/%m/%Y")
+            # Exibição do resumo mensal do período
+            with metricas.etapa("financeiro.tabela"):
+                st.dataframe(formatacao.formatar_tabela(filtered_data))
+
+            # Gráfico de Faturamento ao longo do tempo: uma linha por forma de pagamento e o total
+            if not pagamentos.empty:
+                with metricas.etapa("financeiro.grafico_faturamento"):
+                    nomes = {coluna: NOMES_PAGAMENTO.get(coluna, coluna.title() or 'Não informado') for coluna in pagamentos.columns}
+                    fig = px.line(pagamentos.rename(columns=nomes), x=pagamentos.index, y=list(nomes.values()))
+
+                    # Personalizar layout em português com as datas no formato DD/MM/YYYY
+                    fig.update_layout(
+                        title=f'Faturamento de {start_date.strftime("%d/%m/%Y")} até {end_date.strftime("%d/%m/%Y")} (Por Tipo de Pagamento)',
+                        xaxis_title='Mês/Ano',
+                        yaxis_title='Valor (R$)',
+                        legend_title_text='Forma de Pagamento'
+                    )
+
+                    # Formatar as datas no eixo X como DD/MM/YYYY
+                    fig.update_xaxes(tickformat="%d/%m/%Y")
 
                 # Exibir o gráfico
-                st.plotly_chart(fig)
+                with metricas.etapa("financeiro.exibir_grafico"):
+                    st.plotly_chart(fig)
             else:
-                st.error("Colunas 'DT_contrato' ou 'Valor' estão ausentes.")
+                st.error("Não há faturamento no período selecionado.")
 
         # Seção de Análise de Dados
         elif section == "Análise de Dados" and 'Valor' in filtered_data.columns:
@@ -141,38 +112,42 @@ else:
                 
                 # Subtrair o prejuízo do total
                 receita_total = filtered_data['Valor'].sum() - prejuizo
-                receita_media = filtered_data['Valor'].mean()
+                receita_media = filtered_data['Valor'].sum() / filtered_data['quantidade'].sum()
                 
-                if filtered_data['Valor'].iloc[0] != 0:  # Evitar divisão por zero
-                    crescimento = (filtered_data['Valor'].iloc[-1] - filtered_data['Valor'].iloc[0]) / filtered_data['Valor'].iloc[0] * 100
+                # Crescimento entre o primeiro e o último mês do período
+                total_mensal = pagamentos['Total']
+                if total_mensal.iloc[0] != 0:  # Evitar divisão por zero
+                    crescimento = (total_mensal.iloc[-1] - total_mensal.iloc[0]) / total_mensal.iloc[0] * 100
                 else:
                     crescimento = 0
 
-                st.metric(label="Receita Total", value=f"R$ {receita_total:,.2f}")
-                st.metric(label="Receita Média por Transação", value=f"R$ {receita_media:,.2f}")
+                st.metric(label="Receita Total", value=formatacao.formatar_moeda(receita_total))
+                st.metric(label="Receita Média por Transação", value=formatacao.formatar_moeda(receita_media))
                 st.metric(label="Crescimento", value=f"{crescimento:.2f}%")
-                st.metric(label="Prejuízo Total (Negado)", value=f"R$ {prejuizo:,.2f}")
+                st.metric(label="Prejuízo Total (Negado)", value=formatacao.formatar_moeda(prejuizo))
 
                 # Gráfico de Status (DEFERIDO vs NEGADO)
                 status_data = filtered_data[filtered_data['Status'].isin(['DEFERIDO', 'NEGADO'])]  # Filtra os status relevantes
                 
                 # Definir as cores para cada status
-                fig_status = px.bar(
-                    status_data, 
-                    x='Status', 
-                    y='Valor', 
-                    color='Status', 
-                    title='Valores por Status (DEFERIDO e NEGADO)',
-                    color_discrete_map={
-                        'DEFERIDO': 'green',  # Deferido será verde
-                        'NEGADO': 'red'       # Negado será vermelho
-                    }
-                )
-
-                st.plotly_chart(fig_status)
+                with metricas.etapa("financeiro.grafico_status"):
+                    fig_status = px.bar(
+                        status_data, 
+                        x='Status', 
+                        y='Valor', 
+                        color='Status', 
+                        title='Valores por Status (DEFERIDO e NEGADO)',
+                        color_discrete_map={
+                            'DEFERIDO': 'green',  # Deferido será verde
+                            'NEGADO': 'red'       # Negado será vermelho
+                        }
+                    )
+
+                with metricas.etapa("financeiro.exibir_grafico"):
+                    st.plotly_chart(fig_status)
 
             else:
-                st.error("A coluna 'Status' está ausente no arquivo CSV.")
+                st.error("A coluna 'Status' está ausente nos dados.")
 
         # Seção de Relatórios Financeiros
         elif section == "Relatórios Financeiros" and 'Valor' in filtered_data.columns:
@@ -180,48 +155,90 @@ else:
             st.write("Gere e exporte relatórios financeiros resumidos.")
             
             # Distribuição de Receita por Tipo de Processo
-            resumo = filtered_data.groupby('Tipo_de_Processo').agg({'Valor': 'sum'}).reset_index()
+            with metricas.etapa("financeiro.agrupar_tipo"):
+                resumo = filtered_data.groupby('Tipo_de_Processo').agg({'Valor': 'sum'}).reset_index()
             
             # Definindo cores personalizadas para cada tipo de processo
-            fig_bar = px.bar(
-                resumo, 
-                x='Tipo_de_Processo', 
-                y='Valor', 
-                title='Distribuição de Receita por Tipo de Processo',
-                color='Tipo_de_Processo',  # Colorir de acordo com o tipo de processo
-                color_discrete_map={
-                    'JARI': 'black',    # JARI será azul
-                    'CETRAN': 'yellow',
-                    'DEFESA PRÉVIA': 'green'    # CETRAN será vermelho
-                }
-            )
+            with metricas.etapa("financeiro.grafico_tipo"):
+                fig_bar = px.bar(
+                    resumo, 
+                    x='Tipo_de_Processo', 
+                    y='Valor', 
+                    title='Distribuição de Receita por Tipo de Processo',
+                    color='Tipo_de_Processo',  # Colorir de acordo com o tipo de processo
+                    color_discrete_map={
+                        'JARI': 'black',    # JARI será azul
+                        'CETRAN': 'yellow',
+                        'DEFESA PRÉVIA': 'green'    # CETRAN será vermelho
+                    }
+                )
             
-            st.plotly_chart(fig_bar)
-
-            # Exportação de Relatórios
-            if st.button('Exportar para Excel'):
-                resumo.to_excel('relatorio_financeiro.xlsx', index=False)
-                st.success('Relatório exportado com sucesso!')
-    else:
-        st.error("As colunas 'Valor', 'Pagamento' ou 'DT_contrato' estão ausentes no arquivo CSV.")
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+            with metricas.etapa("financeiro.exibir_grafico"):
+                st.plotly_chart(fig_bar)
+
+            # Exportação de Relatórios (gerada em segundo plano, com arquivo próprio para cada usuário)
+            st.subheader("Exportar relatório do período")
+            col1, col2 = st.columns(2)
+            conteudo = col1.radio("Conteúdo", list(exportacao.CONTEUDOS), format_func=exportacao.CONTEUDOS.get)
+            formato = col2.radio("Formato", list(exportacao.FORMATOS), format_func=lambda f: exportacao.FORMATOS[f][0])
+
+            if 'exportacoes' not in st.session_state:
+                st.session_state.exportacoes = []
+
+            if st.button('Exportar'):
+                st.session_state.exportacoes.append({
+                    'id': exportacao.enviar(conteudo, formato, start_date, end_date, escritorios),
+                    'rotulo': f"{exportacao.CONTEUDOS[conteudo]} de {start_date:%d/%m/%Y} a {end_date:%d/%m/%Y}",
+                    'arquivo': f"relatorio_{conteudo}_{start_date:%Y%m%d}_{end_date:%Y%m%d}.{formato}",
+                    'mime': exportacao.FORMATOS[formato][1]
+                })
+
+            # Acompanha as exportações em preparo, atualizando só a barra de progresso a cada segundo;
+            # quando alguma termina, a página inteira é refeita para mostrar o botão de download
+            def acompanhar_exportacoes(pendentes):
+                concluidas = False
+                for pedido in pendentes:
+                    estado = exportacao.consultar(pedido['id'])
+                    if estado['status'] == "pendente":
+                        st.progress(estado['progresso'], text=f"Exportando {pedido['rotulo']}...")
+                    else:
+                        concluidas = True
+                if concluidas:
+                    st.rerun()
+
+            # Exportações já terminadas: o arquivo é lido aqui, fora do acompanhamento periódico
+            pendentes = []
+            for pedido in st.session_state.exportacoes:
+                estado = exportacao.consultar(pedido['id'])
+                if estado['status'] == "concluido":
+                    with open(estado['caminho'], 'rb') as arquivo:
+                        st.download_button(
+                            label=f"Baixar {pedido['rotulo']}",
+                            data=arquivo.read(),
+                            file_name=pedido['arquivo'],
+                            mime=pedido['mime'],
+                            key=f"baixar_{pedido['id']}"
+                        )
+                elif estado['status'] == "pendente":
+                    pendentes.append(pedido)
+                elif estado['status'] == "erro":
+                    st.error(f"Falha ao exportar {pedido['rotulo']}: {estado['erro']}", icon="❌")
+                else:
+                    st.info(f"{pedido['rotulo']} expirou; exporte novamente.")
 
+            if pendentes:
+                with metricas.etapa("financeiro.acompanhar_exportacoes"):
+                    st.fragment(acompanhar_exportacoes, run_every=1)(pendentes)
 
+                if st.button("Limpar exportações"):
+                    for pedido in st.session_state.exportacoes:
+                        exportacao.descartar(pedido['id'])
+                    st.session_state.exportacoes = []
+                    st.rerun()
+    else:
+        st.error("Nenhum cliente com data de contrato cadastrada.")
 
+    # Tempos desta execução da página (painel só para administradores)
+    execucao = metricas.finalizar()
+    if autenticacao.eh_admin():
+        metricas.painel(execucao)
@@ -1,83 +1,27 @@
 import streamlit as st
-from fpdf import FPDF
-from datetime import datetime
-
-# Definindo o usuário e senha para a área restrita
-USERNAME = "admin"
-PASSWORD = "admin123"
-
-# Função para verificar login
-def check_login(username, password):
-    return username == USERNAME and password == PASSWORD
-
-# Página de login
-def login():
-    st.title("Área Restrita - Login")
-    st.text_input("Usuário", key="username")
-    st.text_input("Senha", type="password", key="password")
-    if st.button("Entrar"):
-        if check_login(st.session_state.username, st.session_state.password):
-            st.session_state.logged_in = True
-            st.success("Login realizado com sucesso!", icon="✅")
-        else:
-            st.error("Usuário ou senha incorretos", icon="❌")
+from datetime import date
+
+import aplicacao
+import armazenamento
+import autenticacao
+import documentos
+import metricas
+import particoes
+import renderizacao
 
 st.set_page_config(
     page_title="Gerador de Documentos",
     page_icon="🧾"
 )
+aplicacao.preparar()
+metricas.iniciar("gerar")
 
-# Função para gerar um PDF de recibo com papel timbrado
-def gerar_recibo(nome, valor, data):
-    pdf = FPDF()
-    pdf.add_page()
-    
-    # Adiciona a imagem de fundo (papel timbrado)
-    pdf.image("timbrado.jpg", x=0, y=0, w=210, h=297)
-   
-    # Conteúdo do recibo
-    pdf.set_font("Arial", size=12)
-    pdf.ln(20)
-    pdf.cell(200, 30, txt="Recibo de Pagamento", ln=True, align='C')
-    pdf.ln(20)
-    pdf.cell(200, 20, txt=f"Recebi de {nome}", ln=True)
-    pdf.cell(200, 20, txt=f"A quantia de: R$ {valor}", ln=True)
-    pdf.cell(200, 20, txt=f"Em: {data}", ln=True)
-    
-    return pdf.output(dest='S').encode('latin1')
-
-# Função para gerar um PDF de contrato de serviço com papel timbrado
-def gerar_contrato(nome, servico, valor, data):
-    pdf = FPDF()
-    pdf.add_page()
-    
-    # Adiciona a imagem de fundo (papel timbrado)
-    pdf.image("timbrado.jpg", x=0, y=0, w=210, h=297)
-
-    # Conteúdo do contrato
-    pdf.set_font("Arial", size=14)
-    pdf.ln(20)
-    pdf.cell(200, 30, txt="Contrato de Prestação de Serviços", ln=True, align='C')
-    pdf.ln(12)
-    pdf.cell(200, 12, txt=f"Contratante: {nome}", ln=True)
-    
-    # Use multi_cell para o campo 'Serviço' para que o texto quebre de acordo com a largura
-    pdf.multi_cell(200, 12, txt=f"Serviço: {servico}", align='L')
-    
-    pdf.cell(200, 12, txt=f"Valor: R$ {valor}", ln=True)
-    pdf.cell(200, 12, txt=f"Data: {data}", ln=True)
-    pdf.cell(200, 50, txt="Assinatura", ln=True, align='C')
-
-    return pdf.output(dest='S').encode('latin1')
-
-# Verifica se o usuário está logado
-if "logged_in" not in st.session_state:
-    st.session_state.logged_in = False
-
-if not st.session_state.logged_in:
-    login()
+# Verifica se o usuário está logado (login compartilhado por todas as páginas)
+if not autenticacao.usuario_logado():
+    autenticacao.tela_login()
 else:
-    # Interface do usuário para gerar documentos
+    # Interface do usuário para gerar documentos (clientes do escritório escolhido)
+    particoes.seletor()
     st.title("Gerar Documentos 🧾")
 
     nome = st.text_input("Nome")
@@ -87,24 +31,102 @@ else:
 
     data_formatada = data.strftime("%d/%m/%Y")
 
-# Botão para gerar o recibo com papel timbrado
-if st.button("Gerar Recibo"):
-    pdf_bytes = gerar_recibo(nome, valor, data_formatada)
-    st.download_button(
-        label="Baixar Recibo",
-        data=pdf_bytes,
-        file_name=f"recibo_{nome}.pdf",  # Nome personalizado com o nome do cliente
-        mime="application/pdf"
+    # Os PDFs são gerados em segundo plano; a página só acompanha os trabalhos enviados
+    if 'trabalhos' not in st.session_state:
+        st.session_state.trabalhos = []
+
+    # Botão para gerar o recibo com papel timbrado
+    if st.button("Gerar Recibo"):
+        st.session_state.trabalhos.append({
+            'id': renderizacao.enviar_recibo(nome, valor, data_formatada),
+            'rotulo': f"Recibo - {nome}",
+            'arquivo': f"recibo_{nome}.pdf",  # Nome personalizado com o nome do cliente
+            'mime': "application/pdf"
+        })
+
+    # Botão para gerar o contrato de serviço com papel timbrado
+    if st.button("Gerar Contrato de Serviço"):
+        st.session_state.trabalhos.append({
+            'id': renderizacao.enviar_contrato(nome, servico, valor, data_formatada),
+            'rotulo': f"Contrato de Serviço - {nome}",
+            'arquivo': f"contrato_servico_{nome}.pdf",  # Nome personalizado com o nome do cliente
+            'mime': "application/pdf"
+        })
+
+    # Geração em lote: recibos e/ou contratos de vários clientes cadastrados de uma vez
+    st.divider()
+    st.subheader("Gerar em lote")
+
+    hoje = date.today()
+    col1, col2 = st.columns(2)
+    contrato_de = col1.date_input("Contratos de", value=hoje.replace(day=1), format='DD/MM/YYYY')
+    contrato_ate = col2.date_input("Até", value=hoje, min_value=contrato_de, format='DD/MM/YYYY')
+    with metricas.etapa("gerar.carregar_periodo"):
+        clientes_periodo = armazenamento.carregar_clientes(contrato_de=contrato_de, contrato_ate=contrato_ate)
+
+    ids_lote = st.multiselect(
+        f"Clientes ({len(clientes_periodo)} com contrato no período)",
+        clientes_periodo.index.tolist(),
+        default=clientes_periodo.index.tolist(),
+        format_func=lambda i: f"{clientes_periodo.at[i, 'Nome']} (#{i})"
     )
-
-# Botão para gerar o contrato de serviço com papel timbrado
-if st.button("Gerar Contrato de Serviço"):
-    pdf_bytes = gerar_contrato(nome, servico, valor, data_formatada)
-    st.download_button(
-        label="Baixar Contrato de Serviço",
-        data=pdf_bytes,
-        file_name=f"contrato_servico_{nome}.pdf",  # Nome personalizado com o nome do cliente
-        mime="application/pdf"
+    tipos_lote = st.multiselect(
+        "Documentos", list(documentos.TIPOS_DOCUMENTO), default=["recibo"],
+        format_func=documentos.TIPOS_DOCUMENTO.get
+    )
+    formato_lote = st.radio(
+        "Formato", ["zip", "pdf"], horizontal=True,
+        format_func={"zip": "ZIP (um PDF por documento)", "pdf": "PDF único"}.get
     )
 
-
+    if st.button("Gerar lote", disabled=not (ids_lote and tipos_lote)):
+        st.session_state.trabalhos.append({
+            'id': renderizacao.enviar_lote(clientes_periodo.loc[ids_lote], tipos_lote, formato_lote),
+            'rotulo': f"Lote de {len(ids_lote)} cliente(s)",
+            'arquivo': f"documentos_{contrato_de:%Y%m%d}_{contrato_ate:%Y%m%d}.{formato_lote}",
+            'mime': "application/zip" if formato_lote == "zip" else "application/pdf"
+        })
+
+    # Acompanha os documentos enviados; enquanto houver algum em preparo, atualiza a cada segundo
+    def acompanhar_trabalhos():
+        pendentes = False
+        for trabalho in st.session_state.trabalhos:
+            estado = renderizacao.consultar(trabalho['id'])
+            if estado['status'] == "concluido":
+                st.download_button(
+                    label=f"Baixar {trabalho['rotulo']}",
+                    data=estado['resultado'],
+                    file_name=trabalho['arquivo'],
+                    mime=trabalho['mime'],
+                    key=f"baixar_{trabalho['id']}"
+                )
+            elif estado['status'] == "pendente":
+                pendentes = True
+                st.progress(estado['progresso'], text=f"Gerando {trabalho['rotulo']}...")
+            elif estado['status'] == "erro":
+                st.error(f"Falha ao gerar {trabalho['rotulo']}: {estado['erro']}", icon="❌")
+            else:
+                st.info(f"{trabalho['rotulo']} expirou; gere novamente.")
+        if not pendentes and st.session_state.get('acompanhando_trabalhos'):
+            # Tudo pronto: volta a renderizar a página sem o intervalo de atualização
+            st.session_state.acompanhando_trabalhos = False
+            st.rerun()
+
+    if st.session_state.trabalhos:
+        st.divider()
+        st.subheader("Documentos gerados")
+        pendentes = any(renderizacao.consultar(t['id'])['status'] == "pendente" for t in st.session_state.trabalhos)
+        st.session_state.acompanhando_trabalhos = pendentes
+        with metricas.etapa("gerar.acompanhar"):
+            st.fragment(acompanhar_trabalhos, run_every=1 if pendentes else None)()
+
+        if st.button("Limpar lista"):
+            for trabalho in st.session_state.trabalhos:
+                renderizacao.descartar(trabalho['id'])
+            st.session_state.trabalhos = []
+            st.rerun()
+
+    # Tempos desta execução da página (painel só para administradores)
+    execucao = metricas.finalizar()
+    if autenticacao.eh_admin():
+        metricas.painel(execucao)
@@ -1,5 +1,7 @@
 import streamlit as st
-from PIL import Image
+
+import aplicacao
+import recursos
 
 # Configurações da página
 st.set_page_config(
@@ -7,10 +9,12 @@ st.set_page_config(
     page_icon="🏚",
     layout="centered"
 )
+# Deixa o servidor pronto (agendador dos alertas etc.) sem atrasar a página inicial
+aplicacao.preparar_em_segundo_plano()
 
 # Cabeçalho
 st.title("Página Inicial")
-st.image("istacio.jpeg", use_column_width=True)
+st.markdown(recursos.html_imagem(recursos.imagem("istacio.jpeg"), "Istacio"), unsafe_allow_html=True)
 
 # Introdução
 st.subheader("Seja muito bem-vindo! Aqui na página inicial você pode conferir muitas dicas e informações:")
@@ -18,7 +22,7 @@ st.subheader("Seja muito bem-vindo! Aqui na página inicial você pode conferir
 # Informação destaque
 col1, col2 = st.columns([2, 1])
 with col1:
-    st.image("data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMTEhUSEhIWFhUXGBcYFxgYGBUaIBgYGBgXGBgYFxgYHiggGBolHRcXITEhJSkrLi4uFx8zODMtNygtLisBCgoKDg0OGxAQGy0lICUtLSstLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0vLS0tLS0tLS0tLf/AABEIALcBFAMBIgACEQEDEQH/xAAcAAABBQEBAQAAAAAAAAAAAAAEAAMFBgcCAQj/xABIEAABAwIEAwUFBQUFBQkBAAABAgMRAAQFEiExBkFREyJhcYEHMpGhsRRCUsHRI2JygvAzosLS4WOSsrPxFRYkJUNTVHOTF//EABoBAAMBAQEBAAAAAAAAAAAAAAECAwQABQb/xAAtEQACAgIBAwMDAwQDAAAAAAAAAQIRAyESBDFBEyJRBWGBMnGhFJHR8BVCwf/aAAwDAQACEQMRAD8AqrrwOw0phx1PWvJASainpmoJ7EsJcczbUyF+EmmTIolpUaRvVDjhCFHWKeTpXOY7U4EmhVnNDajPLWk5Ogr2QK5fBijxVAoLbaETTStTrTVsoxvSKiaCi13OSYKHu9TyUzvXjTAzV2JnSiMeKYjWvFoP3aPdTKKBdkCJosA0vMIorsSR4UyymdDRHbKSYG1LyFsHVaxsNacYZ8Kkk3CQO8NajFOanKalCfJsEZfI2MxVEUYbckQaFQ0oKCiak75wKQI0NM8qUqO5bIJxghVGQSIBiuS4Fc4IptIUTNO0wsHuZgI+NEtrQ2MsUza6uKPQU64ynLJ3nSjWgjLTU5lDSi7J4nQ0yBCY60K4Skg0HtgfckL9IOqRBG/jQiVQfA15nKtaFQ+SqKZPwFEmyiBKvSibpP0Fd3LX9mI3oW+d7xAG2lF/AxHKezKynYUTlOw260ylrWSIFJDwJgbTXUcH3VxkSEiTUdc3JVE6RUlbJC3DO1N4rYDMAnnXTQoBmPhSopdmkaQTSqWjuJaXU2u4V/eqFdAKu4NK9cwlY6fOibK3KRqKq68FI47Y2pk9KbVbxqaPdTOtKAd6Uq8aG20ga14tMbU+SBQrq+ldYkoKhtbQjxptyIia9yGm+y60yI0ctpA513oDrRjmGwyHKinHJ0rnZ3cfdMEQKZbXTk6j+uVCuXMUAh5d0ihHNN6ctn82leYiMo3oUA8t1aKNcWVzC5VXdgkFJAobszMVzWgMmboojMaj03aBpFC3FwYy9KtPAnCSb1CnvtbLbiFlKGXADJypKXD3piSdMpkp8xU4YrFSJbhf2a3V2jt3Fi3bVBQFpKlLTvmygjKk8pMnpETKY97J7hDYXbupeUJzIjs5HLJJIKvAkedaRwu1cotkJu3UuvJKgVpmFAKOXcCTGkxrE1I296hYJQoKAJSSkgwpJhSTGxBEEVf0YiOaR8rYgtSFFtSChaTCkqBBSRyIOopF1WUAbmti9t+DMm3TehIDyVobKh99CpgK6wdj51izKznFDjWisdhjNvlSTzrlpBX3TTj666sEmdRQ4/IaG12BSQZJFEoaChqNqYu7wpOm1DrvVSOVQcm3SEdnl0hTasqdjQtvaftB41JXJkA7mmrRPek6RV467jr7kli5UkJCVRpULchSYGYkmpTEnNZPSoy2SVKk127D5HUlQTBGnOuWbcDUbUU8nMAkb00tJSYNFPYR9teUA9TRl2sKGg8jQLhgBJ23ou3xJBbUlKZIiPGj3sVoCW9rvSrlxyTJFKk4jUWdx/U6yJoculRAA1octq0I1zGAB+lTWD4YtD7fatqSCdJBFWULdB9TjsFcw94DMWzFB9pyitmThodGQQJG8bCobEvZk3BUy8rPvCgIPhptTzw8dWTx9YpmZSeleZfCiL5pTSy2sQpJgiuJkVBo1878Aq1Chbl2KNU2DNRFzoaZGeaaJR29WGMpSYOxqLY6mrpeWf8A5cFFPLeKpFuCSAKMkyd2glS52oFxvmaIXcoCss6jnSVbrUpKEpKlKICQNySYAHxpGqGBEOQoHpUtiti4EpUptSQeakqH1FavhfCScLtg+Gku3pGqld5Lc8kDw2nc+WlVTirGMQW3L6yQTtlTHyqkcTcbFcldFKw0QTSaX3zTjfv5gmAd+k+FMLGVw686jJaoLPbq3USTl0gn0G5qTwzhd162DojIpSon7wTpIHMTmH8tah7OMAXbJVeXOVGdAS0lRyqCSZUozsVQmBvEzvVpesmXxLZAUOW3lKeQPX60ccGlYimk6ZinD+D4g04VtPuMIG6wo6gRpkOivUVaMR4lureLtlHaqJQlzQJ7ZI1lYQAM4SCM8aachBsGIOJRorkYINQuJ3qQ0uFpbBSoAnYKUDH6+lHm7NShGiX4nc/7awgrsYK0rQtbUjMCkElvTTP3gR1iOdYeRkAJGoPPTzB6GrFwbxPcYeALfLlJzLSpIPaabLV73lB0prjPFhdvLuOxS0VQSlBJBVGqiTuo89KLaZGKS7DFu2FtZo1Jo1CQETGwNQeDYl3g2dhVitrVawoISTvQSt2FlWfUSTpzpxtrQTR15YLa94RQaF5leVB43GVNCqnse7M8hTrMkg07mI2EiuG34O1LF8pWHuC445DgR1Aoe2zgkBPlUpdtgvJUeld4g6hPnTyDYO0yQJJkmuFgk6/CnG3Ae8DEcqEQ9Ls8qWByYziGZRKU+VSGH2IQj97euCxlXPrRLDuYkClyvVI6yPduNTpSp68WAqMk0qmo6DxZdLLCbhhaH8mca5UjfXnVjTxA66kIeti2oHQmPyqUxNtba0pYQpScvnr5mpXh5hXZrVcJiVaAxJEDT612L6thlCPpPlJv9Pn7v8GeVSbsq3FGKXbKWfsyshV7yiAdPWg7L2iXbRHbhDqeYSIV+lWnisoUkoXokiEGPdPKszt+H3z3l6pnTLrm+FejnnPkpfJ3TxxcKZOcaqtLgfaWnFJcMS2U7/oarBaIFG3aCnurQpJ5ZgR9aSVZoSBJOgA1JnkBWac7fYtGaj2JLiJNolDZtWllATDjipGZfqd/LTUCqm+plQJyHMOWtavw9wQ441kuUZWgc6UKOpVyzAbAdDRdh7P0oX+3bZUjX3MwMcpBFdGPg0/1LUdxX5RQzxG4/aptkWilSIGUEk+QrzDuFy0kruGlN5k91JIJ9QNq2m1tW2wEtISlI0AAAgVAcbYIu4bltULTsOo6VfhfkzrrIv28Ir8GNcUYe06tCm8rYA7wA3jnT+DXDbS0PIMqalSdfvAaVc+FuG3Wnw++ElSfdTEitAvbRi4bKHWUGR+EfEHlQeGa2w/1GONpKz56uPaRiCyrOuZM6piPCnbe7L6VLuXFwBmIB38vGp3jfg1dpBkFozEAEgeNVRiyt3JA7sdCQPWpTyNaHx449w29xFh1KOxaWkaBMneOZHMmrdwfw4WnE3DjSXXlx2LatQhWkLUNlK3PRMT5QvAuA9st1SFA9kG0oJBUM7qykaA8gFVoVyyWLdffJdedRbIVGXKnQuga6bLR/LRWSF0+5GWtIk7V5RcJbAfd2U+skpSeaWU/hHXSfGpAWD+YLVcAq5AoTA8JEHKf0O9O2yEttpCBAAEU8h4n/pV3ghfKt/P+9jDLLKX7GYe1e5et3WXSkBLgUFQZBWmNj4pI3HI1Rry4W/BmABoOnU+dbnxlgiLu1U06P3m1RqhY2Pzg9QSKwi3VlJTEQYPmNDWXqU4+5GmE240R+dQOWK5vVdzWjrh0E6Cgr5GkczQg7Vl0A4ex3ga0TDL9TaAlGp8qp9hZKWpDaNyavq7ctNANpGfaT1pMmSUP0rbNXT4Y5G3J0kVjG71KlqSuQuoZlgpEV1jpU2pZdTmWrUK6Gn7VClICucVSeo23szZJfHYftydidKDUJdOWYoly1KRmKqZBypJ50MSSWhIofUjOdeVC3rQHOaYZu1GQN5o62sXFCEpK1HkkEn0ArndjUCqehGopmzQYzCpN/hO/UNLK5j/6Xf8ALRtpw5dhMC1e9W1iPOQKZ6QSIcdJ3ph50IAjc1aWOErsgg26vUoH1VXK+ALxR/sgB4uN/wCaloKoibZsqSCaVWBvge8AiED+cUqm8cwWbRa4W6EgKGo8RXDlm8Fap7o2Mj86nPtf7p+Ve/ah0NQ6T6Xi6XO8+NO3f7bJSeOUeNlP4gbX2apbII1BI0MfKonAcJumH0utkKZdAK0qgZFfuj+tqvz3+zUEnmFJKkkc5TI18QR4zVf4nwh9xkrt7js3UbJbEIWOikqkpPQg+YNaOujnycZYaTXz2aBCEF5BMSumLhamFZStJ93SRXuGGys8ziwkvJBVAAJQPM6AnrWUW+OONvK7dGR1JOp39TTloh69XoF5HVhKlAaKjcTz6eZrS5qdJ9/4Hjj4K0b/AIJiablhD6EqSlYlIWADHWATUbiXEbAeNt2gDgAJHnrE9akcCbKbdtJSU5UhMERGXQaelYJx7aP21yovZZcUpaSDMyflvXR0+1hlUlTdWbLaYmgyc4geIpM4q26opQrUVlXCuBPvtpd7WEqHLerAcKNqQ7mWpQ57z4RWtRb3VGWUILV7LutklQCdzyqQTh7eiHCCpQPdmJAiY5mJHxoPhkrWjtXBl6D6+g+s1n2A4q7f8QreUFoZs0OoQlQKYBGUqIOxUTm8gmoZMjlqJbHiUVcu5fb/AAjD0qIeQgmPdWVK0/hJIoZtGFo0RbsjyZT+lVC6xjtXnXORWQnyTpTSr7xqseljWxJZ3eiR41tEP9j9kZUkIzZuybKdTlA93mBm36mmsYZ7GzswvNDbiVL3kSSpRPjqaewnidphBS7nkqJGUSIgDed96bxfjvD3WXmO2KVKbWgS25uUkDUJjmOdfLfUOr6qHVwhDC+EJ3e9r/WaIRjPG23tonMNvwvM0dFIj+ZJ2UP65VJNKKTKTH9eNU9kwtpwHRaAJMbEBQ28qtdouQK+xnE8taZ1iV0rsVyCohKiB1MGBprvp61QMUwawQYuLYtLInMlxQzST3gNYkg6Vo7qBGb8OunONaxP2icVIuVsPMtqyIC0KDgAC5KSBCSYjvb9a8jqJ5f6mGOMfZTt/D8G3A1xbb2Ff93cOLicly4BuQFIVp5nnXPEnA6Y7a1uA4Ins3ISqP3VDRR8NKqTV1bumMi2jBPdVmEjwNdWtwARDx120MHpI5VZY/grz+w/hjvZPJKjkjQk8vCjcUxRGVRFwFESQAedQ2KOlwkLieR6+BqqOtwSOhqOTC3JO2a+n6lQg1xTvy/Adc3bjqv2ipFWKxfSmBmEedVHIa8JppwUlRnkrLhe3AUqAoQPGmFnOYFVxCtIk1pns34YbQ0rFMRUEWrerYVP7VQMTHNE6AD3j4aKKilGkciX4I9maniHrmUNaEJGinPMn3EeO55da2DDMObt0ZWG2mkjpJmOalaE+tYZjPtMvsQuEWuHgsIcWEIiO0VOmZS9ezEanLqADJNX1xNwpbOC2lwsKabSu+u5KloCtQlClTDrhkydhFckE0MOq5pBHVJn5GPkTXSVpVtr9R58xQ9rY9mAkOLVAAlas5PiVHvE+seFLtklRkd5Ok9dEmNP4hp+lGjm6GLvDp1QqD0Jj5jX4zUOh9tQJXchspUpKkuOwQpOhHiPGp19Zgms3v73LdPp55x80IP1JrRjg5GZ5VZaFOW//wA1PopR+YNe1Vv+1R+I0qr6X3B6n2INGPPf++9/+jn+aiWuIX+Vw76qUfqTVVS7TqHarSEouTPE1yNn1H0QfqmalLLi96e/lWPKD8R+lUJt6jEPzrz5/rQ4L4FolePuH2r5v7Wyk9q3BWkbqSNSCOfh6+hXC5dVaoyIyRBSdoO8/Gq1ecUu2bjLoSFtFWV1PMpPTlPMeNajYXLYQCgBSFAKQeqT+YrPPGlK0rHU2o0T99irTTQcdWEpMamsj40btcQuM4udhlTEfL5VPe0rtXUMsttlXNRA0GlUS04fWShKUKzyI0M5pEfOoTxycPa+LN+JY7udPXY0vhLD/s9shonNlnX151MXI021MBI6k7U3aLLSENuEFyAD4moTiLiRq0uEduVlaYUEIAgA81TWn3KFd3R59J5G/BoFs1lSlHQAfCqvxFlZN5cAAKLLaSep7+/pl+AoDAPaHbvPFCUvZlydQmAEjwNe+1W6CbMxu4pM/DnWfHF8kmaMjTjozi2ehCep1PrrTofqO7TYeFdJcr00YmTjHC7l8gqQ4lOUlPezcwDyoJ72TXX3XmD5lwfRJp/DuJHbVBDQQcypOcKOw5QoVyfatcpOrDCvLtB/iNfI/Uf+YXUS9Djw8XXwb8Hp8FyOUcO4swEpbSi4RmBCAswk7ylboSEiehPlWj2CiPe0I3B5Hp0qlWftZbS0kOWrpdOYwgoyRmMQpSgdo5VCq4y+1vqX2JZ0SMpXnncZthB20+dX+ndb9R5yj1WNcV5+/wDcGTpsc64vZri8UYSO86nxgz8cs1nF5wY0ygNOL7VKipaTlKcoMCIkztvpvTyH5G3wp65uVuJGZU5U5U7COk6a1ueXI88Gn7d8l861/IX0vGD49yjXfBampdZcCgkyERrl6TUKEtFtaR74MwdCPKtEwrCEIUVLcdWpQ7w7QBI8EhKUn1NBv8KtvvyntWhIkwFoUNNlE5kmOpO23XVzhehPSnWyl4QUFJ+0IX2atA6AYBEjQ7GD9KiMUtU5iUrBjRRHMcleE19IvptLO1zFKS20kDKgJUo+ETufHSsT4pxtVw6Hwy220JAaQBog6ErUACpXjtpoOvSSa0Txzk5O1RSzbjkqa6Tbbaieg3qXFihBIOVQIkbglJ2NE4TgqrhwNWzffUQNOUnryFJx8l+QdwNwy3cPKW8rJbMDtLlwnRKRrkB5rVHLYTziROP+MV4g8ENjs7VrusMjSABAWoD75H+6NOpJvHmKtsNJwizVLLKs1w4P/XuB7xMboQdAOo/dFQvDGDqedQhIlxxQSgHqoxJ6dfIUncfsjQvZZhTdja3GMXCZLaFIZHVR7pCfFRKUT4qrVfZ9gi7e2zv63Nwov3B/2i9cngEiEgeBqAucMQ7eWeFN629ihNzcfvLEhhCvEqzOEc60ag2ccrVAJoVlEDxOv9fOnn9oqPtLhS3VEEdkkFAjUqWCM5J6A92OoV4UYiTex+5HdPkayPHlxev/AMSP+WiteuR3T5GsY4kX/wCOf80f8tFa8HYzNe4G7U0qDDlKrWGiJSv+tKebXQIP9TTyZ6/OuAwxDtFMPxUWlfj9aJaWnqfh/rRBRIO5SMqgClXI9P1qX4AxINOKw5SpSZdtiTqNytqefNQ/mqASuRA8x+f9eFV/HrtbLzVw3opBCgqPvA6SR6aGln2s6KvR9FsLlIqu2N/2d0qSO6SQOulNK41QiybvktFxpwAkCJbUdFg+AVoap2K8ZhxLlw3brSANFRpPntXn9ZCU1Fx8NP8ABo6KSi5KXlV+QzCbovYg7dOuz2RJyyRlP3ZT5V63wwvFL55xy5UlJiCEp0AEACeQFRnDN+tNu89IJdjNKQZ8PCrPgV2GUNqAXn7ylRGUjlrvNVySlyOiopDzHsqeYV2ltfd8Axna3nkSlX5U3g1qbt9+xxIqLyQFBST0gEp5dDqKv/DmOtXCO4dRuDTpwJgXBuggB4gpUoaZh4jYnTepxyOwygmtFMe9lzZ925cI5e5P0imv/wCWJ/8Aluj+VH6VZMQxXsFEnadfCnLfiZs9DWistaZFOD7lSfwFNmlbWdLpALqe0LSSVHKkN/wkBW9QH2ZhR0No6EmJH2VRXn5kTKQ3v4xVjxzFgu5WpOsRA691MAeZn41lPFmHpbuHEj3ZCtvxAKMDpJNPDI4raTBLEm9MK4stUIuUoSG4SgCWwgJUdJUAjQTO1Qi0qQrO2NR8xzB8Kea7MKSglKcqZOYwJUSflpWj8IjD2kftHm3HViCAFFIQYJQJGsjeQKFKV2dycCktcYQoI7JQ84OwkxTrfEQVqk6edc8XYGhpwluFskyhUGR+4sESOk6z8qB4QYbReNqWgLbBOYHQEFKgJPnFZZ4OL0bIdQ5LZPNY/psT6URZY13tZEawdPrvViu8bw0hSVW6UmPupSfhrUQ9f4UBBYWo8iFFPxB0pOLD6gxjuLh5rswoCSDrO3PQbyNKq7mGlROVSYOmWTFS+Ov2bSoSh3PAPZ5k93NqnOo6JneNVa7ag1VP+9SZ7tv8XCfoBTxk0qEkuTslV8OuhrVSVFudpnIeXjHSpdoqwvDDdyU3V4clvMS2z990DkSNjyzJNSnsuYViDmcxkQYdSZIM+6AfH8jVP9rfEf2zEF5D+xY/YtAbQk95Q81T6AUOWjqKxhFn2ixOiRvWyeyPC0JcfvndGrZCoURsSklRE/hQD/vis9wCxCWgVESdT4TqAa1bFLAs4XaYY3IexB1KV9QhUOPKP8LYSmu7IHdlp9mVss27l66IdvXFPnqls6Mo8ggD41cK4ZaSlISkQlIAAHIAQBXZpRwDGbpTbDrqQCpKFFIOxUAcs+ExTGA2qm2UIX70ZlHqtZKlz/MTTXFd8hlgKWFFJcbBCBJISc5EdIRB8CafwdTi0l11ORS4IRM5ED3QTzUZJPnHKnXYnJbCLv3FeRrEOI1f+Of/AI0/8CRW33vuK8qwfiJ2Lx8/7Q/LT8q0YHok43IDQrSlTEdJ+H+tKq2U4kQlVOpdoPMPxfKug4PH5UyIMMC66S5QYfHT4mn2CpXuIzeQKv1phbJC2c1Hx9B1oS+Z7QEA7/dOx6eR8aPt8CvXNE2zsfwFI+cVYcD4AuVqBuIaRz1SpR8AEyB5n4GudVsXklsI9lGHr+wPtvCWlPHIlQn7oDmh5THqDVF43x65DjtmtQQhBjKlIAI3SesEEH1re02iWm0ttiEJEAf1uay72t8NFa2bpCZg9m5H4d0E+sj1FZ8sLhor02epu/I5e4aLbCLZZXLjupHgRIP0+NBW2LuJSlCxooQlSfoRUZhBW8yhlx7KNcpXMCD7tWV7heIWkSBGqDmHnAqH7lmP+z+6LV0kalRUBHIpPdM+PeraHlaVg796u1l5EZ0xlnTWdCfKtLseKkv27LojO6n3R+IaK9JoRg3IE51E9xvBE3QIcGZInTWNNyQN6qb3AyNfs7zjawCQEq00/dOlWS84rTbFOdMwSFQdgrw3rly9bcHaZgDqRrprW2PLszHWrRmD7N0FgEpcMgAwEqHISY1priCxUF55lUQFmCYGg5b+NWl69t5XmcSXAkhIBHvQY+dVvELsqShQgjLtIGoJB3HWunFWVhJ0UxuzUhyVBSkwpROhmATrO5P50yu8Qo5SCkDQA7wPdg8jVoUCR7vxioDiBkJyqjnrUJQ47RWMr7gJKkGfezGcqtRz97pvOnSpjha9bDhKgAgapzKknlCohKo8gdRUYoQ0pf72Uacon9asHBvDYfs7q47IuLbyhIAVMAHNlj7xJTvySaWK9yGk0o7Je6xK3V/6bZPWQPzqOt78hxJUgKQlQJTmBkAzlO+h2qp4lbqacKCTpqPc2O29ChxX9ZKMsnhoEYFuwS0auXEh9ZSHAXXFhMlS4znnuSTyqzYBwth5lKLV11Xu51yqAr75iEJI1MRIiqRwXZ3dxcptrRRCnNVE5SlKBupWhgCeXMitruPZq8hshq8zkjZbWkxyyOoA8M2aPGs6bRaXuRgTGJv2zikMXDjYHdUW1qSFwTqQDroedRIVrJmJ1jpWtcQ+xS4aVnYeS41AzFQIWDrMISIKQI5zvpT2Aez5topWp2VCDKW0aeRXm+lPGDl2FclHuNYdiNk842hu2SUBYStUd0AJKiBvmhKSSdBtvNaGy6m4x0rUpIRZW4QkEgftrjvKid4bygx4UXgOFjMlJW6oHkpQjkZyhIHLpVwYtwlISCYAjU6nxJ5mhNNPZ0GmtHaFg6gzSKuVelHn8TTDqEJSpRkaamVT4azNIOeXTxBShO6j8Ejc/l606aZtGj76veIGn4RyT+vjQFnjbZUW1d1QUoeB7x58qdL4Ev5JImgXMJZUSotJzEyTGpPU0fQ2I3yGEFxwwBt1J5ADma5OgKDk6QIcGa6H+7+lKqLiHGjxWcndTyGh+tKh66+T2I/Qurkk6PLf2aWKfeDqvNcf8IFSVvwPYJ2tkn+IqV9TVjCa7CK3cj5TkyMt8Dtke5btDyQn9KOQ2BsAPIRT2SlkochbOKQTTmWuwml5HAl68htta3FBKEgkk8gKzLGn37oG4UstW85ENcy2rRTqz+LmBtAqx44s3uIfYQYZt2w87++4f7NB6gAhUdT4U1iWEDsltJQoqOYlRKtiFbDbSQfSlk21SN/T41GnLyZzjGHFgNpzg+8lKRMkETn12EipzDUqQhKm1qQYEwTv4ihX2S7asXRTmLctrPgiQJHlB9aNeuQGFLCtkyNPCptFHrQDb43294008A4VZ0pkAAAIUcxA3MiBR/s/xFtllRfUErZW4BM6pUcwgc+lUhV7a5m3UFxm4bI1VqlUbx0nWmuIXVpIcghKxKDyM6kg89aZPirFa5aCuMcfbuny4c6SNBlVEDyqPw/Eynu9stSPwkkfMGq6sEnqa9aSQRypFkd2P6aqi4NdmSCJnfQ86NQffSNpzpHQHcfT41SheK/F9KnMJve4FEyUGD4pVqPz/wB2qrJyYnBolEx/RihcXYztkT4yR08qkMkjMmFJOx5/14UxcajLMTyjU+h286o1aoRPZX7tt0NoQUkk94EcxEbco29K0TgzHLqytAzb2qXQolRWS4IcIgg5QcwAgxpvVQZbVmJXr4DZIkmE9BV+4ZdUm2VlJEL5GNwmkhjvudknooGIcPXrrinXEKzKMmEKgcgAI0AFR17gTjQBclIO2ZJE+UjWtkOJrQTrm21JMweW9c4zgasRbbtzOtyjMfwtgLKyDy7s+pFNPCkmwQyttIJ9huBJt7Vd2sd5890kR+zSYSB5qzK8imtHViAABVudQBv4UziNulq27NtIQhtICQnQJSmBA6aVURdkmDt8fzrNGPLZaU3F0WNzESTmU5lA2AiTH09aBdXauLKQSFxmOoAAmNTtM1BhZOvyoRvGrxTvZOMZERJMgpMypJECFTt6a7U8Y09MVytdjQcOLCCEocBUYA1B+lSc1nVqTOhg8v8ArUg1iiktuNqWoSISoQSlXIidx4Uksb7jRyLsWMYmoPKSpvK0EyHCoSoyJ7m4Trv4V6u6TmUpS+6hIXl5xHvRuQPzrP0YZeIX2j1wOyns2+6CXGyCRlg9wQB8dqHeu1STmOuh13HTyruC8B5vyaGxxHbq2UqAQCSlUCepjSoLFnbRazkcKFTqQklKj6fUVVreSYGwBJ8BGpPhTTa6eMK2gOd9yzWmOi3nvZ2wJO4A+O1VtOPOYi+txIPZtA5EjWAdJ8TuZ8qrHG2KEAMJPvar/h5D1/KpPhXFGbSzAWqHLg5tc39mFREpBIJy/WoZZpzr+7Pd+ndO4Y/Wq3/1X/pesLNm22EqRmVuVFBMn1FeVG2GJW2SQsGddSr/AC17Xkv6RBu3N/x/g1Shyk2+f8/4JU8V2/IOK8kfqRSHFKD7rLh88o/M0QxhzPJA+tGs26BskV9J7T4jiDW98+5qm2gdVLj/AA0UEXB/9pP++r9Kkqp3HCHC4wQ3cOsALzotlhKu007NStRKd+elTUrY3AsItnubqR5I/U12LNfN5XolA/KlgqXAw0Hv7TInPJk5o1kjc+NHUrkwqKMaxNxbV9eKClZu0AkGCQEpgEpjSIrpTKnx35JIIBJJ3I6naARR+IWBexS9bTEp7JZJMABTaADPmDoKk7TD1NqCVAeEbH1illJH0HTcnjj27dvJDcP2Zbtrtj3kB5YTPRTTZ+Ik/Oqu/dMqZUEqggQU6cjrWicLthTLz33XLp3L4pRlakeqDWB8QNlm9eSNg4T6K1/OjLUUzzpe7LIttzjiSvszbNhCBK1q7wCR0EbnauvaZlLdpkQUS2VFue6iSO6nx60F2faoZaRqXnk9r4JRrB+tcXt0LxLwT77LhKZ1lkmDHiCJ9aeT1RJKmmVNtzKZ+NWLA7xlObtEhUxlJAIA56dar9+kJVGhrizUSoJSDJOgB3rPfgtQ7iYSpxRbEJnSpzhlgG3fEaqUiDGxQCfopVRaUuypORZKT3tEmKm8DvMtu8QNQtOihESAKfHXIWd8SStkZbRKhoorKUgc9TMeWnxoJPvFKfe++o6x4DqaMXfn7OhUAKOZKfDUyR/XOoz3e4ND94/lWrsRCUwNBJ8etcX/ABHdWqUotny2klRKYTqe7r3ga6Ajao3HinuZyRuBEfuzSZP0jQ77PVcdYjIP2sz/AAtf5a0z2Q8TPqzPXj4WFudk0FZUnupzuKQABnOqPKDWO/sfxr+FSGMXSkJsktKP7NsuIPPO48tU+fdR8Kzcn5ZXivCPqvEnkuMO5VAwhW3LQ1QAuVmpThnGc7EqSQXmxodChRBBSQehJHpQFmjVRMannVIxok3bPQa7U+ogJKiQNhJgenrTikJ6fCmy2Pu61wTlkwdRNePLmT1ro+NNqo2wUEM9q8lDKElWTMoeavPb/rQeI4K80My0d3YkGQD4/rtV/wCHrNLbIgDMffPj09NqEx2/Skho65tFD90zvSxbcqQZpRVszHERIU3mIClJBjnlWFwfCU/Knmz8a7xi2CHiIMp5k6GeYEaGPE86ZQedWoSzPMaQoXDqVEkhR1PMHVPyIrrEb/tFNgDKENobA/hTqfMkk+tXu8wxh7V1pKjtm1BjpmSQTTrXA9mpYGVxPilw/wCKaxz6Ocm6Z9B0/wBYxwglJO18ETh4JbSR0HKlV+tfZ2wEgJuLgDkJaPz7OlXLHWmWf1vBeuQ9whfOusOKdUlwB1aW3UoKA62IhaUknSSoSNDE1NoVQWFWammy2p514zopxLaYEAZQEJSIEdOdGhHl8RW1HyM2rCjcaUKF166ggTypgOUYxVaEbDG3SKJbeqIXcgaAZj0BEjxMnau7e8UTBbKfHMg+kAzSygOrRQMfeWjG3w0UhTjDB1jUCQYmveLcYd7RFraO9rcOmEpSJyAiMyj90CZnwqW4j4AF/el9VwptIbbQpKEjMYKyCFH3dyNuVWvhrhO1sUkW7YCiO8s95SvNR1rLOG9nrYOrjDGuK91fhAq8KTaWLFujUNJCZ6ndR9TJ9azjGcBS66teQGVEVrHEx/Zx61SmG5kyRKj+X+taIfoMUn72Z+/hDrCs7IM7FJEgjb6VX7tDyElLdsUzvlSdfM7keFbGtnwn40yqzRuUx6GuaTDbR8/v2TxJKm1yf3TTX2Zwa5VA+RFfQKsOQdo9R+dMO4S3zQD5Ck9JfI/qv4MGHagz3weutSWFvKyOBUmVIOs8grr6VshwdjaB6ioXirA2026loCZBEQNTvI+En0rljp3Z3qXqiuWTKRapfUZUSUtpn3YJlRHXp8aBZb5mvbNf7BKdDK1nyHdA+eY/CnspiANevSrrZN6G+ZHwqJ4pGjf83+GpZSAnnJqzcN4A28hRcEwdCesSr8qWatUGLp2ZJFWK5/tLdWpy27IAAmVGYEc9zpWong5jk2moO3w1CcWQjKMqUtJA8wAP7vaVB4qKepZL8AYopbS0qMracI6aK7yfzq2FKhy5VQ8IeDeJPpHuvJzAfvIMH6KPrV6ZxFwJEwtPQwfkrb0qi0ib7nhUedcFUxT/ANuZV76CnxSSPkqQfQiuhboJGR1MmdFgpPx1Tz60bOoGKjz1pZgO/vGsdY1iKefs1o1UkgcjyPkRoai8duext3nfwIUoeYEj50roZWSeC8coQ79nUttWUnMlJGZMnUxOscxXN5d9q8tQ1zK7vlsPlFfODFwtCw6lRzhWYHfvTOvX862/hfFu2Qh0pAURqBAhQG3djnR6eS5C5ouib4stCA2vn7p+o/OoBBqzYk6HWVwDKQFaqJ233PQ1Ue3q8lsjHsGg1OW6+/61VzcEc6Jt8TWFbg+lGL2F9jVLBcoFKqrZY84EAQn4H9aVSljbZOmOm9SNyB/L/pQ73ErCPedj+Vf5JpUqu2TirA18a2c/2xJ/gc/MU6jidlfuocX5BI/4lCvKVctj8UPtYprKbVzXmSz/AJzRjeJO8rYD+JxI+iTXlKn4Jis7tr+4Dildm2AUpTGdSvdKjOw/FRK8TuTIBbHklR+qqVKg8UPgHNrsC3zj7qSVud3okJH1BPzqK7AJICSd+ZJ5HxpUqjkSSpF4PYR2KhzEU0t0Awd6VKoWXPOzB1iuQ1rsPhXtKjZxwpAkGI+FVzjxxQbbSJ72fSR+GB9aVKmhtgZR7VsA5FHUSY89fqaIWnkDHWKVKqR7CvuMJb7wgeXieprUMItQyylBjT3jrqTv+npXlKlkELCR91QHoT9ahcNbbVf3JWBmQlghUHQISrNl6H9sn4UqVJe0HwVHiCLXE2YJPfQFzyzylQ037q58z4VojC9I6E/r+deUqHlh8IdmdxTKmRIO3lp8tjXtKiAft711v3FmOm3xGxqt8fYqtds+js0pT2QKiAkEqLgHIxt0HOlSpJIZGSWTYzAnYa/p86vHB95kVkEwQVeoMH5H+7SpUmPuik+zNBw14KUEnZUoP8wj86qDqilRB3BI+BrylW2Rjj3EXNJpMu60qVJY5YbZzu0qVKiIf//Z", use_column_width=True)
+    st.markdown(recursos.html_imagem(recursos.url("destaque.jpg")), unsafe_allow_html=True)
 with col2:
     st.write("""
     Foi parado em uma blitz e não sabe como proceder? 
@@ -39,7 +43,7 @@ st.write("Para saber mais informações sobre sua multa ou processo de trânsito
 # Ícones de contato em colunas
 col1, col2 = st.columns(2)
 with col1:
-    st.markdown(f"[![WhatsApp](data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAOEAAADhCAMAAAAJbSJIAAAAgVBMVEX///8y2VEs2E0m2Eki10cX10Ed10QV10Cr7bUq2Ev4/vmE5pNF3GDs++/y/fT6/vvN9NPE8svk+ede33SW6aOJ55ik7K+d6qje+OK0772P6J165ItO3WfA8sg22lW78MPW9ttW3m1044Zo4XxH3GLZ991t4oB/5Y9c33KS6KDi+eXnGpBNAAAIm0lEQVR4nO2d6XqyOhCAS1aiqLiLCy7V2vb+L/BoW7IBgoE2fM+Z968WM2QyWybpywsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADggd5lv7xOz6kgjGAUHU/rMB74HlRrTJJrRCkjAiEUfIGQwIRRMV3GPd+ja0y8jigTP5LZIELJNPyX53K1FhSXSKek5MfkH53J/Zbjx9JlQjLW//Q92ucJA1YxezqYvx58j/g5QkyekO+O4NOV71HXZ5yy58T7kXEz9D3yegxeeeH8IYQx+QKXGFfMQt+Dr0NIRV44zCiOXvuzRRiGi+X6dEwZJfnvBew48T3+KoZTmtM+xrfr3WRkffEQnhDPrVbEEj8Dr0uMhT1ictqVLq/V4kxtIfnpLwf8LAtrBWI+3Y0e/8lkZrsVEnU3ytlQS75+rVW125ovBpHDLw/UlSkxlh9d1zb+8ZbqMiK++81xujLaYmOQp6d0bZ8ar4d30N6MIl1Akh6efcDaUNXuiTg6a0YU8bXDI1YR6bKIR20GBYrdHtLnuojjdkfYkJP2+snROd1LdE3llzZH2JCZ5iZov8GDVlrEinB3AvGdpl182ehRg1StZ7FtaXyNGWi5Em+aHfQiJSJpog5tskXtCXh3O0rEjnj+mZpCvmjhecNUvbFOLMWVWoRs3soTB6o+J15beWIzznI4uK3hHNRL64CehlJHUVqRKD3xUOl9UNDaQx3pKVfP7VpZvOz3F26F0JMMkcis+SAbsZYSMsvKxCknGBO+cXnsKJC6z/zmwwOlTkfzk10WgLmZn1guRezXKfalNnEznVcjDKiTxd+oJ/ucxKGUg3wYH0y0QJU45UFDqf64HR/kxkwOQ5gmTwtzcvpbk4U00szj1pSMr6xidWhU9blblVcaG9JGpOTGPhMEBeYHVnnQzeDL14SiFsbqxlS+ZXMK9+bGDErdHi81hB+aj9WJgbQzzFyFr1bhm7pVNZbZKvfmMEI5AsvaEVPAQFydnj+UqoBbGK0Lx0xJuRmarXKbM8QtuHzLdMFRCZoinSGyqg3j3P4o2zv9gnwQdqlONmeX/b5tzRNbSwM0dfuJ7EHo3Hy4DsiIjVr+LsxJ6OoST1JNvURuUdbhZDuD/BwGzC2RlW6H+SgPS0uXixvz69A1epb+CPvIEuPMYubmJ29LmaulyIpSrgu5EXK15eZnZM8hdou9b2xk7NBwtC5IQyNyH72bcamInGst6jV6KCtOyxXINKYodR9dnKkDPTQYqiPZEikIGgf6LlnAGnTlTUoX+x+QzVNR9jbV1LSRGRzJX/n7bikZsxVFZGPNmrJDk5+RmvJR/d2WmUgJi6LiSE0iabTdti1fC7+NdHq0aKt2p09iEzOY6btwKrs24iAlLGwL1UpRuEkbV5ZAibcGD3FDSVgYVF/0beEG2V0We3vYhKqQ8GWufKJdp3qGTkhY0rys73O6LyKPWvrY0rwYdf2Au+X4L14tzWNvcWejNRGVTXQlHr3FQ4//hbZDFiDk6DKkx/eQID6K2r7R9VScnfILn1Hbo8g7Y60linjrIqLXyPtB9iTZasVvfC7YQvocP9ZelT15aHKTGTAq/85QP9cl0pznjDll/UclHK8ZcHkVQ+OgZ4qIWqo2uPfpY94vH73XKkZ5JUonMZJhbpTlRj8ZCGbrsj1Qr5Wo8mqiwYdReCPRQX30rlpKSgyy32qiqgg/3sC8GpU3rcNd77oNCCra7U+8VoTLq/oWJ7MEjtl3Sjy3ao4sykshq/qNckxnZMm9yhu/WbIQtFxN5rmyMeLv1nIced6ZKd1dy7GxS8SE0qIDtNR6VXJ3y0OV5guZx1fuLM15gTx5bGVQO6SH35LhMQu5y125LRHWEtHyO6qlzNcutyr8Vo8gLjpPaWPlWMuyPoG/Q+5P1DgWOThWnw22XpR8J76UVO8YqtMxsyw+HqwQZlFOdQz5saR3Rqrrq0533ueRPpTROgckE2if55/XMr+oFxnvH11DYMVG0o4FxGPnnrI1dWv3SVo2j4gZPkdrF/LTavLD9fk+1/GRF5lVIUxDqjq9faSGCjWJon5+c9nkTqkj+m7KoXVB+2ygfTHaoJ+o3Q8XkX6tC2KBVbDrIfmpn6BbMVRO67mGkss64ozg+2VDfJuzxG8qdWx2Fq4F0mJLWIfBeDG/zpe7/KvRTpQ49qa2hyzut2nx9FNB3s/KSq9VWtx/Hu1kF/77DRkb2ZNAWzufpJ3OQ8L7DVKy/am9Yph+iNS/jqqSYmsnBoxTsp5d4R0ZmOYOrjnSuZPOsqLYUk36IlrYkWsTGbS1tEWb6GF5W2rRCFWxdd7G1rkat0b46c+32LTZh30xb/5o5Z01Ri4Zs84wSd6OT6tYJ29vuciQTVVsB/trwIlA/PqUndgHnbyBR4ZsP2dahuP5/S7PH6nZrHZAkrtFyb+n/0aGbOwW3cSzLWPGXZ6ErWstz50p3y1dPPzywOvSkyHbNpzSoptKMX+tmo3JDNm3mZ07c5tZrC4bKL3pUjBxHZdq62qxpfbxE7fj7b/Dut4FrIKx42xsb970DuEpyF24d/tyR2zMF1FFDVtxvxmSbN/myzBJknDxcZ2mvPBmSPreGQ19sTvya4gpfi73vN/uWfhyuna7Z1K21XKbsfzZrmoEv3rPd01ORYXduz6e1/ECPyuj4K9diLQN8oomCE/736Wz3hL/8zclX8xWA0FocEp0i5mcCzfr8yBG6l2S+ccstEZuQvFrmFeyS19UCtnhG8t/NoBvC48fl4eyb8X9rzi8RLrb37539tb5Hv0aIdt+xBV1xM9kE93coeYisv8c8D6r+lufjDnj0bz8imCT4SGZbabn4OYRb9F5enP+i1yU0zXmp8RNvTo8awAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP8L/gOk913km5u2twAAAABJRU5ErkJggg==)]({whatsapp_url})")
+    st.markdown(f"[![WhatsApp]({recursos.url('whatsapp.png')})]({whatsapp_url})")
     st.write("**Atendimento rápido e eficaz via WhatsApp**")
 
 with col2:
@@ -0,0 +1,187 @@
+import bisect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import armazenamento
+import escrita
+import eventos
+import particoes
+import prazos
+
+# Alertas de prazos de efeito suspensivo (DT_Efeito_Susp) dos processos em aberto.
+# Os prazos ficam numa lista ordenada por data, posta em dia a cada gravação só com os
+# clientes cujo prazo ou Status mudou (registro de eventos, eventos.py); as consultas
+# "vence nos próximos N dias" leem só o começo da lista a partir de hoje. Uma thread
+# verifica periodicamente e emite um alerta quando um prazo entra em cada antecedência
+# configurada, gravando-o na caixa de saída (JSONL) e no log.
+ANTECEDENCIAS = sorted(int(d) for d in os.environ.get("IVP_ALERTAS_DIAS", "7,3,1,0").split(","))
+CAMINHO_SAIDA = os.environ.get("IVP_ALERTAS_SAIDA", os.path.join(".cache", "alertas.jsonl"))
+INTERVALO = int(os.environ.get("IVP_ALERTAS_INTERVALO", "300"))  # segundos entre verificações
+
+log = logging.getLogger("ivp.alertas")
+
+_FILTRO_PRAZOS = f"""
+WHERE DT_Efeito_Susp IS NOT NULL
+  AND (Status IS NULL OR Status NOT IN ({', '.join('?' for _ in prazos.STATUS_SEM_PRAZO)}))
+"""
+_SQL_PRAZOS = f"SELECT DT_Efeito_Susp, id FROM clientes {_FILTRO_PRAZOS} ORDER BY DT_Efeito_Susp, id"
+_SQL_PRAZOS_IDS = f"SELECT DT_Efeito_Susp, id FROM clientes {_FILTRO_PRAZOS} AND id IN (SELECT value FROM json_each(?))"
+_COLUNAS_PRAZO = ["DT_Efeito_Susp", "Status"]
+LIMITE_DELTA = 5000  # acima disso a lista é recarregada inteira
+
+
+class IndicePrazos:
+    def __init__(self):
+        self._trava = threading.Lock()
+        self._prazos = []  # (data ISO, id) em ordem crescente
+        self._por_id = {}  # id -> data ISO
+        self.seq = None  # último evento do banco já aplicado (eventos.py)
+
+    # Põe os prazos em dia com o banco: tira e recoloca só os clientes com prazo ou Status
+    # alterado desde o último evento aplicado; sem os eventos, recarrega a lista inteira
+    # (o banco já entrega em ordem pelo índice)
+    def atualizar(self):
+        seq = eventos.ultimo()
+        with self._trava:
+            if self.seq == seq:
+                return self
+            conexao = armazenamento.conectar()
+            delta = None if self.seq is None else eventos.alteracoes(self.seq, _COLUNAS_PRAZO, LIMITE_DELTA)
+            if delta is None:
+                self._prazos = conexao.execute(_SQL_PRAZOS, prazos.STATUS_SEM_PRAZO).fetchall()
+                self._por_id = {id_cliente: data for data, id_cliente in self._prazos}
+            else:
+                seq, alterados, excluidos = delta
+                for id_cliente in alterados | excluidos:
+                    data = self._por_id.pop(id_cliente, None)
+                    if data is not None:
+                        del self._prazos[bisect.bisect_left(self._prazos, (data, id_cliente))]
+                if alterados:
+                    linhas = conexao.execute(
+                        _SQL_PRAZOS_IDS, prazos.STATUS_SEM_PRAZO + [json.dumps(sorted(alterados))]
+                    ).fetchall()
+                    for data, id_cliente in linhas:
+                        bisect.insort(self._prazos, (data, id_cliente))
+                        self._por_id[id_cliente] = data
+            self.seq = seq
+        return self
+
+    # Prazos entre as datas (inclusivas): lista de (data, id) em ordem de vencimento
+    def entre(self, inicio, fim):
+        with self._trava:
+            de = bisect.bisect_left(self._prazos, (inicio.isoformat(),))
+            ate = bisect.bisect_right(self._prazos, (fim.isoformat(), float("inf")))
+            return [(date.fromisoformat(data), id_cliente) for data, id_cliente in self._prazos[de:ate]]
+
+    def __len__(self):
+        return len(self._prazos)
+
+
+_indices = {}  # um índice de prazos por escritório
+_trava_indices = threading.Lock()
+
+
+# Prazos em aberto do escritório em uso que vencem de hoje até daqui a `dias` dias: lista de (data, id)
+def vencendo(dias, hoje=None):
+    hoje = hoje or date.today()
+    with _trava_indices:
+        indice = _indices.setdefault(particoes.atual(), IndicePrazos())
+    return indice.atualizar().entre(hoje, hoje + timedelta(days=dias))
+
+
+# Antecedência mais curta que já cobre o prazo (ex.: faltam 2 dias com 7,3,1,0 -> 3)
+def _antecedencia(dias_restantes):
+    for antecedencia in ANTECEDENCIAS:
+        if dias_restantes <= antecedencia:
+            return antecedencia
+    return None
+
+
+# Emite os alertas devidos do escritório em uso; retorna os alertas novos. Cada (cliente, data,
+# antecedência) é alertado uma única vez, mesmo com várias páginas ou reinícios do servidor.
+def verificar(hoje=None):
+    hoje = hoje or date.today()
+    candidatos = {}
+    for data, id_cliente in vencendo(max(ANTECEDENCIAS), hoje):
+        dias = (data - hoje).days
+        candidatos[(id_cliente, data.isoformat(), _antecedencia(dias))] = dias
+    if not candidatos:
+        return []
+
+    def registrar(conexao):
+        enviado_em = datetime.now().isoformat(timespec="seconds")
+        novos = []
+        for chave in candidatos:
+            cursor = conexao.execute(
+                "INSERT OR IGNORE INTO alertas_enviados (id_cliente, data, antecedencia, enviado_em) VALUES (?, ?, ?, ?)",
+                chave + (enviado_em,),
+            )
+            if cursor.rowcount:
+                novos.append(chave)
+        return novos
+
+    novos = escrita.executar(registrar)
+    if not novos:
+        return []
+    nomes = armazenamento.carregar_por_ids([id_cliente for id_cliente, _, _ in novos])["Nome"]
+    alertas = [
+        {
+            "emitido_em": datetime.now().isoformat(timespec="seconds"),
+            "escritorio": particoes.atual(),
+            "id": id_cliente,
+            "nome": nomes.get(id_cliente),
+            "DT_Efeito_Susp": data,
+            "dias_restantes": candidatos[(id_cliente, data, antecedencia)],
+            "antecedencia": antecedencia,
+        }
+        for id_cliente, data, antecedencia in novos
+    ]
+    os.makedirs(os.path.dirname(CAMINHO_SAIDA) or ".", exist_ok=True)
+    with open(CAMINHO_SAIDA, "a", encoding="utf-8") as saida:
+        for alerta in alertas:
+            saida.write(json.dumps(alerta, ensure_ascii=False) + "\n")
+            log.warning(
+                "Prazo de %s (#%d, %s) vence em %d dia(s): %s",
+                alerta["nome"], alerta["id"], alerta["escritorio"], alerta["dias_restantes"], alerta["DT_Efeito_Susp"],
+            )
+    return alertas
+
+
+_trava_agendador = threading.Lock()
+_agendador = None
+
+
+def _executar_agendador():
+    while True:
+        for escritorio in particoes.ESCRITORIOS:
+            try:
+                with particoes.em(escritorio):
+                    verificar()
+            except Exception:
+                log.exception("Falha ao verificar os prazos de %s", escritorio)
+        time.sleep(INTERVALO)
+
+
+# Inicia a verificação periódica (uma thread por processo; chamar de novo não faz nada)
+def iniciar():
+    global _agendador
+    with _trava_agendador:
+        if _agendador is None or not _agendador.is_alive():
+            _agendador = threading.Thread(target=_executar_agendador, name="ivp-alertas", daemon=True)
+            _agendador.start()
+
+
+if __name__ == "__main__":
+    # Uso: python alertas.py [dias]  -> emite os alertas devidos e lista os prazos dos próximos dias
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    dias = int(sys.argv[1]) if len(sys.argv) > 1 else max(ANTECEDENCIAS)
+    for escritorio in particoes.ESCRITORIOS:
+        with particoes.em(escritorio):
+            print(f"{escritorio}: {len(verificar())} alerta(s) novo(s) em {CAMINHO_SAIDA}")
+            for data, id_cliente in vencendo(dias):
+                print(f"{data:%d/%m/%Y}  #{id_cliente}")
@@ -0,0 +1,37 @@
+import threading
+
+# Preparação do processo do servidor, chamada no topo de todas as páginas: o Streamlit pode
+# abrir qualquer página primeiro (link direto ou recarga), então nenhuma depende de outra
+# já ter sido executada. Só a primeira chamada faz alguma coisa.
+# pandas, os alertas e a busca são importados aqui dentro para que a página inicial, que não usa os
+# dados, possa disparar a preparação sem pagar essas importações (preparar_em_segundo_plano).
+_trava = threading.Lock()
+_preparado = False
+
+
+def preparar():
+    global _preparado
+    with _trava:
+        if _preparado:
+            return
+        import pandas as pd
+
+        import alertas
+        import busca
+
+        # Com copy-on-write, as cópias rasas entregues pelo cache de clientes (cache_dados.py)
+        # compartilham a memória do DataFrame em cache, e qualquer alteração feita por uma
+        # página gera uma cópia só dela.
+        pd.set_option("mode.copy_on_write", True)
+        # Verificação periódica dos prazos: roda no processo inteiro, seja qual for a
+        # primeira página aberta
+        alertas.iniciar()
+        # Índice de busca montado em segundo plano, antes da primeira busca
+        busca.iniciar()
+        _preparado = True
+
+
+# Para a página inicial: prepara o processo numa thread, sem atrasar a primeira tela
+def preparar_em_segundo_plano():
+    if not _preparado:
+        threading.Thread(target=preparar, name="ivp-preparacao", daemon=True).start()
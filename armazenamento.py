@@ -0,0 +1,523 @@
+import csv
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+import esquema
+import particoes
+from esquema import COLUNAS, COLUNAS_DATA
+
+# Caminhos do banco de dados e do CSV legado (podem ser trocados por variável de ambiente).
+# CAMINHO_BANCO é o banco do primeiro escritório; os demais ficam ao lado (ver particoes.py).
+CAMINHO_BANCO = os.environ.get("IVP_BANCO", "clientes.db")
+CAMINHO_CSV = os.environ.get("IVP_CSV", "clientes.csv")
+
+log = logging.getLogger("ivp.armazenamento")
+
+COLUNAS_INDEXADAS = [
+    "CPF", "CNPJ", "Nome", "Auto_infracao", "Num_Processo", "Status", "DT_Efeito_Susp", "DT_contrato",
+]
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS clientes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    Nome TEXT NOT NULL,
+    Telefone TEXT,
+    CPF TEXT,
+    CNPJ TEXT,
+    DT_contrato TEXT,
+    Tipo_de_Processo TEXT,
+    Orgao TEXT,
+    Auto_infracao TEXT,
+    Num_Processo TEXT,
+    Pagamento TEXT,
+    Valor REAL,
+    DT_Entrada_CT TEXT,
+    DT_Efeito_Susp TEXT,
+    Status TEXT
+);
+
+-- Versão dos dados: incrementada a cada gravação, usada para invalidar caches
+CREATE TABLE IF NOT EXISTS metadados (
+    chave TEXT PRIMARY KEY,
+    valor INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO metadados (chave, valor) VALUES ('versao', 0);
+
+CREATE TRIGGER IF NOT EXISTS clientes_versao_insert AFTER INSERT ON clientes BEGIN
+    UPDATE metadados SET valor = valor + 1 WHERE chave = 'versao';
+END;
+CREATE TRIGGER IF NOT EXISTS clientes_versao_update AFTER UPDATE ON clientes BEGIN
+    UPDATE metadados SET valor = valor + 1 WHERE chave = 'versao';
+END;
+CREATE TRIGGER IF NOT EXISTS clientes_versao_delete AFTER DELETE ON clientes BEGIN
+    UPDATE metadados SET valor = valor + 1 WHERE chave = 'versao';
+END;
+"""
+
+# Resumo mensal do faturamento (mês de DT_contrato x Pagamento x Tipo_de_Processo x Status x Orgao).
+# Os gatilhos mantêm o resumo em dia a cada inserção, alteração ou exclusão de cliente,
+# então o dashboard financeiro lê só esta tabela pequena em vez de todos os registros.
+_CHAVE_RESUMO = "mes, Pagamento, Tipo_de_Processo, Status, Orgao"
+
+
+def _gatilho_resumo(nome, evento, linha, sinal):
+    return f"""
+CREATE TRIGGER IF NOT EXISTS {nome} AFTER {evento} ON clientes WHEN {linha}.DT_contrato IS NOT NULL BEGIN
+    INSERT INTO resumo_mensal ({_CHAVE_RESUMO}, quantidade, valor_total)
+    VALUES (substr({linha}.DT_contrato, 1, 7), COALESCE({linha}.Pagamento, ''),
+            COALESCE({linha}.Tipo_de_Processo, ''), COALESCE({linha}.Status, ''),
+            COALESCE({linha}.Orgao, ''), {sinal}1, {sinal}COALESCE({linha}.Valor, 0))
+    ON CONFLICT ({_CHAVE_RESUMO}) DO UPDATE SET
+        quantidade = quantidade + excluded.quantidade,
+        valor_total = valor_total + excluded.valor_total;
+    DELETE FROM resumo_mensal WHERE quantidade <= 0 AND mes = substr({linha}.DT_contrato, 1, 7)
+        AND Pagamento = COALESCE({linha}.Pagamento, '') AND Tipo_de_Processo = COALESCE({linha}.Tipo_de_Processo, '')
+        AND Status = COALESCE({linha}.Status, '') AND Orgao = COALESCE({linha}.Orgao, '');
+END;
+"""
+
+
+_COLUNAS_RESUMIDAS = "DT_contrato, Pagamento, Tipo_de_Processo, Status, Orgao, Valor"
+
+ESQUEMA_RESUMO = f"""
+CREATE TABLE IF NOT EXISTS resumo_mensal (
+    mes TEXT NOT NULL,
+    Pagamento TEXT NOT NULL,
+    Tipo_de_Processo TEXT NOT NULL,
+    Status TEXT NOT NULL,
+    Orgao TEXT NOT NULL,
+    quantidade INTEGER NOT NULL,
+    valor_total REAL NOT NULL,
+    PRIMARY KEY ({_CHAVE_RESUMO})
+);
+{_gatilho_resumo("resumo_insert", "INSERT", "NEW", "")}
+{_gatilho_resumo("resumo_delete", "DELETE", "OLD", "-")}
+{_gatilho_resumo("resumo_update_saida", f"UPDATE OF {_COLUNAS_RESUMIDAS}", "OLD", "-")}
+{_gatilho_resumo("resumo_update_entrada", f"UPDATE OF {_COLUNAS_RESUMIDAS}", "NEW", "")}
+"""
+
+# Recalcula o resumo inteiro a partir dos clientes (usado quando a tabela é criada)
+SQL_RECALCULAR_RESUMO = f"""
+INSERT INTO resumo_mensal ({_CHAVE_RESUMO}, quantidade, valor_total)
+SELECT substr(DT_contrato, 1, 7), COALESCE(Pagamento, ''), COALESCE(Tipo_de_Processo, ''),
+       COALESCE(Status, ''), COALESCE(Orgao, ''), COUNT(*), COALESCE(SUM(Valor), 0)
+FROM clientes WHERE DT_contrato IS NOT NULL
+GROUP BY 1, 2, 3, 4, 5
+"""
+
+# Deixa só os dígitos dos documentos gravados antes da normalização do cadastro (com pontos,
+# traço, barra ou sem os zeros à esquerda), no mesmo formato de esquema.normalizar_documento
+def _sql_normalizar_documento(coluna, digitos):
+    limpo = coluna
+    for caractere in ".-/ ":
+        limpo = f"replace({limpo}, '{caractere}', '')"
+    normalizado = f"substr('{'0' * digitos}' || {limpo}, -{digitos})"
+    return (
+        f"UPDATE clientes SET {coluna} = {normalizado} "
+        f"WHERE ({coluna} GLOB '*[^0-9]*' OR length({coluna}) < {digitos}) "
+        f"AND {limpo} GLOB '[0-9]*' AND {limpo} NOT GLOB '*[^0-9]*' AND {coluna} IS NOT {normalizado}"
+    )
+
+
+SQL_NORMALIZAR_DOCUMENTOS = [
+    _sql_normalizar_documento(coluna, digitos) for coluna, digitos in esquema.DIGITOS_DOCUMENTO.items()
+]
+
+# Versão dos dados gravados, em metadados ('versao_esquema'): as migrações de dados (como a
+# normalização dos documentos acima) rodam uma única vez, quando o banco está numa versão anterior
+VERSAO_ESQUEMA = 1
+
+# Anos (de DT_contrato) alterados desde a última atualização do snapshot Parquet
+# (instantaneo.py); '' representa os clientes sem data de contrato. 'marca' muda a cada
+# nova alteração do ano, então o snapshot só retira da lista os anos que não mudaram
+# enquanto os arquivos eram gravados.
+def _marcar_ano(linha):
+    return (
+        f"INSERT INTO anos_pendentes (ano) VALUES (COALESCE(substr({linha}.DT_contrato, 1, 4), '')) "
+        "ON CONFLICT (ano) DO UPDATE SET marca = marca + 1;"
+    )
+
+
+ESQUEMA_INSTANTANEO = f"""
+CREATE TABLE IF NOT EXISTS anos_pendentes (ano TEXT PRIMARY KEY, marca INTEGER NOT NULL DEFAULT 0);
+CREATE TRIGGER IF NOT EXISTS anos_pendentes_insert AFTER INSERT ON clientes BEGIN
+    {_marcar_ano("NEW")}
+END;
+CREATE TRIGGER IF NOT EXISTS anos_pendentes_update AFTER UPDATE ON clientes BEGIN
+    {_marcar_ano("OLD")}
+    {_marcar_ano("NEW")}
+END;
+CREATE TRIGGER IF NOT EXISTS anos_pendentes_delete AFTER DELETE ON clientes BEGIN
+    {_marcar_ano("OLD")}
+END;
+"""
+
+# Alertas de prazo já emitidos (alertas.py): um por cliente, data do prazo e antecedência
+ESQUEMA_ALERTAS = """
+CREATE TABLE IF NOT EXISTS alertas_enviados (
+    id_cliente INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    antecedencia INTEGER NOT NULL,
+    enviado_em TEXT NOT NULL,
+    PRIMARY KEY (id_cliente, data, antecedencia)
+);
+"""
+
+# Registro ordenado das alterações nos clientes (eventos.py): um evento por inserção,
+# alteração ou exclusão, gravado pelos gatilhos na mesma transação da gravação, então
+# todo caminho de escrita entra no registro. Nas alterações, 'colunas' lista o que mudou.
+# AUTOINCREMENT garante que um número de sequência nunca é reaproveitado.
+_COLUNAS_ALTERADAS = " || ".join(
+    f"CASE WHEN OLD.{coluna} IS NOT NEW.{coluna} THEN '{coluna},' ELSE '' END" for coluna in COLUNAS
+)
+
+ESQUEMA_EVENTOS = f"""
+CREATE TABLE IF NOT EXISTS eventos (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    operacao TEXT NOT NULL,
+    id_cliente INTEGER NOT NULL,
+    colunas TEXT,
+    quando TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+);
+CREATE TRIGGER IF NOT EXISTS clientes_eventos_insert AFTER INSERT ON clientes BEGIN
+    INSERT INTO eventos (operacao, id_cliente) VALUES ('inserir', NEW.id);
+END;
+CREATE TRIGGER IF NOT EXISTS clientes_eventos_update AFTER UPDATE ON clientes BEGIN
+    INSERT INTO eventos (operacao, id_cliente, colunas) VALUES ('alterar', NEW.id, rtrim({_COLUNAS_ALTERADAS}, ','));
+END;
+CREATE TRIGGER IF NOT EXISTS clientes_eventos_delete AFTER DELETE ON clientes BEGIN
+    INSERT INTO eventos (operacao, id_cliente) VALUES ('excluir', OLD.id);
+END;
+"""
+
+# Uma conexão por thread: o Streamlit executa cada sessão em uma thread diferente
+_local = threading.local()
+
+# Bancos cujo esquema já foi conferido neste processo. O Streamlit roda cada execução da
+# página numa thread nova (e portanto numa conexão nova); só a primeira conexão com cada
+# arquivo passa por inicializar, as demais abrem direto sem travar o banco para escrita.
+_inicializados = set()
+_trava_inicializacao = threading.Lock()
+
+
+# Banco do escritório informado (ou do escritório em uso na thread)
+def caminho_banco(escritorio=None):
+    return particoes.caminho(CAMINHO_BANCO, escritorio or particoes.atual())
+
+
+# Abre uma nova conexão em modo WAL com o banco do escritório em uso, criando o esquema se preciso
+# (uma vez por arquivo e por processo). O CSV legado só é importado para o primeiro escritório.
+def abrir_conexao(importar_legado=True, sincrono="NORMAL"):
+    escritorio = particoes.atual()
+    caminho = os.path.abspath(caminho_banco(escritorio))
+    conexao = sqlite3.connect(caminho, timeout=30)
+    conexao.execute("PRAGMA journal_mode=WAL")
+    conexao.execute(f"PRAGMA synchronous={sincrono}")
+    if caminho not in _inicializados:
+        with _trava_inicializacao:
+            if caminho not in _inicializados:
+                inicializar(conexao, importar_legado and escritorio == particoes.ESCRITORIOS[0])
+                _inicializados.add(caminho)
+    return conexao
+
+
+# Função para abrir (ou reaproveitar) a conexão da thread atual com o banco do escritório em uso
+def conectar():
+    conexoes = getattr(_local, "conexoes", None)
+    if conexoes is None:
+        conexoes = _local.conexoes = {}
+    escritorio = particoes.atual()
+    if escritorio not in conexoes:
+        conexoes[escritorio] = abrir_conexao()
+    return conexoes[escritorio]
+
+
+# Separa um script SQL em comandos (os gatilhos têm ';' dentro do corpo)
+def _comandos(script):
+    comando = ""
+    for linha in script.splitlines(keepends=True):
+        comando += linha
+        if sqlite3.complete_statement(comando):
+            yield comando
+            comando = ""
+
+
+# Função para criar a tabela e os índices (e importar o CSV antigo na primeira execução).
+# Tudo roda numa só transação com o banco travado para escrita (BEGIN IMMEDIATE), então
+# duas sessões abrindo um banco novo ao mesmo tempo não importam o CSV nem recalculam o
+# resumo duas vezes: a segunda espera a primeira terminar e já encontra as tabelas prontas.
+def inicializar(conexao, importar_legado=True):
+    def existe(tabela):
+        return conexao.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (tabela,)
+        ).fetchone() is not None
+
+    conexao.execute("BEGIN IMMEDIATE")
+    try:
+        novo = not existe("clientes")
+        resumo_novo = not existe("resumo_mensal")
+        # Bancos anteriores à coluna 'marca' de anos_pendentes: os gatilhos são recriados abaixo
+        if existe("anos_pendentes") and "marca" not in [c[1] for c in conexao.execute("PRAGMA table_info(anos_pendentes)")]:
+            conexao.execute("ALTER TABLE anos_pendentes ADD COLUMN marca INTEGER NOT NULL DEFAULT 0")
+            for evento in ("insert", "update", "delete"):
+                conexao.execute(f"DROP TRIGGER IF EXISTS anos_pendentes_{evento}")
+        for comando in _comandos(ESQUEMA + ESQUEMA_RESUMO + ESQUEMA_INSTANTANEO + ESQUEMA_ALERTAS + ESQUEMA_EVENTOS):
+            conexao.execute(comando)
+        for coluna in COLUNAS_INDEXADAS:
+            conexao.execute(f"CREATE INDEX IF NOT EXISTS idx_clientes_{coluna} ON clientes({coluna})")
+        if resumo_novo and not novo:
+            conexao.execute(SQL_RECALCULAR_RESUMO)
+        linha = conexao.execute("SELECT valor FROM metadados WHERE chave = 'versao_esquema'").fetchone()
+        versao_esquema = linha[0] if linha else 0
+        if versao_esquema < 1 and not novo:
+            for comando in SQL_NORMALIZAR_DOCUMENTOS:
+                conexao.execute(comando)
+        if versao_esquema < VERSAO_ESQUEMA:
+            conexao.execute(
+                "INSERT OR REPLACE INTO metadados (chave, valor) VALUES ('versao_esquema', ?)", (VERSAO_ESQUEMA,)
+            )
+        if novo and importar_legado and os.path.exists(CAMINHO_CSV):
+            inserir_linhas(_ler_csv(CAMINHO_CSV), conexao)
+        conexao.commit()
+    except Exception:
+        conexao.rollback()
+        raise
+
+
+# Converte datas (date, datetime ou texto DD/MM/YYYY) para o formato ISO usado no banco
+def data_iso(valor):
+    if valor is None or valor == "" or (isinstance(valor, float) and pd.isna(valor)):
+        return None
+    if hasattr(valor, "strftime"):
+        return valor.strftime("%Y-%m-%d")
+    texto = str(valor).strip()
+    for formato in ("%d/%m/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(texto, formato).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+# Remove o ".0" que o pandas deixava em números gravados como float (Telefone, Num_Processo)
+def texto_documento(valor):
+    if valor is None:
+        return None
+    texto = str(valor).strip()
+    if texto.endswith(".0"):
+        texto = texto[:-2]
+    return texto or None
+
+
+# Monta a tupla de valores de um cliente na ordem das colunas
+def _valores(registro):
+    valores = []
+    for coluna in COLUNAS:
+        valor = registro.get(coluna)
+        if coluna in COLUNAS_DATA:
+            valor = data_iso(valor)
+        elif coluna == "Valor":
+            valor = float(valor) if valor not in (None, "") else None
+        elif coluna in esquema.DIGITOS_DOCUMENTO:
+            valor = esquema.normalizar_documento(valor, coluna)
+        elif coluna in ("Telefone", "Num_Processo"):
+            valor = texto_documento(valor)
+        elif valor is not None:
+            valor = str(valor).strip() or None
+        valores.append(valor)
+    return tuple(valores)
+
+
+_SQL_INSERIR = (
+    f"INSERT INTO clientes ({', '.join(COLUNAS)}) "
+    f"VALUES ({', '.join('?' for _ in COLUNAS)})"
+)
+
+
+# Função para gravar um novo cliente; retorna o id do registro.
+# Se uma conexão for informada, a transação fica a cargo de quem chamou.
+def inserir_cliente(registro, conexao=None):
+    if conexao is not None:
+        return conexao.execute(_SQL_INSERIR, _valores(registro)).lastrowid
+    conexao = conectar()
+    with conexao:
+        cursor = conexao.execute(_SQL_INSERIR, _valores(registro))
+    return cursor.lastrowid
+
+
+# Grava várias linhas já normalizadas (tuplas na ordem de COLUNAS); retorna quantas foram gravadas.
+# Se uma conexão for informada, a transação fica a cargo de quem chamou.
+def inserir_linhas(linhas, conexao=None):
+    if conexao is None:
+        with conectar() as conexao:
+            return inserir_linhas(linhas, conexao)
+    conexao.executemany(_SQL_INSERIR, linhas)
+    return len(linhas)
+
+
+# Retorna a versão atual dos dados (muda a cada inserção, alteração ou exclusão)
+def versao():
+    return conectar().execute("SELECT valor FROM metadados WHERE chave = 'versao'").fetchone()[0]
+
+
+# Lê uma consulta SQL em um DataFrame indexado pelo id, já com os tipos do esquema
+def _ler_clientes(sql, parametros=()):
+    return esquema.tipar(pd.read_sql_query(sql, conectar(), params=parametros, index_col="id"))
+
+
+_SQL_SELECIONAR = f"SELECT id, {', '.join(COLUNAS)} FROM clientes"
+
+
+# Função para carregar os clientes (todos, ou só os que atendem aos filtros) indexados pelo id
+def carregar_clientes(**filtros):
+    onde, parametros = _filtros(**filtros)
+    return _ler_clientes(f"{_SQL_SELECIONAR}{onde} ORDER BY id", parametros)
+
+
+# Mesmos clientes de carregar_clientes, entregues em partes de até `tamanho` linhas
+# (para exportações grandes sem carregar tudo na memória)
+def iterar_clientes(tamanho=5000, **filtros):
+    onde, parametros = _filtros(**filtros)
+    partes = pd.read_sql_query(
+        f"{_SQL_SELECIONAR}{onde} ORDER BY id", conectar(), params=parametros, index_col="id", chunksize=tamanho
+    )
+    for parte in partes:
+        yield esquema.tipar(parte)
+
+
+# Clientes com contrato no ano informado ('' = sem data de contrato), pelo índice de DT_contrato
+def carregar_ano(ano):
+    if not ano:
+        return _ler_clientes(f"{_SQL_SELECIONAR} WHERE DT_contrato IS NULL ORDER BY id")
+    return _ler_clientes(
+        f"{_SQL_SELECIONAR} WHERE DT_contrato >= ? AND DT_contrato < ? ORDER BY id",
+        (f"{ano}-01-01", f"{int(ano) + 1}-01-01"),
+    )
+
+
+# Carrega só os clientes informados, na ordem dos ids
+def carregar_por_ids(ids):
+    ids = [int(i) for i in ids]
+    if not ids:
+        return _ler_clientes(f"{_SQL_SELECIONAR} WHERE 0")
+    dados = _ler_clientes(
+        f"{_SQL_SELECIONAR} WHERE id IN (SELECT value FROM json_each(?))", (json.dumps(ids),)
+    )
+    return dados.reindex([i for i in ids if i in dados.index])
+
+
+# Monta a cláusula WHERE dos filtros aceitos pelas consultas de clientes
+def _filtros(status=None, excluir_status=None, efeito_susp_ate=None, contrato_de=None, contrato_ate=None):
+    condicoes, parametros = [], []
+    if status:
+        condicoes.append(f"Status IN ({', '.join('?' for _ in status)})")
+        parametros.extend(status)
+    if excluir_status:
+        condicoes.append(f"(Status IS NULL OR Status NOT IN ({', '.join('?' for _ in excluir_status)}))")
+        parametros.extend(excluir_status)
+    if efeito_susp_ate is not None:
+        condicoes.append("DT_Efeito_Susp <= ?")
+        parametros.append(data_iso(efeito_susp_ate))
+    if contrato_de is not None:
+        condicoes.append("DT_contrato >= ?")
+        parametros.append(data_iso(contrato_de))
+    if contrato_ate is not None:
+        condicoes.append("DT_contrato <= ?")
+        parametros.append(data_iso(contrato_ate))
+    onde = f" WHERE {' AND '.join(condicoes)}" if condicoes else ""
+    return onde, parametros
+
+
+# Quantidade de clientes que atendem aos filtros
+def contar_clientes(**filtros):
+    onde, parametros = _filtros(**filtros)
+    return conectar().execute(f"SELECT COUNT(*) FROM clientes{onde}", parametros).fetchone()[0]
+
+
+# Uma página de clientes, com ordenação e filtros resolvidos pelo banco (usando os índices)
+def consultar_pagina(pagina, tamanho, ordenar_por="id", decrescente=False, **filtros):
+    if ordenar_por != "id" and ordenar_por not in COLUNAS:
+        raise ValueError(f"Coluna de ordenação inválida: {ordenar_por}")
+    onde, parametros = _filtros(**filtros)
+    direcao = "DESC" if decrescente else "ASC"
+    return _ler_clientes(
+        f"{_SQL_SELECIONAR}{onde} ORDER BY {ordenar_por} {direcao}, id {direcao} LIMIT ? OFFSET ?",
+        parametros + [int(tamanho), int(pagina) * int(tamanho)],
+    )
+
+
+# Atualiza o Status só dos clientes informados ({id: (status_exibido, status_novo)}).
+# O registro só muda se ainda tiver o status que o usuário viu; os ids que outra pessoa
+# alterou nesse meio-tempo não são sobrescritos e voltam como conflito.
+def atualizar_status(alteracoes, conexao=None):
+    if conexao is None:
+        with conectar() as conexao:
+            return atualizar_status(alteracoes, conexao)
+    conflitos = []
+    for id_cliente, (status_exibido, status_novo) in alteracoes.items():
+        cursor = conexao.execute(
+            "UPDATE clientes SET Status = ? WHERE id = ? AND COALESCE(Status, '') = ?",
+            (status_novo or None, int(id_cliente), status_exibido or ""),
+        )
+        if cursor.rowcount == 0:
+            conflitos.append(id_cliente)
+    return conflitos
+
+
+# Função para excluir clientes pelo id; retorna quantos foram excluídos
+def excluir_clientes(ids, conexao=None):
+    if conexao is None:
+        with conectar() as conexao:
+            return excluir_clientes(ids, conexao)
+    cursor = conexao.executemany("DELETE FROM clientes WHERE id = ?", [(int(i),) for i in ids])
+    return cursor.rowcount
+
+
+# Lê as linhas do clientes.csv antigo, já normalizadas para o banco. Um Valor ilegível é
+# gravado vazio (como na importação de planilhas) e as linhas afetadas vão para o log.
+def _ler_csv(caminho):
+    linhas, sem_valor = [], []
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        for numero, linha in enumerate(csv.DictReader(arquivo), start=2):  # linha 1 é o cabeçalho
+            if not linha.get("Nome"):
+                continue
+            try:
+                linhas.append(_valores(linha))
+            except ValueError:
+                sem_valor.append(numero)
+                linhas.append(_valores({**linha, "Valor": None}))
+    if sem_valor:
+        log.warning(
+            "%d linha(s) de %s com Valor ilegível importadas sem valor: %s",
+            len(sem_valor), caminho, ", ".join(map(str, sem_valor)),
+        )
+    return linhas
+
+
+# Importa o clientes.csv antigo para o banco; retorna quantos registros foram gravados
+def importar_csv(caminho, conexao=None):
+    conexao = conexao or conectar()
+    with conexao:
+        return inserir_linhas(_ler_csv(caminho), conexao)
+
+
+if __name__ == "__main__":
+    # Uso: python armazenamento.py importar [clientes.csv] [--escritorio NOME]
+    argumentos = sys.argv[1:]
+    if "--escritorio" in argumentos:
+        posicao = argumentos.index("--escritorio")
+        particoes.usar(argumentos[posicao + 1])
+        del argumentos[posicao:posicao + 2]
+    if argumentos and argumentos[0] == "importar":
+        caminho = argumentos[1] if len(argumentos) > 1 else CAMINHO_CSV
+        total = importar_csv(caminho, abrir_conexao(importar_legado=False))
+        print(f"{total} clientes importados de {caminho} para {caminho_banco()} ({particoes.atual()})")
+    else:
+        print("Uso: python armazenamento.py importar [caminho.csv] [--escritorio NOME]")
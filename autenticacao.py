@@ -0,0 +1,188 @@
+import base64
+import getpass
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+
+import streamlit as st
+
+# Login único para todas as páginas.
+# As senhas ficam num arquivo de credenciais só com hashes scrypt (com sal próprio por
+# usuário); ao entrar, a sessão recebe um token assinado com HMAC que todas as páginas
+# aceitam. O custo do scrypt é pago só no login: a verificação do token em cada execução
+# da página é um HMAC, e o resultado fica guardado na própria sessão.
+CAMINHO_CREDENCIAIS = os.environ.get("IVP_CREDENCIAIS", "credenciais.json")
+CAMINHO_SEGREDO = os.environ.get("IVP_SEGREDO_SESSAO", os.path.join(".cache", "segredo_sessao"))
+VALIDADE_SESSAO = 12 * 60 * 60  # segundos
+PAPEIS = ["usuario", "admin"]
+
+# Parâmetros do scrypt (~16 MB de memória e algumas dezenas de ms por verificação)
+_SCRYPT = {"n": 2 ** 14, "r": 8, "p": 1}
+
+_trava = threading.Lock()
+_credenciais = {"chave": None, "usuarios": {}}
+_segredo = None
+
+
+def _b64(dados):
+    return base64.urlsafe_b64encode(dados).rstrip(b"=").decode("ascii")
+
+
+def _de_b64(texto):
+    return base64.urlsafe_b64decode(texto + "=" * (-len(texto) % 4))
+
+
+# Hash de uma senha no formato "scrypt$n$r$p$sal$hash"
+def gerar_hash(senha, sal=None):
+    sal = sal or secrets.token_bytes(16)
+    derivado = hashlib.scrypt(senha.encode("utf-8"), salt=sal, dklen=32, **_SCRYPT)
+    return f"scrypt${_SCRYPT['n']}${_SCRYPT['r']}${_SCRYPT['p']}${_b64(sal)}${_b64(derivado)}"
+
+
+def _conferir_hash(senha, armazenado):
+    _, n, r, p, sal, esperado = armazenado.split("$")
+    derivado = hashlib.scrypt(senha.encode("utf-8"), salt=_de_b64(sal), n=int(n), r=int(r), p=int(p), dklen=32)
+    return hmac.compare_digest(derivado, _de_b64(esperado))
+
+
+# Hash usado quando o usuário não existe, para a resposta levar o mesmo tempo
+_HASH_FALSO = gerar_hash(secrets.token_hex(8))
+
+
+# Usuários do arquivo de credenciais ({usuario: {"hash": ..., "papel": ...}}),
+# relido só quando o arquivo muda
+def carregar_usuarios():
+    try:
+        estado = os.stat(CAMINHO_CREDENCIAIS)
+    except FileNotFoundError:
+        return {}
+    chave = (estado.st_mtime_ns, estado.st_size)
+    with _trava:
+        if _credenciais["chave"] != chave:
+            with open(CAMINHO_CREDENCIAIS, encoding="utf-8") as arquivo:
+                _credenciais["usuarios"] = json.load(arquivo).get("usuarios", {})
+            _credenciais["chave"] = chave
+        return _credenciais["usuarios"]
+
+
+# Cria ou altera um usuário no arquivo de credenciais
+def definir_usuario(usuario, senha, papel="usuario"):
+    if papel not in PAPEIS:
+        raise ValueError(f"Papel inválido: {papel}")
+    usuarios = dict(carregar_usuarios())
+    usuarios[usuario] = {"hash": gerar_hash(senha), "papel": papel}
+    temporario = CAMINHO_CREDENCIAIS + ".tmp"
+    with open(os.open(temporario, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as arquivo:
+        json.dump({"usuarios": usuarios}, arquivo, indent=2, ensure_ascii=False)
+    os.replace(temporario, CAMINHO_CREDENCIAIS)
+
+
+# Confere usuário e senha; retorna o papel do usuário ou None.
+# Usuário inexistente também paga um scrypt, para não revelar quais usuários existem.
+def verificar_senha(usuario, senha):
+    registro = carregar_usuarios().get(usuario)
+    valido = _conferir_hash(senha, registro["hash"] if registro else _HASH_FALSO)
+    return registro["papel"] if valido and registro else None
+
+
+def _obter_segredo():
+    global _segredo
+    with _trava:
+        if _segredo is None:
+            if not os.path.exists(CAMINHO_SEGREDO):
+                os.makedirs(os.path.dirname(CAMINHO_SEGREDO) or ".", exist_ok=True)
+                with open(os.open(CAMINHO_SEGREDO, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as arquivo:
+                    arquivo.write(secrets.token_bytes(32))
+            with open(CAMINHO_SEGREDO, "rb") as arquivo:
+                _segredo = arquivo.read()
+        return _segredo
+
+
+def _assinar(conteudo):
+    return _b64(hmac.new(_obter_segredo(), conteudo.encode("ascii"), hashlib.sha256).digest())
+
+
+# Token de sessão: dados em base64 + "." + assinatura HMAC-SHA256
+def emitir_token(usuario, papel, validade=VALIDADE_SESSAO):
+    dados = {"u": usuario, "p": papel, "exp": int(time.time() + validade)}
+    conteudo = _b64(json.dumps(dados, separators=(",", ":")).encode("utf-8"))
+    return f"{conteudo}.{_assinar(conteudo)}"
+
+
+# Dados do token ({"usuario", "papel", "expira"}) se a assinatura e a validade conferirem
+def verificar_token(token):
+    try:
+        conteudo, assinatura = token.split(".")
+    except (AttributeError, ValueError):
+        return None
+    if not hmac.compare_digest(assinatura, _assinar(conteudo)):
+        return None
+    dados = json.loads(_de_b64(conteudo))
+    if dados["exp"] < time.time():
+        return None
+    return {"usuario": dados["u"], "papel": dados["p"], "expira": dados["exp"]}
+
+
+# Usuário logado nesta sessão do navegador (o mesmo em todas as páginas) ou None
+def usuario_logado():
+    token = st.session_state.get("token_sessao")
+    if token is None:
+        return None
+    verificado = st.session_state.get("sessao_verificada")
+    if verificado is None or verificado[0] != token:
+        verificado = (token, verificar_token(token))
+        st.session_state["sessao_verificada"] = verificado
+    usuario = verificado[1]
+    if usuario is None or usuario["expira"] < time.time():
+        sair()
+        return None
+    return usuario
+
+
+def eh_admin():
+    usuario = usuario_logado()
+    return usuario is not None and usuario["papel"] == "admin"
+
+
+def sair():
+    st.session_state.pop("token_sessao", None)
+    st.session_state.pop("sessao_verificada", None)
+
+
+# Formulário de login compartilhado pelas páginas
+def tela_login(titulo="Área Restrita - Login"):
+    st.title(titulo)
+    if not carregar_usuarios():
+        st.warning(
+            "Nenhum usuário cadastrado. Crie o primeiro com: python autenticacao.py definir admin --papel admin"
+        )
+        return
+    with st.form("login"):
+        usuario = st.text_input("Usuário")
+        senha = st.text_input("Senha", type="password")
+        entrar = st.form_submit_button("Entrar")
+    if entrar:
+        papel = verificar_senha(usuario, senha)
+        if papel:
+            st.session_state["token_sessao"] = emitir_token(usuario, papel)
+            st.rerun()
+        else:
+            st.error("Usuário ou senha incorretos!", icon="❌")
+
+
+if __name__ == "__main__":
+    # Uso: python autenticacao.py definir <usuario> [--papel admin]
+    if len(sys.argv) >= 3 and sys.argv[1] == "definir":
+        papel = sys.argv[sys.argv.index("--papel") + 1] if "--papel" in sys.argv else "usuario"
+        senha = getpass.getpass(f"Senha para {sys.argv[2]}: ")
+        if senha != getpass.getpass("Repita a senha: "):
+            sys.exit("As senhas não conferem")
+        definir_usuario(sys.argv[2], senha, papel)
+        print(f"Usuário {sys.argv[2]} ({papel}) gravado em {CAMINHO_CREDENCIAIS}")
+    else:
+        print("Uso: python autenticacao.py definir <usuario> [--papel admin]")
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+# Clientes sintéticos para os benchmarks: nomes, telefones, CPF/CNPJ válidos (com dígitos
+# verificadores), campos de escolha com a distribuição observada no escritório e datas
+# coerentes entre si (contrato -> entrada do processo -> efeito suspensivo).
+PRIMEIROS_NOMES = [
+    "ANA", "MARIA", "JOAO", "JOSE", "CARLOS", "PAULO", "LUCAS", "PEDRO", "MARCOS", "LUIZ",
+    "FRANCISCO", "ANTONIO", "RAFAEL", "GABRIEL", "JULIANA", "FERNANDA", "PATRICIA", "ALINE",
+    "CLAUDIANE", "SEBASTIAO", "CONCEIÇÃO", "ASSUNÇÃO", "VITORIA", "MATHEUS", "BRUNO",
+]
+SOBRENOMES = [
+    "SILVA", "SANTOS", "OLIVEIRA", "SOUZA", "RODRIGUES", "FERREIRA", "ALVES", "PEREIRA",
+    "LIMA", "GOMES", "COSTA", "RIBEIRO", "MARTINS", "CARVALHO", "ARAUJO", "MELO", "BARBOSA",
+    "ROCHA", "DIAS", "NASCIMENTO", "ANDRADE", "MOREIRA", "NUNES", "MARQUES", "MACHADO",
+]
+DISTRIBUICOES = {
+    "Tipo_de_Processo": {"JARI": 0.5, "DEFESA PRÉVIA": 0.3, "CETRAN": 0.2},
+    "Orgao": {"DETRAN": 0.35, "PRF": 0.2, "SMM": 0.2, "DNIT": 0.15, "GOINFRA": 0.1},
+    "Pagamento": {"PIX": 0.45, "CARTAO": 0.3, "DINHEIRO": 0.25},
+    "Status": {"ANALISE": 0.5, "DEFERIDO": 0.25, "NEGADO": 0.2, None: 0.05},
+}
+AUTOS = ["BAFOMETRO", "ESTACIONAMENTO", "VELOCIDADE", "CELULAR", "CINTO", "SINAL VERMELHO", "ULTRAPASSAGEM"]
+VALORES = [350.0, 450.0, 650.0, 800.0, 1200.0, 1500.0, 2500.0]
+ANOS_DE_CONTRATOS = 3
+PROPORCAO_CNPJ = 0.1
+
+
+def _digito(digitos, pesos):
+    resto = (digitos * np.array(pesos)).sum(axis=1) % 11
+    return np.where(resto < 2, 0, 11 - resto)
+
+
+def _como_texto(digitos):
+    potencias = 10 ** np.arange(digitos.shape[1] - 1, -1, -1, dtype=np.int64)
+    return pd.Series(digitos.astype(np.int64) @ potencias).astype(str).str.zfill(digitos.shape[1])
+
+
+def gerar_cpfs(n, rng):
+    digitos = rng.integers(0, 10, size=(n, 9))
+    digitos = np.column_stack([digitos, _digito(digitos, range(10, 1, -1))])
+    digitos = np.column_stack([digitos, _digito(digitos, range(11, 1, -1))])
+    return _como_texto(digitos)
+
+
+def gerar_cnpjs(n, rng):
+    digitos = np.column_stack([rng.integers(0, 10, size=(n, 8)), np.tile([0, 0, 0, 1], (n, 1))])
+    digitos = np.column_stack([digitos, _digito(digitos, [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])])
+    digitos = np.column_stack([digitos, _digito(digitos, [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])])
+    return _como_texto(digitos)
+
+
+def _escolher(rng, distribuicao, n):
+    opcoes = list(distribuicao)
+    indices = rng.choice(len(opcoes), size=n, p=list(distribuicao.values()))
+    return np.array(opcoes, dtype=object)[indices]
+
+
+def _datas_iso(datas):
+    return pd.Series(datas).dt.strftime("%Y-%m-%d")
+
+
+# DataFrame com n clientes nas colunas do banco (datas em ISO, como são gravadas)
+def gerar_clientes(n, semente=42, hoje=None):
+    rng = np.random.default_rng(semente)
+    hoje = pd.Timestamp(hoje or pd.Timestamp.today().normalize())
+
+    nomes = (
+        pd.Series(np.array(PRIMEIROS_NOMES, dtype=object)[rng.integers(0, len(PRIMEIROS_NOMES), n)])
+        + " " + np.array(SOBRENOMES, dtype=object)[rng.integers(0, len(SOBRENOMES), n)]
+        + " " + np.array(SOBRENOMES, dtype=object)[rng.integers(0, len(SOBRENOMES), n)]
+    )
+    telefones = "629" + pd.Series(rng.integers(0, 10 ** 8, n)).astype(str).str.zfill(8)
+    tem_cnpj = rng.random(n) < PROPORCAO_CNPJ
+
+    contrato = hoje - pd.to_timedelta(rng.integers(0, 365 * ANOS_DE_CONTRATOS, n), unit="D")
+    entrada = contrato + pd.to_timedelta(rng.integers(0, 11, n), unit="D")
+    efeito = entrada + pd.to_timedelta(rng.integers(5, 91, n), unit="D")
+
+    dados = pd.DataFrame({
+        "Nome": nomes,
+        "Telefone": telefones,
+        "CPF": gerar_cpfs(n, rng).where(~tem_cnpj),
+        "CNPJ": gerar_cnpjs(n, rng).where(tem_cnpj),
+        "DT_contrato": _datas_iso(contrato),
+        "Tipo_de_Processo": _escolher(rng, DISTRIBUICOES["Tipo_de_Processo"], n),
+        "Orgao": _escolher(rng, DISTRIBUICOES["Orgao"], n),
+        "Auto_infracao": np.array(AUTOS, dtype=object)[rng.integers(0, len(AUTOS), n)],
+        "Num_Processo": pd.Series(rng.integers(1000, 10 ** 7, n)).astype(str),
+        "Pagamento": _escolher(rng, DISTRIBUICOES["Pagamento"], n),
+        "Valor": np.array(VALORES)[rng.integers(0, len(VALORES), n)],
+        "DT_Entrada_CT": _datas_iso(entrada),
+        "DT_Efeito_Susp": _datas_iso(efeito),
+        "Status": _escolher(rng, DISTRIBUICOES["Status"], n),
+    })
+    return dados
+
+
+# Linhas prontas para armazenamento.inserir_linhas (tuplas na ordem das colunas, None nos vazios)
+def como_linhas(dados):
+    dados = dados.astype(object)
+    return list(dados.where(dados.notna(), None).itertuples(index=False, name=None))
@@ -0,0 +1,305 @@
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Benchmarks das operações das páginas sobre bases sintéticas de clientes (sem navegador).
+# Cada tamanho roda num processo novo, com banco, snapshot e cache de PDFs próprios;
+# as bases geradas ficam em benchmarks/dados/ e são reaproveitadas entre execuções.
+# O resultado de cada execução é acrescentado em benchmarks/historico.json e comparado
+# com a execução anterior do mesmo tamanho na mesma máquina: operações que ficaram mais
+# lentas que a tolerância são listadas como regressões (e o processo sai com código 1).
+#
+# Uso: python benchmarks/executar.py [tamanhos...] [--repeticoes N] [--sem-historico]
+#      ex.: python benchmarks/executar.py 1000 10000 100000 1000000
+PASTA = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(PASTA)
+PASTA_DADOS = os.path.join(PASTA, "dados")
+CAMINHO_HISTORICO = os.path.join(PASTA, "historico.json")
+
+TAMANHOS_PADRAO = [1000, 10000, 100000]
+REPETICOES_PADRAO = 5
+SEMENTE = 42
+LINHAS_PAGINA = 50  # linhas exibidas por página na Consulta
+RECIBOS_POR_MEDICAO = 20
+CLIENTES_NO_LOTE = 50
+CONSULTAS_BUSCA = ["silva", "maria sou", "conceicao", "bafometro", "123", "ALVES ROCHA"]
+
+# Uma operação só conta como regressão se ficar 20% mais lenta e pelo menos 5 ms mais lenta
+TOLERANCIA = 0.2
+DIFERENCA_MINIMA = 0.005
+
+
+def _caminhos(tamanho):
+    return {
+        "IVP_BANCO": os.path.join(PASTA_DADOS, f"clientes_{tamanho}.db"),
+        "IVP_SNAPSHOT": os.path.join(PASTA_DADOS, f"snapshot_{tamanho}"),
+        "IVP_CSV": os.path.join(PASTA_DADOS, "sem_csv_legado.csv"),
+    }
+
+
+# Apaga a base de um tamanho se estiver incompleta (geração interrompida ou semente diferente)
+def _base_pronta(caminhos, tamanho):
+    if not os.path.exists(caminhos["IVP_BANCO"]):
+        return False
+    with sqlite3.connect(caminhos["IVP_BANCO"]) as conexao:
+        try:
+            total = conexao.execute("SELECT COUNT(*) FROM clientes").fetchone()[0]
+        except sqlite3.Error:
+            total = None
+    conexao.close()
+    if total == tamanho:
+        return True
+    for sufixo in ("", "-wal", "-shm"):
+        if os.path.exists(caminhos["IVP_BANCO"] + sufixo):
+            os.remove(caminhos["IVP_BANCO"] + sufixo)
+    shutil.rmtree(caminhos["IVP_SNAPSHOT"], ignore_errors=True)
+    return False
+
+
+# Mediana de `repeticoes` execuções; `preparar`, se informado, roda antes de cada uma sem contar tempo
+def _cronometrar(funcao, repeticoes, preparar=None):
+    tempos = []
+    for _ in range(repeticoes):
+        if preparar:
+            preparar()
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+# Roda dentro do processo filho: as variáveis de ambiente já apontam para a base do tamanho
+def _medir(tamanho, repeticoes):
+    sys.path.insert(0, RAIZ)
+    sys.path.insert(0, PASTA)
+    os.chdir(RAIZ)
+    caminhos = _caminhos(tamanho)
+    pronta = _base_pronta(caminhos, tamanho)
+
+    import armazenamento
+    import busca
+    import cache_documentos
+    import dados_sinteticos
+    import documentos
+    import formatacao
+    import instantaneo
+    import prazos
+    import resumos
+
+    resultado = {"base": {}, "operacoes": {}}
+    if not pronta:
+        inicio = time.perf_counter()
+        linhas = dados_sinteticos.como_linhas(dados_sinteticos.gerar_clientes(tamanho, SEMENTE))
+        resultado["base"]["gerar"] = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        armazenamento.inserir_linhas(linhas)
+        resultado["base"]["inserir"] = time.perf_counter() - inicio
+    # Bases geradas antes do seq de eventos no manifesto também têm o snapshot refeito
+    if not pronta or instantaneo.carregar(anos=[]) is None:
+        inicio = time.perf_counter()
+        instantaneo.reconstruir()
+        resultado["base"]["snapshot"] = time.perf_counter() - inicio
+    resultado["base"]["bytes_banco"] = os.path.getsize(caminhos["IVP_BANCO"])
+
+    operacoes = resultado["operacoes"]
+
+    def medir(nome, funcao, preparar=None):
+        operacoes[nome] = _cronometrar(funcao, repeticoes, preparar)
+
+    # Carga (Consulta, Gerar e Financeiro partem daqui)
+    medir("carregar_sql", armazenamento.carregar_clientes)
+    medir("carregar_snapshot", instantaneo.carregar)
+    _, dados = instantaneo.carregar()
+    medir("consultar_pagina", lambda: armazenamento.consultar_pagina(0, LINHAS_PAGINA, "DT_Efeito_Susp"))
+
+    # Prazos: cálculo vetorizado em todos os registros, rótulos só na página exibida
+    medir("prazos_calcular", lambda: prazos.calcular_dias_restantes(dados))
+    dados["dias_restantes"] = prazos.calcular_dias_restantes(dados)
+    pagina = dados.head(LINHAS_PAGINA)
+    medir("prazos_rotular_pagina", lambda: prazos.rotular_prazos(pagina))
+    medir("prazos_vencidos", lambda: prazos.contar_vencidos(dados))
+
+    # Formatação para exibição
+    medir("formatar_pagina", lambda: formatacao.formatar_tabela(pagina))
+    medir("formatar_tudo", lambda: formatacao.formatar_tabela(dados))
+
+    # Busca: montagem do índice a partir do banco e consultas já com o índice pronto
+    medir("busca_indexar", busca.refazer_indice)
+    medir("busca_consultas", lambda: [busca.buscar_clientes(consulta) for consulta in CONSULTAS_BUSCA])
+
+    # Financeiro: período inteiro começando no meio de um mês (inclui as pontas somadas do banco)
+    inicio_periodo = resumos.primeira_data_contrato() + timedelta(days=10)
+    fim_periodo = date.today()
+    medir("financeiro_resumo", lambda: resumos.consultar_resumo(inicio_periodo, fim_periodo))
+    resumo = resumos.consultar_resumo(inicio_periodo, fim_periodo)
+    medir("financeiro_totais", lambda: [
+        resumos.totalizar(resumo, colunas) for colunas in (["Tipo_de_Processo"], ["Orgao"], ["Status"], ["mes"])
+    ])
+    medir(
+        "financeiro_faturamento",
+        lambda: resumos.faturamento_por_pagamento(inicio_periodo, fim_periodo),
+        resumos._faturamento_por_pagamento.cache_clear,
+    )
+
+    # PDFs: sempre gerados de fato (cada medição começa com o cache de documentos vazio)
+    pasta_pdfs = tempfile.mkdtemp(prefix="ivp_benchmark_")
+
+    def cache_vazio():
+        shutil.rmtree(pasta_pdfs, ignore_errors=True)
+        cache_documentos.PASTA = pasta_pdfs
+        cache_documentos._tamanho_estimado = None
+
+    lote = dados.head(CLIENTES_NO_LOTE)
+    recibos = [documentos._dados_documento(cliente) for _, cliente in dados.head(RECIBOS_POR_MEDICAO).iterrows()]
+    try:
+        medir("pdf_recibos", lambda: [documentos.gerar_recibo(*campos) for campos in recibos], cache_vazio)
+        medir("pdf_lote", lambda: documentos.gerar_lote(lote, ["recibo", "contrato"], "pdf"), cache_vazio)
+        medir("pdf_lote_zip", lambda: documentos.gerar_lote(lote, ["recibo", "contrato"], "zip"), cache_vazio)
+    finally:
+        shutil.rmtree(pasta_pdfs, ignore_errors=True)
+    return resultado
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Identifica a máquina da medição (nome, sistema, arquitetura e processadores); tempos
+# medidos em máquinas diferentes não são comparados entre si
+def _maquina():
+    return f"{platform.node()} ({platform.system()} {platform.machine()}, {os.cpu_count()} CPUs)"
+
+
+def carregar_historico():
+    if not os.path.exists(CAMINHO_HISTORICO):
+        return []
+    with open(CAMINHO_HISTORICO, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+
+def _gravar_historico(historico):
+    temporario = CAMINHO_HISTORICO + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(historico, arquivo, ensure_ascii=False, indent=1)
+    os.replace(temporario, CAMINHO_HISTORICO)
+
+
+# Última medição de cada tamanho no histórico, só entre as feitas na mesma máquina
+def _anteriores(historico, maquina):
+    anteriores = {}
+    for execucao in historico:
+        if execucao.get("maquina") != maquina:
+            continue
+        for tamanho, medicao in execucao["tamanhos"].items():
+            anteriores[tamanho] = (execucao.get("commit"), medicao["operacoes"])
+    return anteriores
+
+
+# Tamanhos sem medição anterior nesta máquina, mas medidos em outras: {tamanho: máquinas}
+def _outras_maquinas(execucao, historico):
+    anteriores = _anteriores(historico, execucao["maquina"])
+    outras = {}
+    for anterior in historico:
+        if anterior.get("maquina") == execucao["maquina"]:
+            continue
+        for tamanho in anterior["tamanhos"]:
+            if tamanho in execucao["tamanhos"] and tamanho not in anteriores:
+                outras.setdefault(tamanho, set()).add(anterior.get("maquina") or "desconhecida")
+    return outras
+
+
+# Operações mais lentas que na execução anterior do mesmo tamanho e da mesma máquina:
+# (tamanho, operação, antes, agora)
+def comparar(execucao, historico):
+    anteriores = _anteriores(historico, execucao["maquina"])
+    regressoes = []
+    for tamanho, medicao in execucao["tamanhos"].items():
+        if tamanho not in anteriores:
+            continue
+        for operacao, agora in medicao["operacoes"].items():
+            antes = anteriores[tamanho][1].get(operacao)
+            if antes is not None and agora > antes * (1 + TOLERANCIA) and agora - antes > DIFERENCA_MINIMA:
+                regressoes.append((tamanho, operacao, antes, agora))
+    return regressoes
+
+
+def _imprimir(execucao, historico):
+    anteriores = _anteriores(historico, execucao["maquina"])
+    for tamanho, maquinas in _outras_maquinas(execucao, historico).items():
+        print(
+            f"Aviso: {tamanho} clientes só tem medições de outra máquina ({', '.join(sorted(maquinas))}); "
+            f"sem comparação nesta execução ({execucao['maquina']}).",
+            file=sys.stderr,
+        )
+    for tamanho, medicao in execucao["tamanhos"].items():
+        commit_anterior, antes = anteriores.get(tamanho, (None, {}))
+        titulo = f"{int(tamanho):,} clientes".replace(",", ".")
+        print(f"\n{titulo}" + (f" (comparado a {commit_anterior})" if antes else ""))
+        for etapa, valor in medicao["base"].items():
+            if etapa != "bytes_banco":
+                print(f"  base/{etapa:<24}{valor * 1000:10.1f} ms")
+        for operacao, agora in medicao["operacoes"].items():
+            linha = f"  {operacao:<29}{agora * 1000:10.1f} ms"
+            if operacao in antes:
+                linha += f"   {(agora / antes[operacao] - 1) * 100:+6.0f}%"
+            print(linha)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 3 and sys.argv[1] == "--interno":
+        print(json.dumps(_medir(int(sys.argv[2]), int(sys.argv[3]))))
+        sys.exit()
+
+    argumentos = sys.argv[1:]
+    repeticoes = REPETICOES_PADRAO
+    if "--repeticoes" in argumentos:
+        posicao = argumentos.index("--repeticoes")
+        repeticoes = int(argumentos[posicao + 1])
+        del argumentos[posicao:posicao + 2]
+    gravar = "--sem-historico" not in argumentos
+    tamanhos = [int(a) for a in argumentos if a != "--sem-historico"] or TAMANHOS_PADRAO
+
+    os.makedirs(PASTA_DADOS, exist_ok=True)
+    execucao = {
+        "quando": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "maquina": _maquina(),
+        "repeticoes": repeticoes,
+        "tamanhos": {},
+    }
+    for tamanho in tamanhos:
+        print(f"Medindo {tamanho} clientes...", file=sys.stderr)
+        ambiente = dict(os.environ, **_caminhos(tamanho))
+        saida = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--interno", str(tamanho), str(repeticoes)],
+            capture_output=True, text=True, env=ambiente,
+        )
+        if saida.returncode != 0:
+            sys.exit(f"Falha ao medir {tamanho} clientes:\n{saida.stderr}")
+        execucao["tamanhos"][str(tamanho)] = json.loads(saida.stdout.strip().splitlines()[-1])
+
+    historico = carregar_historico()
+    _imprimir(execucao, historico)
+    regressoes = comparar(execucao, historico)
+    if gravar:
+        historico.append(execucao)
+        _gravar_historico(historico)
+    if regressoes:
+        print("\nRegressões:")
+        for tamanho, operacao, antes, agora in regressoes:
+            print(f"  {tamanho} clientes / {operacao}: {antes * 1000:.1f} ms -> {agora * 1000:.1f} ms")
+        sys.exit(1)
@@ -0,0 +1,228 @@
+import bisect
+import heapq
+import json
+import logging
+import re
+import threading
+import unicodedata
+
+import armazenamento
+import eventos
+import particoes
+
+# Índice de busca de clientes compartilhado pelo processo.
+# Cada campo pesquisável é quebrado em termos normalizados (sem acento, minúsculos);
+# os termos ficam numa lista ordenada (busca por prefixo) e num índice de trigramas
+# (busca por trecho do termo). Cada termo aponta para os ids dos clientes que o contêm.
+# O índice é montado em segundo plano (iniciar, chamado na preparação do processo); as
+# páginas só aplicam os eventos novos e nunca esperam o índice ser refeito do zero.
+CAMPOS_BUSCA = ["Nome", "CPF", "CNPJ", "Auto_infracao", "Num_Processo"]
+# Termos mais curtos que isso só casam por inteiro (sem expandir prefixos nem trechos)
+TAMANHO_MINIMO = 3
+
+log = logging.getLogger("ivp.busca")
+
+_SO_DOCUMENTO = re.compile(r"^[\d.\-/\s]+$")
+_NAO_ALFANUMERICO = re.compile(r"[^0-9a-z]+")
+
+
+# Remove acentos e pontuação: "ASSUNÇÃO" -> "assuncao"
+def normalizar(texto):
+    texto = str(texto)
+    if not texto.isascii():
+        texto = unicodedata.normalize("NFKD", texto)
+        texto = "".join(c for c in texto if not unicodedata.combining(c))
+    texto = texto.lower()
+    return _NAO_ALFANUMERICO.sub(" ", texto).strip()
+
+
+# Termos de uma consulta; números de documento digitados com máscara viram só dígitos
+def termos_da_consulta(consulta):
+    if _SO_DOCUMENTO.match(consulta) and any(c.isdigit() for c in consulta):
+        return [re.sub(r"\D", "", consulta)]
+    return normalizar(consulta).split()
+
+
+def _trigramas(termo):
+    return {termo[i:i + 3] for i in range(len(termo) - 2)}
+
+
+class IndiceBusca:
+    def __init__(self):
+        self._trava = threading.Lock()
+        self._ids_por_termo = {}
+        self._termos_ordenados = []
+        self._termos_por_trigrama = {}
+        self._termos_por_id = {}
+        self.seq = None  # último evento do banco já aplicado (eventos.py)
+
+    # Inclui (ou substitui) vários clientes de uma vez; os termos novos são ordenados uma única vez
+    def adicionar_varios(self, itens):
+        preparados = []
+        for id_cliente, registro in itens:
+            termos = set()
+            for campo in CAMPOS_BUSCA:
+                valor = registro.get(campo)
+                if valor is not None and valor == valor:  # ignora None e NaN
+                    termos.update(normalizar(valor).split())
+            preparados.append((id_cliente, termos))
+        with self._trava:
+            termos_novos = set()
+            for id_cliente, termos in preparados:
+                self._remover(id_cliente)
+                self._termos_por_id[id_cliente] = termos
+                for termo in termos:
+                    ids = self._ids_por_termo.get(termo)
+                    if ids is None:
+                        ids = self._ids_por_termo[termo] = set()
+                        termos_novos.add(termo)
+                        for trigrama in _trigramas(termo):
+                            self._termos_por_trigrama.setdefault(trigrama, set()).add(termo)
+                    ids.add(id_cliente)
+            if len(termos_novos) == 1:
+                bisect.insort(self._termos_ordenados, termos_novos.pop())
+            elif termos_novos:
+                self._termos_ordenados = sorted(set(self._termos_ordenados) | termos_novos)
+
+    def remover(self, id_cliente):
+        with self._trava:
+            self._remover(id_cliente)
+
+    def _remover(self, id_cliente):
+        for termo in self._termos_por_id.pop(id_cliente, ()):
+            ids = self._ids_por_termo[termo]
+            ids.discard(id_cliente)
+            if not ids:
+                del self._ids_por_termo[termo]
+                del self._termos_ordenados[bisect.bisect_left(self._termos_ordenados, termo)]
+                for trigrama in _trigramas(termo):
+                    termos = self._termos_por_trigrama[trigrama]
+                    termos.discard(termo)
+                    if not termos:
+                        del self._termos_por_trigrama[trigrama]
+
+    # Termos do índice que começam com ou contêm o termo buscado; termos mais curtos que
+    # TAMANHO_MINIMO só casam com o termo idêntico
+    def _termos_compativeis(self, termo):
+        if len(termo) < TAMANHO_MINIMO:
+            return {termo} if termo in self._ids_por_termo else set()
+        inicio = bisect.bisect_left(self._termos_ordenados, termo)
+        fim = bisect.bisect_left(self._termos_ordenados, termo + "\uffff")
+        encontrados = set(self._termos_ordenados[inicio:fim])
+        candidatos = None
+        for trigrama in _trigramas(termo):
+            termos = self._termos_por_trigrama.get(trigrama, set())
+            candidatos = termos if candidatos is None else candidatos & termos
+            if not candidatos:
+                break
+        encontrados.update(t for t in candidatos or () if termo in t)
+        return encontrados
+
+    # Ids dos clientes que casam com todos os termos da consulta, em ordem de cadastro
+    def buscar(self, consulta, limite=200):
+        termos = termos_da_consulta(consulta)
+        if not termos:
+            return []
+        with self._trava:
+            conjuntos = []
+            for termo in termos:
+                ids = [self._ids_por_termo[t] for t in self._termos_compativeis(termo)]
+                if not ids:
+                    return []
+                conjuntos.append(ids[0] if len(ids) == 1 else set().union(*ids))
+            # Começa pelo termo mais seletivo para as interseções ficarem pequenas
+            conjuntos.sort(key=len)
+            resultado = conjuntos[0]
+            for ids in conjuntos[1:]:
+                resultado = resultado & ids
+                if not resultado:
+                    return []
+            return heapq.nsmallest(limite, resultado)
+
+    def __len__(self):
+        return len(self._termos_por_id)
+
+
+_indices = {}  # um índice por escritório
+_preparando = set()  # escritórios com o índice sendo refeito em segundo plano
+_trava_atualizacao = threading.Lock()
+LIMITE_DELTA = 20000  # acima disso o índice é refeito do zero
+
+_SQL_CAMPOS = f"SELECT id, {', '.join(CAMPOS_BUSCA)} FROM clientes"
+
+
+# Monta o índice do escritório em uso a partir de todos os clientes e passa a usá-lo
+def refazer_indice():
+    seq = eventos.ultimo()
+    indice = IndiceBusca()
+    linhas = armazenamento.conectar().execute(_SQL_CAMPOS).fetchall()
+    indice.adicionar_varios((linha[0], dict(zip(CAMPOS_BUSCA, linha[1:]))) for linha in linhas)
+    indice.seq = seq
+    with _trava_atualizacao:
+        _indices[particoes.atual()] = indice
+    return indice
+
+
+def _refazer_em(escritorio):
+    try:
+        with particoes.em(escritorio):
+            refazer_indice()
+    except Exception:
+        log.exception("Falha ao montar o índice de busca de %s", escritorio)
+    finally:
+        with _trava_atualizacao:
+            _preparando.discard(escritorio)
+
+
+# Refaz o índice do escritório numa thread (se já não estiver sendo refeito)
+def preparar(escritorio=None):
+    escritorio = escritorio or particoes.atual()
+    with _trava_atualizacao:
+        if escritorio in _preparando:
+            return
+        _preparando.add(escritorio)
+    threading.Thread(target=_refazer_em, args=(escritorio,), name="ivp-busca", daemon=True).start()
+
+
+# Monta em segundo plano os índices de todos os escritórios (chamado na preparação do processo)
+def iniciar():
+    for escritorio in particoes.ESCRITORIOS:
+        with _trava_atualizacao:
+            pronto = escritorio in _indices
+        if not pronto:
+            preparar(escritorio)
+
+
+# Deixa o índice do escritório em uso em dia com o banco: aplica só os eventos de inserção,
+# exclusão e alteração de campos pesquisáveis desde o último aplicado. Se os eventos não
+# estiverem mais disponíveis (ou forem muitos), o índice é refeito em segundo plano e,
+# enquanto isso, a busca usa o índice anterior. Retorna None se ainda não há índice.
+def atualizar_indice():
+    seq = eventos.ultimo()
+    refazer = False
+    with _trava_atualizacao:
+        indice = _indices.get(particoes.atual())
+        if indice is None or indice.seq == seq:
+            refazer = indice is None
+        else:
+            delta = eventos.alteracoes(indice.seq, CAMPOS_BUSCA, LIMITE_DELTA)
+            if delta is None:
+                refazer = True
+            else:
+                seq, alterados, excluidos = delta
+                for id_cliente in alterados | excluidos:
+                    indice.remover(id_cliente)
+                linhas = armazenamento.conectar().execute(
+                    f"{_SQL_CAMPOS} WHERE id IN (SELECT value FROM json_each(?))", (json.dumps(sorted(alterados)),)
+                ).fetchall()
+                indice.adicionar_varios((linha[0], dict(zip(CAMPOS_BUSCA, linha[1:]))) for linha in linhas)
+                indice.seq = seq
+    if refazer:
+        preparar()
+    return indice
+
+
+# Função de busca usada pelas páginas; None enquanto o índice ainda está sendo montado
+def buscar_clientes(consulta, limite=200):
+    indice = atualizar_indice()
+    return None if indice is None else indice.buscar(consulta, limite)
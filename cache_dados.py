@@ -0,0 +1,89 @@
+import threading
+
+import armazenamento
+import esquema
+import eventos
+import instantaneo
+import metricas
+import particoes
+
+# Cache único do processo: todas as sessões e páginas compartilham o mesmo DataFrame de cada
+# escritório. A primeira leitura vem do snapshot Parquet, completado com os clientes que
+# mudaram depois dele; a cada gravação, só os clientes que mudaram (pelo registro de eventos)
+# são relidos do banco e trocados no cache. Com mais de LIMITE_DELTA eventos pendentes o
+# cache é recarregado inteiro. Sem snapshot utilizável (ainda não gerado, ou atrasado além
+# de LIMITE_DELTA eventos) os clientes vêm do banco e um snapshot novo é pedido à thread de
+# atualização; a página nunca espera o snapshot ser reescrito.
+LIMITE_DELTA = 5000
+
+_trava = threading.Lock()
+_cache = {}  # escritório -> {"seq", "dados", "status"}
+
+
+# Quantidade de clientes por Status, do maior para o menor ('Sem status' para os vazios)
+def _contar_status(dados):
+    return dados["Status"].astype(object).fillna("Sem status").value_counts()
+
+
+def _recarregar(cache):
+    with metricas.etapa("cache_dados.recarregar"):
+        snapshot = instantaneo.carregar()
+        delta = None if snapshot is None else eventos.alteracoes(snapshot[0], limite=LIMITE_DELTA)
+        if delta is None:
+            seq = eventos.ultimo()
+            cache["dados"] = armazenamento.carregar_clientes()
+            cache["seq"] = seq
+            cache["status"] = _contar_status(cache["dados"])
+            instantaneo.agendar()
+        else:
+            cache["seq"], cache["dados"] = snapshot
+            cache["status"] = _contar_status(cache["dados"])
+            _aplicar(cache, *delta)
+    metricas.contar("cache_dados.recargas")
+
+
+# Troca no cache só os clientes que mudaram; a contagem por Status é ajustada com as
+# linhas que saíram e as que entraram, sem recontar todos os clientes
+def _aplicar(cache, seq, alterados, excluidos):
+    with metricas.etapa("cache_dados.delta"):
+        dados = cache["dados"]
+        afetados = dados.index.isin(alterados | excluidos)
+        status = cache["status"].sub(_contar_status(dados[afetados]), fill_value=0)
+        dados = dados[~afetados]
+        if alterados:
+            novos = armazenamento.carregar_por_ids(sorted(alterados))
+            status = status.add(_contar_status(novos), fill_value=0)
+            dados = esquema.concatenar([dados, novos]).sort_index()
+        cache["dados"] = dados
+        cache["status"] = status[status > 0].astype("int64").sort_values(ascending=False)
+    cache["seq"] = seq
+    metricas.contar("cache_dados.deltas")
+
+
+# Cache do escritório em uso, em dia com o último evento do banco
+def _atualizado():
+    seq = eventos.ultimo()
+    with _trava:
+        cache = _cache.setdefault(particoes.atual(), {"seq": None, "dados": None, "status": None})
+        if cache["seq"] != seq:
+            delta = None if cache["seq"] is None else eventos.alteracoes(cache["seq"], limite=LIMITE_DELTA)
+            if delta is None:
+                _recarregar(cache)
+            else:
+                _aplicar(cache, *delta)
+        return cache["dados"], cache["status"]
+
+
+# Função para obter os clientes já tipados (datas convertidas, 'Valor' numérico)
+def obter_clientes():
+    dados, _ = _atualizado()
+    # Cópia rasa: cada sessão recebe sua própria "visão" sem duplicar os dados
+    # (o copy-on-write é ligado por aplicacao.preparar)
+    return dados.copy(deep=False)
+
+
+# Quantidade de clientes por Status (para o gráfico de distribuição e o total da tabela),
+# mantida junto com o cache: sem gravações novas, não percorre os clientes
+def contar_por_status():
+    _, status = _atualizado()
+    return status.copy()
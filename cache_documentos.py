@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+import threading
+
+import metricas
+
+# Cache em disco dos PDFs gerados, endereçado pelo conteúdo: cada documento é gravado
+# sob o hash da versão do modelo e dos dados de entrada, então o mesmo recibo pedido de
+# novo é servido do disco sem passar pelo FPDF. Os arquivos menos usados recentemente
+# são apagados quando a pasta passa do limite de tamanho. Os processos do pool de
+# renderização (renderizacao.py) só gravam: cada um conheceria só o que ele mesmo gravou,
+# então quem confere o tamanho real da pasta e apaga os antigos é o processo principal.
+PASTA = os.environ.get("IVP_CACHE_DOCUMENTOS", os.path.join(".cache", "documentos"))
+LIMITE_BYTES = int(os.environ.get("IVP_CACHE_DOCUMENTOS_MB", "200")) * 1024 * 1024
+
+_trava = threading.Lock()
+_tamanho_estimado = None
+_limitar = True
+
+
+# Hash que identifica um documento (qualquer valor serializável em JSON ou texto)
+def chave(*partes):
+    texto = json.dumps(partes, default=str, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _caminho(chave_documento):
+    return os.path.join(PASTA, chave_documento[:2], chave_documento + ".pdf")
+
+
+# Conteúdo em cache ou None; um acerto marca o arquivo como usado agora (para o LRU)
+def obter(chave_documento):
+    caminho = _caminho(chave_documento)
+    try:
+        with open(caminho, "rb") as arquivo:
+            conteudo = arquivo.read()
+    except FileNotFoundError:
+        metricas.contar("cache_documentos.faltas")
+        return None
+    metricas.contar("cache_documentos.acertos")
+    try:
+        os.utime(caminho)
+    except FileNotFoundError:
+        pass
+    return conteudo
+
+
+def guardar(chave_documento, conteudo):
+    global _tamanho_estimado
+    caminho = _caminho(chave_documento)
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(conteudo)
+    os.replace(temporario, caminho)
+    if not _limitar:
+        return
+    with _trava:
+        if _tamanho_estimado is None:
+            _tamanho_estimado = sum(tamanho for _, _, tamanho in _arquivos())
+        else:
+            _tamanho_estimado += len(conteudo)
+        if _tamanho_estimado > LIMITE_BYTES:
+            _tamanho_estimado = _liberar_espaco(int(LIMITE_BYTES * 0.9))
+
+
+# Chamado nos processos do pool de renderização: gravam sem conferir o limite
+def desativar_limite():
+    global _limitar
+    _limitar = False
+
+
+# Soma o tamanho real da pasta (o que todos os processos gravaram) e apaga os menos usados se passou do limite
+def conferir_tamanho():
+    global _tamanho_estimado
+    with _trava:
+        _tamanho_estimado = sum(tamanho for _, _, tamanho in _arquivos())
+        if _tamanho_estimado > LIMITE_BYTES:
+            _tamanho_estimado = _liberar_espaco(int(LIMITE_BYTES * 0.9))
+
+
+# (momento do último uso, caminho, tamanho) de cada PDF em cache
+def _arquivos():
+    encontrados = []
+    for pasta, _, nomes in os.walk(PASTA):
+        for nome in nomes:
+            if not nome.endswith(".pdf"):
+                continue
+            caminho = os.path.join(pasta, nome)
+            try:
+                estado = os.stat(caminho)
+            except FileNotFoundError:
+                continue
+            encontrados.append((estado.st_mtime, caminho, estado.st_size))
+    return encontrados
+
+
+# Apaga os arquivos usados há mais tempo até o total caber no limite; retorna o novo total
+def _liberar_espaco(limite):
+    arquivos = sorted(_arquivos())
+    total = sum(tamanho for _, _, tamanho in arquivos)
+    for _, caminho, tamanho in arquivos:
+        if total <= limite:
+            break
+        try:
+            os.remove(caminho)
+            total -= tamanho
+        except FileNotFoundError:
+            pass
+    return total
+
+
+# Busca no cache ou gera (e guarda) o documento
+def obter_ou_gerar(chave_documento, gerar):
+    conteudo = obter(chave_documento)
+    if conteudo is None:
+        conteudo = gerar()
+        guardar(chave_documento, conteudo)
+    return conteudo
@@ -0,0 +1,206 @@
+import io
+import os
+import threading
+import zipfile
+from datetime import datetime
+
+import pandas as pd
+from fpdf import FPDF
+
+import cache_documentos
+import formatacao
+
+# Geração dos documentos em PDF (recibo e contrato) com papel timbrado
+TIMBRADO = "timbrado.jpg"
+TIPOS_DOCUMENTO = {"recibo": "Recibo", "contrato": "Contrato de Serviço"}
+
+# Aumente ao mudar o layout de algum documento: invalida os PDFs já guardados em cache
+VERSAO_MODELO = 1
+
+# O timbrado original tem ~470 dpi (3875x5480). Para impressão em A4 basta 150 dpi,
+# então uma cópia reduzida é gerada uma vez e reaproveitada por todos os documentos.
+PASTA_CACHE = os.environ.get("IVP_CACHE", ".cache")
+DPI_TIMBRADO = 150
+QUALIDADE_TIMBRADO = 80
+A4_MM = (210, 297)
+
+_trava_timbrado = threading.Lock()
+_timbrado_preparado = {}
+
+
+# Caminho do timbrado reduzido para A4; refaz a cópia se o original mudar
+def preparar_timbrado(original=TIMBRADO):
+    estado = os.stat(original)
+    chave = (original, estado.st_mtime_ns, estado.st_size)
+    with _trava_timbrado:
+        if chave not in _timbrado_preparado:
+            from PIL import Image
+
+            tamanho = tuple(round(mm / 25.4 * DPI_TIMBRADO) for mm in A4_MM)
+            destino = os.path.join(PASTA_CACHE, f"timbrado_a4_{DPI_TIMBRADO}dpi_{estado.st_mtime_ns}.jpg")
+            if not os.path.exists(destino):
+                os.makedirs(PASTA_CACHE, exist_ok=True)
+                with Image.open(original) as imagem:
+                    reduzida = imagem.convert("RGB").resize(tamanho, Image.LANCZOS)
+                temporario = destino + ".tmp"
+                reduzida.save(temporario, "JPEG", quality=QUALIDADE_TIMBRADO, optimize=True)
+                os.replace(temporario, destino)
+            _timbrado_preparado[chave] = destino
+        return _timbrado_preparado[chave]
+
+
+# FPDF que lê e decodifica cada JPEG uma única vez por processo: todos os documentos
+# reaproveitam o mesmo objeto de imagem já codificado (só o índice dentro do PDF muda).
+class PDFTimbrado(FPDF):
+    _jpegs = {}
+    _trava_jpegs = threading.Lock()
+
+    def _parsejpg(self, filename):
+        with self._trava_jpegs:
+            if filename not in self._jpegs:
+                self._jpegs[filename] = FPDF._parsejpg(self, filename)
+            return dict(self._jpegs[filename])
+
+
+# Nova página A4 com o papel timbrado de fundo
+def _nova_pagina(pdf):
+    pdf.add_page()
+    # Adiciona a imagem de fundo (papel timbrado)
+    pdf.image(preparar_timbrado(), x=0, y=0, w=A4_MM[0], h=A4_MM[1])
+
+
+def _escrever_recibo(pdf, nome, valor, data):
+    _nova_pagina(pdf)
+
+    # Conteúdo do recibo
+    pdf.set_font("Arial", size=12)
+    pdf.ln(20)
+    pdf.cell(200, 30, txt="Recibo de Pagamento", ln=True, align='C')
+    pdf.ln(20)
+    pdf.cell(200, 20, txt=f"Recebi de {nome}", ln=True)
+    pdf.cell(200, 20, txt=f"A quantia de: {formatacao.formatar_moeda(valor)}", ln=True)
+    pdf.cell(200, 20, txt=f"Em: {data}", ln=True)
+
+
+def _escrever_contrato(pdf, nome, servico, valor, data):
+    _nova_pagina(pdf)
+
+    # Conteúdo do contrato
+    pdf.set_font("Arial", size=14)
+    pdf.ln(20)
+    pdf.cell(200, 30, txt="Contrato de Prestação de Serviços", ln=True, align='C')
+    pdf.ln(12)
+    pdf.cell(200, 12, txt=f"Contratante: {nome}", ln=True)
+
+    # Use multi_cell para o campo 'Serviço' para que o texto quebre de acordo com a largura
+    pdf.multi_cell(200, 12, txt=f"Serviço: {servico}", align='L')
+
+    pdf.cell(200, 12, txt=f"Valor: {formatacao.formatar_moeda(valor)}", ln=True)
+    pdf.cell(200, 12, txt=f"Data: {data}", ln=True)
+    pdf.cell(200, 50, txt="Assinatura", ln=True, align='C')
+
+
+def _bytes(pdf):
+    return pdf.output(dest='S').encode('latin1')
+
+
+# Hash de um documento: versão do modelo, timbrado em uso, tipo e campos preenchidos
+def chave_documento(tipo, *campos):
+    estado = os.stat(TIMBRADO)
+    return cache_documentos.chave(VERSAO_MODELO, estado.st_mtime_ns, estado.st_size, tipo, *campos)
+
+
+def _normalizar_valor(valor):
+    return round(float(valor), 2)
+
+
+def chave_recibo(nome, valor, data):
+    return chave_documento("recibo", nome, _normalizar_valor(valor), data)
+
+
+def chave_contrato(nome, servico, valor, data):
+    return chave_documento("contrato", nome, servico, _normalizar_valor(valor), data)
+
+
+# Função para gerar um PDF de recibo com papel timbrado (repetições saem do cache)
+def gerar_recibo(nome, valor, data):
+    valor = _normalizar_valor(valor)
+
+    def gerar():
+        pdf = PDFTimbrado()
+        _escrever_recibo(pdf, nome, valor, data)
+        return _bytes(pdf)
+
+    return cache_documentos.obter_ou_gerar(chave_recibo(nome, valor, data), gerar)
+
+
+# Função para gerar um PDF de contrato de serviço com papel timbrado (repetições saem do cache)
+def gerar_contrato(nome, servico, valor, data):
+    valor = _normalizar_valor(valor)
+
+    def gerar():
+        pdf = PDFTimbrado()
+        _escrever_contrato(pdf, nome, servico, valor, data)
+        return _bytes(pdf)
+
+    return cache_documentos.obter_ou_gerar(chave_contrato(nome, servico, valor, data), gerar)
+
+
+# Descrição do serviço usada nos contratos em lote, montada a partir do processo do cliente
+def descrever_servico(cliente):
+    partes = [f"Recurso {cliente['Tipo_de_Processo']}" if pd.notnull(cliente['Tipo_de_Processo']) else "Recurso"]
+    if pd.notnull(cliente['Orgao']):
+        partes.append(f"junto ao {cliente['Orgao']}")
+    if pd.notnull(cliente['Auto_infracao']):
+        partes.append(f"- auto de infração {cliente['Auto_infracao']}")
+    return " ".join(partes)
+
+
+# Campos de um cliente cadastrado usados nos documentos
+def _dados_documento(cliente):
+    data = cliente['DT_contrato'] if pd.notnull(cliente['DT_contrato']) else datetime.now()
+    valor = cliente['Valor'] if pd.notnull(cliente['Valor']) else 0
+    return cliente['Nome'], valor, data.strftime("%d/%m/%Y")
+
+
+# Percorre os documentos de um lote: (nome do arquivo, tipo, campos do documento)
+def _documentos_do_lote(clientes, tipos):
+    for id_cliente, cliente in clientes.iterrows():
+        nome, valor, data = _dados_documento(cliente)
+        for tipo in tipos:
+            if tipo == "recibo":
+                campos = (nome, _normalizar_valor(valor), data)
+            else:
+                campos = (nome, descrever_servico(cliente), _normalizar_valor(valor), data)
+            yield f"{tipo}_{id_cliente}_{nome}.pdf", tipo, campos
+
+
+_ESCRITORES = {"recibo": _escrever_recibo, "contrato": _escrever_contrato}
+_GERADORES = {"recibo": gerar_recibo, "contrato": gerar_contrato}
+
+
+# Gera os documentos escolhidos (tipos: "recibo" e/ou "contrato") para vários clientes de uma vez.
+# formato="pdf" junta tudo num único PDF (o timbrado é embutido uma vez só);
+# formato="zip" devolve um ZIP com um PDF por documento (cada um aproveita o cache).
+# progresso, se informado, é chamado com (feitos, total) a cada documento.
+def gerar_lote(clientes, tipos, formato="zip", progresso=None):
+    documentos = list(_documentos_do_lote(clientes, tipos))
+    if formato == "pdf":
+        def gerar():
+            pdf = PDFTimbrado()
+            for feitos, (_, tipo, campos) in enumerate(documentos, start=1):
+                _ESCRITORES[tipo](pdf, *campos)
+                if progresso:
+                    progresso(feitos, len(documentos))
+            return _bytes(pdf)
+
+        chave = chave_documento("lote", [(tipo, campos) for _, tipo, campos in documentos])
+        return cache_documentos.obter_ou_gerar(chave, gerar)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as arquivo_zip:
+        for feitos, (nome_arquivo, tipo, campos) in enumerate(documentos, start=1):
+            arquivo_zip.writestr(nome_arquivo, _GERADORES[tipo](*campos))
+            if progresso:
+                progresso(feitos, len(documentos))
+    return buffer.getvalue()
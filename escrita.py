@@ -0,0 +1,129 @@
+import queue
+import threading
+
+import armazenamento
+import eventos
+import instantaneo
+import metricas
+import particoes
+
+# Fila única de escrita: todas as sessões do Streamlit entregam suas gravações a uma
+# só thread, que as grava em lote numa única transação. Cada lote custa um único
+# fsync do WAL do SQLite (synchronous=FULL), e quem chamou só recebe a resposta
+# depois que o lote está em disco, então nenhum cadastro confirmado se perde.
+# Cada pedido leva o escritório de quem o enviou e é gravado no banco desse escritório.
+LOTE_MAXIMO = 256
+JANELA_LOTE = 0.005  # segundos esperando mais pedidos antes de gravar o lote
+
+
+class _Pedido:
+    def __init__(self, operacao):
+        self.operacao = operacao
+        self.escritorio = particoes.atual()
+        self.pronto = threading.Event()
+        self.resultado = None
+        self.erro = None
+
+
+_fila = queue.Queue()
+_trava = threading.Lock()
+_thread = None
+
+
+# Inicia a thread de escrita na primeira gravação do processo
+def _garantir_escritor():
+    global _thread
+    with _trava:
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(target=_escritor, name="ivp-escritor", daemon=True)
+            _thread.start()
+
+
+# Junta os pedidos que chegarem dentro da janela e grava tudo numa transação por escritório
+def _escritor():
+    conexoes = {}
+    while True:
+        lote = [_fila.get()]
+        while len(lote) < LOTE_MAXIMO:
+            try:
+                lote.append(_fila.get(timeout=JANELA_LOTE))
+            except queue.Empty:
+                break
+        _gravar_lote(conexoes, lote)
+
+
+def _gravar_lote(conexoes, lote):
+    metricas.contar("escrita.pedidos", len(lote))
+    por_escritorio = {}
+    for pedido in lote:
+        por_escritorio.setdefault(pedido.escritorio, []).append(pedido)
+    try:
+        with metricas.etapa("escrita.lote"):
+            for escritorio, pedidos in por_escritorio.items():
+                # Um escritório cujo banco não abre não derruba a thread nem os outros escritórios
+                try:
+                    with particoes.em(escritorio):
+                        if escritorio not in conexoes:
+                            conexoes[escritorio] = armazenamento.abrir_conexao(sincrono="FULL")
+                        _gravar_transacao(conexoes[escritorio], pedidos)
+                except Exception as erro:
+                    for pedido in pedidos:
+                        pedido.resultado, pedido.erro = None, erro
+    finally:
+        for pedido in lote:
+            pedido.pronto.set()
+
+
+def _gravar_transacao(conexao, lote):
+    try:
+        conexao.execute("BEGIN IMMEDIATE")
+        for pedido in lote:
+            # Um savepoint por pedido: um registro inválido não derruba o lote inteiro
+            conexao.execute("SAVEPOINT pedido")
+            try:
+                pedido.resultado = pedido.operacao(conexao)
+                conexao.execute("RELEASE pedido")
+            except Exception as erro:
+                conexao.execute("ROLLBACK TO pedido")
+                conexao.execute("RELEASE pedido")
+                pedido.erro = erro
+        eventos.compactar(conexao)
+        conexao.commit()
+    except Exception as erro:
+        conexao.rollback()
+        for pedido in lote:
+            pedido.resultado, pedido.erro = None, erro
+    else:
+        instantaneo.agendar()
+
+
+# Envia uma operação (função que recebe a conexão) para a fila e espera ela ser gravada
+def executar(operacao, timeout=30):
+    _garantir_escritor()
+    pedido = _Pedido(operacao)
+    _fila.put(pedido)
+    if not pedido.pronto.wait(timeout):
+        raise TimeoutError("A gravação não foi confirmada a tempo")
+    if pedido.erro is not None:
+        raise pedido.erro
+    return pedido.resultado
+
+
+# Função para gravar um novo cliente pela fila de escrita; retorna o id do registro
+def gravar_cliente(registro, timeout=30):
+    return executar(lambda conexao: armazenamento.inserir_cliente(registro, conexao), timeout)
+
+
+# Grava as edições da tabela da Consulta (alterações de Status e exclusões) numa só operação;
+# retorna os ids com conflito (Status alterado por outra pessoa)
+def salvar_edicoes(alteracoes, exclusoes, timeout=30):
+    def operacao(conexao):
+        conflitos = armazenamento.atualizar_status(alteracoes, conexao)
+        armazenamento.excluir_clientes(exclusoes, conexao)
+        return conflitos
+    return executar(operacao, timeout)
+
+
+# Grava de uma vez as linhas de uma importação em planilha (tudo ou nada, numa só transação)
+def importar_linhas(linhas, timeout=300):
+    return executar(lambda conexao: armazenamento.inserir_linhas(linhas, conexao), timeout)
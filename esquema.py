@@ -0,0 +1,106 @@
+import re
+
+import pandas as pd
+
+# Esquema único dos dados de clientes, usado pelo banco, pelo cache e por todas as páginas.
+# Os campos de escolha ficam como categóricos (um código pequeno por linha em vez de um
+# texto), os documentos como texto de tamanho fixo com os zeros à esquerda, as datas já
+# convertidas uma única vez na leitura, e as colunas só de exibição nunca entram nos dados.
+
+# Colunas gravadas para cada cliente, na mesma ordem do antigo clientes.csv
+COLUNAS = [
+    "Nome", "Telefone", "CPF", "CNPJ", "DT_contrato", "Tipo_de_Processo", "Orgao",
+    "Auto_infracao", "Num_Processo", "Pagamento", "Valor", "DT_Entrada_CT",
+    "DT_Efeito_Susp", "Status",
+]
+COLUNAS_DATA = ["DT_contrato", "DT_Entrada_CT", "DT_Efeito_Susp"]
+COLUNAS_TEXTO = ["Nome", "Telefone", "Auto_infracao", "Num_Processo"]
+
+# Opções aceitas nos campos de escolha do cadastro
+TIPOS_PROCESSO = ["JARI", "CETRAN", "DEFESA PRÉVIA"]
+ORGAOS = ["DNIT", "GOINFRA", "SMM", "DETRAN", "PRF"]
+PAGAMENTOS = ["DINHEIRO", "CARTAO", "PIX"]
+
+# Colunas categóricas e suas categorias conhecidas (valores antigos fora da lista são mantidos)
+CATEGORIAS = {
+    "Tipo_de_Processo": TIPOS_PROCESSO,
+    "Orgao": ORGAOS,
+    "Pagamento": PAGAMENTOS,
+    "Status": [],
+}
+
+# Quantidade de dígitos de cada documento (completados com zeros à esquerda)
+DIGITOS_DOCUMENTO = {"CPF": 11, "CNPJ": 14}
+
+# Colunas calculadas pelas páginas só para exibição; nunca são gravadas nem guardadas em cache
+COLUNAS_EXIBICAO = ["prazo", "Excluir", "dias_restantes"]
+
+TEXTO = pd.StringDtype("pyarrow")
+
+
+def _categorica(serie, categorias):
+    presentes = serie.dropna().astype(str)
+    extras = sorted(set(presentes.unique()) - set(categorias))
+    return pd.Series(
+        pd.Categorical(serie.where(serie.notna(), None), categories=list(categorias) + extras),
+        index=serie.index,
+    )
+
+
+# Documentos (CPF/CNPJ) são guardados só com os dígitos, completados com zeros à esquerda:
+# "123.456.789-01" -> "12345678901", 1234567890.0 (número lido de planilha) -> "01234567890".
+# As mesmas regras valem no cadastro, na importação e na leitura dos dados.
+_FINAL_DECIMAL = re.compile(r"\.0$")
+_NAO_DIGITO = re.compile(r"\D")
+
+
+def digitos_documento(serie):
+    texto = serie.astype(TEXTO).str.replace(_FINAL_DECIMAL.pattern, "", regex=True)
+    return texto.str.replace(_NAO_DIGITO.pattern, "", regex=True)
+
+
+# Um documento informado no cadastro, no formato gravado no banco (None se não tiver dígitos)
+def normalizar_documento(valor, coluna):
+    if valor is None or valor != valor:  # None ou NaN
+        return None
+    digitos = _NAO_DIGITO.sub("", _FINAL_DECIMAL.sub("", str(valor).strip()))
+    return digitos.zfill(DIGITOS_DOCUMENTO[coluna]) if digitos else None
+
+
+def _documento(serie, digitos):
+    texto = digitos_documento(serie)
+    texto = texto.where(texto != "")
+    return texto.str.zfill(digitos)
+
+
+# Converte um DataFrame de clientes (lido do banco ou de planilha) para os tipos do esquema.
+# Colunas fora do esquema (como as de exibição) são descartadas.
+def tipar(dados):
+    dados = dados[[coluna for coluna in COLUNAS if coluna in dados.columns]].copy()
+    for coluna in COLUNAS_DATA:
+        if coluna in dados and not pd.api.types.is_datetime64_any_dtype(dados[coluna]):
+            dados[coluna] = pd.to_datetime(dados[coluna], errors="coerce", format="%Y-%m-%d")
+    for coluna in COLUNAS_TEXTO:
+        if coluna in dados:
+            dados[coluna] = dados[coluna].astype(TEXTO)
+    for coluna, digitos in DIGITOS_DOCUMENTO.items():
+        if coluna in dados:
+            dados[coluna] = _documento(dados[coluna], digitos)
+    for coluna, categorias in CATEGORIAS.items():
+        if coluna in dados:
+            dados[coluna] = _categorica(dados[coluna], categorias)
+    if "Valor" in dados:
+        dados["Valor"] = pd.to_numeric(dados["Valor"], errors="coerce")
+    return dados
+
+
+# Junta partes de clientes já tipadas (ex.: o cache e os registros alterados) sem perder os
+# categóricos: as categorias de cada coluna viram a união das categorias das partes.
+def concatenar(partes):
+    partes = [parte for parte in partes if not parte.empty] or partes[:1]
+    if len(partes) > 1:
+        for coluna in CATEGORIAS:
+            if all(coluna in parte for parte in partes):
+                categorias = list(dict.fromkeys(c for parte in partes for c in parte[coluna].cat.categories))
+                partes = [parte.assign(**{coluna: parte[coluna].cat.set_categories(categorias)}) for parte in partes]
+    return pd.concat(partes)
@@ -0,0 +1,76 @@
+import os
+import sys
+
+import armazenamento
+import particoes
+
+# Registro de alterações dos clientes (tabela eventos, preenchida pelos gatilhos do banco).
+# Cada inserção, alteração ou exclusão recebe um número de sequência crescente; quem guarda
+# dados derivados (cache das páginas, índice de busca, prazos dos alertas) lembra o último
+# número aplicado e, na próxima leitura, busca só os clientes que mudaram desde então em vez
+# de recarregar tudo. O registro guarda os últimos MANTER eventos de cada escritório; quem
+# ficou mais para trás do que isso recebe None e refaz os seus dados do zero.
+MANTER = int(os.environ.get("IVP_EVENTOS_MANTER", "200000"))
+
+
+# Número do último evento do escritório em uso (0 se ainda não houve nenhum)
+def ultimo():
+    return armazenamento.conectar().execute("SELECT COALESCE(MAX(seq), 0) FROM eventos").fetchone()[0]
+
+
+# Eventos depois de `desde`, em ordem: lista de (seq, operação, id do cliente, colunas alteradas, quando)
+def listar(desde=0, limite=1000):
+    return armazenamento.conectar().execute(
+        "SELECT seq, operacao, id_cliente, colunas, quando FROM eventos WHERE seq > ? ORDER BY seq LIMIT ?",
+        (desde, limite),
+    ).fetchall()
+
+
+# Resume os eventos depois de `desde` em (último seq, ids inseridos ou alterados, ids excluídos).
+# Com `colunas`, alterações que não tocam nenhuma dessas colunas são ignoradas. Retorna None
+# quando os eventos necessários já foram descartados ou quando passam de `limite` (nesses casos
+# recarregar tudo sai mais barato).
+def alteracoes(desde, colunas=None, limite=None):
+    conexao = armazenamento.conectar()
+    primeiro, ate = conexao.execute("SELECT MIN(seq), COALESCE(MAX(seq), 0) FROM eventos").fetchone()
+    if desde == ate:
+        return ate, set(), set()
+    if desde > ate or primeiro is None or desde < primeiro - 1:
+        return None
+    if limite is not None and ate - desde > limite:
+        return None
+    colunas = set(colunas) if colunas else None
+    alterados, excluidos = set(), set()
+    linhas = conexao.execute(
+        "SELECT operacao, id_cliente, colunas FROM eventos WHERE seq > ? AND seq <= ? ORDER BY seq", (desde, ate)
+    )
+    for operacao, id_cliente, alteradas in linhas:
+        if operacao == "excluir":
+            alterados.discard(id_cliente)
+            excluidos.add(id_cliente)
+        elif operacao == "inserir" or colunas is None or colunas & set((alteradas or "").split(",")):
+            excluidos.discard(id_cliente)
+            alterados.add(id_cliente)
+    return ate, alterados, excluidos
+
+
+# Descarta os eventos mais antigos, mantendo os últimos `manter`. Chamado dentro da transação
+# de gravação (escrita.py), então o registro nunca cresce além do limite.
+def compactar(conexao, manter=None):
+    manter = MANTER if manter is None else manter
+    return conexao.execute(
+        "DELETE FROM eventos WHERE seq <= (SELECT MAX(seq) FROM eventos) - ?", (manter,)
+    ).rowcount
+
+
+if __name__ == "__main__":
+    # Uso: python eventos.py [desde] [--escritorio NOME]  -> lista os eventos depois do número informado
+    argumentos = sys.argv[1:]
+    if "--escritorio" in argumentos:
+        posicao = argumentos.index("--escritorio")
+        particoes.usar(argumentos[posicao + 1])
+        del argumentos[posicao:posicao + 2]
+    desde = int(argumentos[0]) if argumentos else 0
+    for seq, operacao, id_cliente, colunas, quando in listar(desde):
+        print(f"{seq:>8}  {quando}  {operacao:<8} #{id_cliente}" + (f"  ({colunas})" if colunas else ""))
+    print(f"Último evento de {particoes.atual()}: {ultimo()}")
@@ -0,0 +1,199 @@
+import csv
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import armazenamento
+import esquema
+import instantaneo
+import particoes
+import resumos
+
+# Exportação de relatórios do financeiro em segundo plano.
+# Cada pedido vira um trabalho com arquivo próprio em .cache/exportacoes (nada é gravado
+# na pasta do servidor nem compartilhado entre usuários). O relatório detalhado é lido do
+# banco e escrito em partes, então a memória usada não cresce com o tamanho do período.
+# Com vários escritórios, o resumo soma os resumos de cada um e o detalhado lê um banco
+# depois do outro, com a coluna Escritorio na frente.
+PASTA = os.environ.get("IVP_EXPORTACOES", os.path.join(".cache", "exportacoes"))
+LINHAS_POR_PARTE = 5000
+VALIDADE_EXPORTACAO = 60 * 60  # segundos que um arquivo exportado fica disponível
+
+FORMATOS = {
+    "csv": ("CSV", "text/csv"),
+    "xlsx": ("Excel (XLSX)", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "parquet": ("Parquet", "application/vnd.apache.parquet"),
+}
+CONTEUDOS = {"resumo": "Resumo mensal", "detalhado": "Clientes (detalhado)"}
+
+_trava = threading.Lock()
+_executor = None
+_trabalhos = {}
+
+
+class _Exportacao:
+    def __init__(self, caminho, total):
+        self.caminho = caminho
+        self.total = total
+        self.feitos = 0
+        self.criado = time.time()
+        self.futuro = None
+
+
+def _obter_executor():
+    global _executor
+    with _trava:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ivp-exportacao")
+        return _executor
+
+
+# Apaga exportações antigas (registro e arquivo)
+def _limpar_antigas():
+    limite = time.time() - VALIDADE_EXPORTACAO
+    with _trava:
+        antigas = [i for i, t in _trabalhos.items() if t.criado < limite]
+    for id_exportacao in antigas:
+        descartar(id_exportacao)
+
+
+# Partes do relatório: DataFrames com as colunas na ordem em que serão escritas
+def _partes(conteudo, inicio, fim, escritorios):
+    if conteudo == "resumo":
+        resumo = resumos.consultar_resumo(inicio, fim, escritorios)
+        yield resumo.rename(columns={"mes": "Mes_Ano", "valor_total": "Valor"})
+        return
+    for escritorio in escritorios:
+        with particoes.em(escritorio):
+            for parte in armazenamento.iterar_clientes(LINHAS_POR_PARTE, contrato_de=inicio, contrato_ate=fim):
+                parte = parte.reset_index()
+                if len(escritorios) > 1:
+                    parte.insert(0, "Escritorio", escritorio)
+                yield parte
+
+
+def _texto_planilha(parte):
+    # Datas como DD/MM/YYYY e vazios como célula vazia, no formato usado pelo escritório
+    parte = parte.copy()
+    for coluna in esquema.COLUNAS_DATA:
+        if coluna in parte:
+            parte[coluna] = parte[coluna].dt.strftime("%d/%m/%Y")
+    return parte.astype(object).where(parte.notna(), None)
+
+
+def _escrever_csv(caminho, partes, avancar):
+    with open(caminho, "w", newline="", encoding="utf-8-sig") as arquivo:
+        escritor = csv.writer(arquivo, delimiter=";")
+        cabecalho = False
+        for parte in partes:
+            if not cabecalho:
+                escritor.writerow(parte.columns)
+                cabecalho = True
+            parte = _texto_planilha(parte)
+            if "Valor" in parte:
+                parte["Valor"] = parte["Valor"].map(lambda v: None if v is None else f"{v:.2f}".replace(".", ","))
+            escritor.writerows(parte.itertuples(index=False, name=None))
+            avancar(len(parte))
+
+
+def _escrever_xlsx(caminho, partes, avancar):
+    from openpyxl import Workbook
+
+    # Modo write_only: as linhas vão direto para o arquivo, sem montar a planilha na memória
+    livro = Workbook(write_only=True)
+    planilha = livro.create_sheet("Relatório")
+    cabecalho = False
+    for parte in partes:
+        if not cabecalho:
+            planilha.append(list(parte.columns))
+            cabecalho = True
+        for linha in _texto_planilha(parte).itertuples(index=False, name=None):
+            planilha.append(linha)
+        avancar(len(parte))
+    livro.save(caminho)
+
+
+def _escrever_parquet(caminho, partes, avancar):
+    escritor = None
+    try:
+        for parte in partes:
+            tabela = pa.Table.from_pandas(parte, preserve_index=False)
+            if "id" in parte:
+                esquema_arrow = instantaneo.ESQUEMA_ARROW
+                if "Escritorio" in parte:
+                    esquema_arrow = esquema_arrow.insert(0, pa.field("Escritorio", pa.string()))
+                tabela = tabela.cast(esquema_arrow)
+            if escritor is None:
+                escritor = pq.ParquetWriter(caminho, tabela.schema)
+            escritor.write_table(tabela)
+            avancar(len(parte))
+    finally:
+        if escritor is not None:
+            escritor.close()
+
+
+_ESCRITORES = {"csv": _escrever_csv, "xlsx": _escrever_xlsx, "parquet": _escrever_parquet}
+
+
+def _exportar(exportacao, conteudo, formato, inicio, fim, escritorios):
+    def avancar(linhas):
+        with _trava:
+            exportacao.feitos += linhas
+
+    temporario = exportacao.caminho + ".tmp"
+    try:
+        _ESCRITORES[formato](temporario, _partes(conteudo, inicio, fim, escritorios), avancar)
+        os.replace(temporario, exportacao.caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+
+# Envia a exportação do período [inicio, fim]; retorna o id do trabalho.
+# conteudo: "resumo" ou "detalhado"; formato: "csv", "xlsx" ou "parquet";
+# escritorios: escritórios incluídos (padrão: só o escritório em uso).
+def enviar(conteudo, formato, inicio, fim, escritorios=None):
+    if conteudo not in CONTEUDOS or formato not in FORMATOS:
+        raise ValueError(f"Exportação inválida: {conteudo}/{formato}")
+    _limpar_antigas()
+    os.makedirs(PASTA, exist_ok=True)
+    id_exportacao = uuid.uuid4().hex
+    escritorios = list(escritorios or [particoes.atual()])
+    total = None
+    if conteudo == "detalhado":
+        contagens = particoes.em_cada(lambda: armazenamento.contar_clientes(contrato_de=inicio, contrato_ate=fim), escritorios)
+        total = sum(contagens.values())
+    exportacao = _Exportacao(os.path.join(PASTA, f"{id_exportacao}.{formato}"), total)
+    with _trava:
+        _trabalhos[id_exportacao] = exportacao
+    exportacao.futuro = _obter_executor().submit(_exportar, exportacao, conteudo, formato, inicio, fim, escritorios)
+    return id_exportacao
+
+
+# Situação de uma exportação: {"status": "pendente" | "concluido" | "erro" | "desconhecido",
+# "progresso": 0 a 1, "caminho": arquivo pronto (quando concluída), "erro": mensagem (quando falhou)}
+def consultar(id_exportacao):
+    with _trava:
+        exportacao = _trabalhos.get(id_exportacao)
+        feitos = exportacao.feitos if exportacao else 0
+    if exportacao is None or exportacao.futuro is None:
+        return {"status": "desconhecido", "progresso": 0.0}
+    if not exportacao.futuro.done():
+        progresso = min(feitos / exportacao.total, 0.99) if exportacao.total else 0.0
+        return {"status": "pendente", "progresso": progresso}
+    if exportacao.futuro.exception() is not None:
+        return {"status": "erro", "progresso": 1.0, "erro": str(exportacao.futuro.exception())}
+    return {"status": "concluido", "progresso": 1.0, "caminho": exportacao.caminho}
+
+
+# Remove uma exportação e o arquivo gerado
+def descartar(id_exportacao):
+    with _trava:
+        exportacao = _trabalhos.pop(id_exportacao, None)
+    if exportacao is not None and os.path.exists(exportacao.caminho):
+        os.remove(exportacao.caminho)
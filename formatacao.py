@@ -0,0 +1,69 @@
+import pandas as pd
+
+from esquema import COLUNAS_DATA
+
+# Formatações de exibição compartilhadas pelas páginas. Todas recebem uma série inteira
+# e trabalham com operações vetorizadas de texto; aplique-as só às linhas exibidas.
+
+# Converte documentos/telefones para texto só com os dígitos gravados (vazio quando ausente)
+def _texto(serie):
+    return serie.fillna('').astype(str).str.replace(r'\.0$', '', regex=True)
+
+
+def formatar_telefone(serie):
+    telefone = _texto(serie)
+    tamanho = telefone.str.len()
+    celular = "(" + telefone.str[:2] + ") " + telefone.str[2:7] + "-" + telefone.str[7:]
+    fixo = "(" + telefone.str[:2] + ") " + telefone.str[2:6] + "-" + telefone.str[6:]
+    return telefone.mask(tamanho == 11, celular).mask(tamanho == 10, fixo)
+
+
+def formatar_cpf(serie):
+    # O esquema já entrega os documentos com os zeros à esquerda
+    cpf = _texto(serie)
+    formatado = cpf.str[:3] + "." + cpf.str[3:6] + "." + cpf.str[6:9] + "-" + cpf.str[9:]
+    return formatado.mask(cpf == '', '')
+
+
+def formatar_cnpj(serie):
+    cnpj = _texto(serie)
+    formatado = cnpj.str[:2] + "." + cnpj.str[2:5] + "." + cnpj.str[5:8] + "/" + cnpj.str[8:12] + "-" + cnpj.str[12:]
+    return formatado.mask(cnpj == '', '')
+
+
+# Valores em reais no padrão brasileiro: R$ 1.234,56
+def formatar_valor(serie):
+    numeros = pd.to_numeric(serie, errors='coerce').dropna()
+    centavos = (numeros.abs() * 100).round().astype('int64')
+    inteiros = (centavos // 100).astype(str).str.replace(r'\B(?=(\d{3})+$)', '.', regex=True)
+    decimais = (centavos % 100).astype(str).str.zfill(2)
+    sinal = (numeros < 0).map({True: '-', False: ''})
+    texto = "R$ " + sinal + inteiros + "," + decimais
+    return texto.reindex(serie.index, fill_value='')
+
+
+# Versão para um único valor (métricas e documentos)
+def formatar_moeda(valor):
+    return formatar_valor(pd.Series([valor])).iloc[0]
+
+
+def formatar_datas(serie):
+    return pd.to_datetime(serie, errors='coerce').dt.strftime('%d/%m/%Y').fillna('')
+
+
+# Aplica todas as formatações às colunas presentes; retorna uma cópia
+def formatar_tabela(dados):
+    formatados = dados.copy()
+    formatadores = {
+        'Telefone': formatar_telefone,
+        'CPF': formatar_cpf,
+        'CNPJ': formatar_cnpj,
+        'Valor': formatar_valor,
+    }
+    for coluna, formatador in formatadores.items():
+        if coluna in formatados.columns:
+            formatados[coluna] = formatador(formatados[coluna])
+    for coluna in COLUNAS_DATA:
+        if coluna in formatados.columns:
+            formatados[coluna] = formatar_datas(formatados[coluna])
+    return formatados
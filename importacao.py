@@ -0,0 +1,192 @@
+import codecs
+import io
+import os
+
+import pandas as pd
+
+import busca
+import esquema
+
+# Importação de clientes em lote a partir de planilhas CSV ou XLSX.
+# O arquivo é lido em partes (sem carregar tudo na memória de uma vez), cada parte é
+# validada e normalizada com operações vetorizadas do pandas, e as linhas válidas são
+# gravadas juntas numa única transação. As linhas recusadas voltam com o motivo.
+TAMANHO_PARTE = 20000
+
+_OPCOES = {coluna: opcoes for coluna, opcoes in esquema.CATEGORIAS.items() if opcoes}
+_MINIMO_DIGITOS = {"CPF": 9, "CNPJ": 12}  # menos que isso não é um documento com zeros perdidos
+_OBRIGATORIAS = ["Nome", "DT_contrato"]
+
+
+# Nome de coluna da planilha -> coluna do banco ("Órgão" -> "Orgao", "dt contrato" -> "DT_contrato")
+def _mapear_colunas(cabecalho):
+    conhecidas = {busca.normalizar(coluna): coluna for coluna in esquema.COLUNAS}
+    mapa = {}
+    for nome in cabecalho:
+        coluna = conhecidas.get(busca.normalizar(nome if nome is not None else ""))
+        if coluna and coluna not in mapa.values():
+            mapa[nome] = coluna
+    faltando = [coluna for coluna in _OBRIGATORIAS if coluna not in mapa.values()]
+    if faltando:
+        raise ValueError(f"Coluna obrigatória ausente na planilha: {', '.join(faltando)}")
+    return mapa
+
+
+# Texto de uma célula do XLSX: datas em ISO, números inteiros sem ".0"
+def _celula(valor):
+    if valor is None:
+        return ""
+    if hasattr(valor, "strftime"):
+        return valor.strftime("%Y-%m-%d")
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return str(valor)
+
+
+def _partes_csv(arquivo):
+    inicio = arquivo.read(65536)
+    arquivo.seek(0)
+    try:
+        # Decodificação incremental: um caractere de vários bytes cortado no fim do trecho lido não é erro
+        codecs.getincrementaldecoder("utf-8")().decode(inicio, final=False)
+        codificacao = "utf-8-sig"
+    except UnicodeDecodeError:
+        codificacao = "latin-1"  # CSV salvo pelo Excel em português
+    primeira_linha = inicio.split(b"\n", 1)[0]
+    separador = ";" if primeira_linha.count(b";") > primeira_linha.count(b",") else ","
+    yield from pd.read_csv(
+        arquivo, sep=separador, dtype=str, keep_default_na=False,
+        encoding=codificacao, chunksize=TAMANHO_PARTE,
+    )
+
+
+def _partes_xlsx(arquivo):
+    from openpyxl import load_workbook
+
+    planilha = load_workbook(arquivo, read_only=True, data_only=True)
+    try:
+        linhas = planilha.active.iter_rows(values_only=True)
+        cabecalho = [_celula(valor) for valor in next(linhas, ())]
+        parte = []
+        for linha in linhas:
+            parte.append([_celula(valor) for valor in linha[:len(cabecalho)]])
+            if len(parte) == TAMANHO_PARTE:
+                yield pd.DataFrame(parte, columns=cabecalho)
+                parte = []
+        if parte or not cabecalho:
+            yield pd.DataFrame(parte, columns=cabecalho)
+    finally:
+        planilha.close()
+
+
+# Lê a planilha em partes de TAMANHO_PARTE linhas (todas as células como texto)
+def ler_em_partes(arquivo, nome_arquivo):
+    extensao = os.path.splitext(nome_arquivo)[1].lower()
+    if extensao in (".xlsx", ".xlsm"):
+        return _partes_xlsx(arquivo)
+    if extensao in (".csv", ".txt"):
+        return _partes_csv(arquivo)
+    raise ValueError(f"Formato de arquivo não suportado: {extensao or nome_arquivo}")
+
+
+def _datas(valores):
+    datas = pd.to_datetime(valores, format="%d/%m/%Y", errors="coerce")
+    faltando = datas.isna() & (valores != "")
+    if faltando.any():
+        iso = pd.to_datetime(valores[faltando].str[:10], format="%Y-%m-%d", errors="coerce")
+        datas[faltando] = iso
+    return datas.dt.strftime("%Y-%m-%d")
+
+
+# Valores em reais escritos à brasileira (1.234,56) ou à americana (1,234.56): o último separador
+# é o decimal e o outro separa os milhares. O que não vira número fica vazio (Valor inválido).
+def _valores_monetarios(valores):
+    texto = valores.str.replace("R$", "", regex=False).str.replace(r"\s", "", regex=True)
+    decimal_virgula = texto.str.rfind(",") > texto.str.rfind(".")
+    texto[decimal_virgula] = texto[decimal_virgula].str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
+    texto[~decimal_virgula] = texto[~decimal_virgula].str.replace(",", "", regex=False)
+    return pd.to_numeric(texto, errors="coerce")
+
+
+# Valida e normaliza uma parte da planilha. Retorna (linhas válidas prontas para o banco,
+# DataFrame das linhas recusadas com 'Linha' e 'Motivo'). primeira_linha é o número da
+# linha da planilha correspondente à primeira linha da parte.
+def validar_parte(parte, mapa, primeira_linha):
+    original = parte.rename(columns=mapa)[list(mapa.values())]
+    original = original.fillna("").astype(str).apply(lambda coluna: coluna.str.strip())
+    dados = pd.DataFrame(index=original.index)
+    motivos = pd.Series("", index=original.index)
+
+    def recusar(mascara, motivo):
+        motivos[mascara] = motivos[mascara] + motivo + "; "
+
+    def coluna(nome):
+        return original[nome] if nome in original else pd.Series("", index=original.index)
+
+    dados["Nome"] = coluna("Nome")
+    recusar(dados["Nome"] == "", "Nome vazio")
+
+    for nome in esquema.COLUNAS_DATA:
+        texto = coluna(nome)
+        dados[nome] = _datas(texto)
+        recusar(dados[nome].isna() & (texto != ""), f"{nome} inválida")
+    recusar(coluna("DT_contrato") == "", "DT_contrato vazia")
+
+    for nome, opcoes in _OPCOES.items():
+        texto = coluna(nome)
+        canonicas = {busca.normalizar(opcao): opcao for opcao in opcoes}
+        dados[nome] = texto.map({valor: canonicas.get(busca.normalizar(valor)) for valor in texto.unique()})
+        recusar(dados[nome].isna() & (texto != ""), f"{nome} desconhecido")
+
+    for nome, tamanho in esquema.DIGITOS_DOCUMENTO.items():
+        minimo = _MINIMO_DIGITOS[nome]
+        digitos = esquema.digitos_documento(coluna(nome)).astype(object)
+        recusar((digitos != "") & ((digitos.str.len() < minimo) | (digitos.str.len() > tamanho)), f"{nome} inválido")
+        dados[nome] = digitos.str.zfill(tamanho).where(digitos != "")
+
+    for nome in ("Telefone", "Num_Processo"):
+        texto = coluna(nome).str.replace(r"\.0$", "", regex=True)
+        dados[nome] = texto.where(texto != "", None)
+    for nome in ("Auto_infracao", "Status"):
+        texto = coluna(nome)
+        dados[nome] = texto.where(texto != "", None)
+
+    texto = coluna("Valor")
+    dados["Valor"] = _valores_monetarios(texto)
+    recusar(dados["Valor"].isna() & (texto != ""), "Valor inválido")
+
+    validas = motivos == ""
+    finais = dados.loc[validas, esquema.COLUNAS].astype(object)
+    finais = finais.where(finais.notna(), None)
+    linhas = list(finais.itertuples(index=False, name=None))
+
+    recusadas = original[~validas].copy()
+    recusadas.insert(0, "Motivo", motivos[~validas].str.rstrip("; "))
+    recusadas.insert(0, "Linha", primeira_linha + original.index[~validas.to_numpy()])
+    return linhas, recusadas
+
+
+# Lê e valida a planilha inteira; retorna (linhas válidas, DataFrame das recusadas).
+# progresso, se informado, é chamado com o número de linhas lidas após cada parte.
+def preparar_importacao(arquivo, nome_arquivo, progresso=None):
+    linhas, recusadas, lidas, mapa = [], [], 0, None
+    for parte in ler_em_partes(arquivo, nome_arquivo):
+        if mapa is None:
+            mapa = _mapear_colunas(parte.columns)
+        parte = parte.reset_index(drop=True)
+        validas, recusadas_parte = validar_parte(parte, mapa, primeira_linha=lidas + 2)  # linha 1 é o cabeçalho
+        linhas.extend(validas)
+        if not recusadas_parte.empty:
+            recusadas.append(recusadas_parte)
+        lidas += len(parte)
+        if progresso:
+            progresso(lidas)
+    recusadas = pd.concat(recusadas, ignore_index=True) if recusadas else pd.DataFrame(columns=["Linha", "Motivo"])
+    return linhas, recusadas
+
+
+# Relatório das linhas recusadas em CSV (para baixar, corrigir e importar de novo)
+def relatorio_recusadas(recusadas):
+    buffer = io.StringIO()
+    recusadas.to_csv(buffer, index=False, sep=";")
+    return buffer.getvalue().encode("utf-8-sig")
@@ -0,0 +1,195 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import armazenamento
+import esquema
+import eventos
+import particoes
+
+# Snapshot colunar dos clientes em Parquet, um arquivo por ano de DT_contrato.
+# Os gatilhos do banco anotam em anos_pendentes quais anos mudaram; depois de cada
+# gravação só esses arquivos são reescritos, por uma thread em segundo plano (agendar).
+# O cache das páginas (cache_dados.py) lê as colunas já tipadas direto dos arquivos
+# (mapeados em memória) e completa com os eventos gravados depois do snapshot; quem lê
+# nunca escreve no banco nem espera o snapshot ser refeito.
+# Cada escritório tem sua pasta; PASTA é a do primeiro (ver particoes.py).
+PASTA = os.environ.get("IVP_SNAPSHOT", os.path.join(".cache", "snapshot"))
+ESPERA_ATUALIZACAO = 0.5  # segundos juntando gravações antes de reescrever o snapshot
+
+_MANIFESTO = "manifesto.json"
+
+log = logging.getLogger("ivp.instantaneo")
+_CATEGORIA = pa.dictionary(pa.int32(), pa.string())
+
+
+def _tipo_arrow(coluna):
+    if coluna in esquema.COLUNAS_DATA:
+        return pa.timestamp("ns")
+    if coluna in esquema.CATEGORIAS:
+        return _CATEGORIA
+    if coluna == "Valor":
+        return pa.float64()
+    return pa.string()
+
+
+ESQUEMA_ARROW = pa.schema([("id", pa.int64())] + [(coluna, _tipo_arrow(coluna)) for coluna in esquema.COLUNAS])
+
+_trava = threading.Lock()
+_trava_thread = threading.Lock()
+_pedido = threading.Event()
+_escritorios_pendentes = set()
+_thread = None
+
+
+# Pasta do snapshot do escritório em uso
+def pasta():
+    return particoes.caminho(PASTA, particoes.atual())
+
+
+def _arquivo(ano):
+    return os.path.join(pasta(), f"ano={ano or 'sem_data'}.parquet")
+
+
+def _arquivos():
+    if not os.path.isdir(pasta()):
+        return []
+    return sorted(os.path.join(pasta(), nome) for nome in os.listdir(pasta()) if nome.endswith(".parquet"))
+
+
+def _gravar_ano(ano, dados):
+    caminho = _arquivo(ano)
+    if dados.empty:
+        if os.path.exists(caminho):
+            os.remove(caminho)
+        return
+    tabela = pa.Table.from_pandas(dados.reset_index(), preserve_index=False)
+    tabela = tabela.select(ESQUEMA_ARROW.names).cast(ESQUEMA_ARROW)
+    temporario = caminho + ".tmp"
+    pq.write_table(tabela, temporario)
+    os.replace(temporario, caminho)
+
+
+# O manifesto guarda o último evento (eventos.py) já incluído nos arquivos
+def _gravar_manifesto(versao, seq):
+    temporario = os.path.join(pasta(), _MANIFESTO + ".tmp")
+    with open(temporario, "w") as arquivo:
+        json.dump({"versao": versao, "seq": seq, "gerado_em": time.time()}, arquivo)
+    os.replace(temporario, os.path.join(pasta(), _MANIFESTO))
+
+
+def _ler_manifesto():
+    try:
+        with open(os.path.join(pasta(), _MANIFESTO)) as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return None
+
+
+# Reescreve os anos pendentes. Os anos e os seus clientes são lidos numa só transação de
+# leitura (sem travar o banco para escrita); os anos só saem da lista depois que os arquivos e
+# o manifesto estão no lugar, e só se não foram marcados de novo nesse meio-tempo. Se a
+# gravação falhar (ou o processo cair), os anos continuam pendentes e o manifesto anterior vale.
+# Retorna os anos reescritos.
+def atualizar():
+    with _trava:
+        os.makedirs(pasta(), exist_ok=True)
+        conexao = armazenamento.conectar()
+        conexao.execute("BEGIN")
+        try:
+            pendentes = conexao.execute("SELECT ano, marca FROM anos_pendentes ORDER BY ano").fetchall()
+            partes = {ano: armazenamento.carregar_ano(ano) for ano, _ in pendentes}
+            versao = armazenamento.versao()
+            seq = eventos.ultimo()
+        finally:
+            conexao.commit()
+        for ano, dados in partes.items():
+            _gravar_ano(ano, dados)
+        _gravar_manifesto(versao, seq)
+        with conexao:
+            conexao.executemany("DELETE FROM anos_pendentes WHERE ano = ? AND marca = ?", pendentes)
+        return [ano for ano, _ in pendentes]
+
+
+# Refaz o snapshot inteiro a partir do banco (também apaga arquivos de anos que não existem mais)
+def reconstruir():
+    with _trava:
+        conexao = armazenamento.conectar()
+        with conexao:
+            conexao.execute(
+                "INSERT OR IGNORE INTO anos_pendentes "
+                "SELECT DISTINCT COALESCE(substr(DT_contrato, 1, 4), '') FROM clientes"
+            )
+        for caminho in _arquivos():
+            os.remove(caminho)
+    return atualizar()
+
+
+# Clientes do snapshot como está no disco: (último evento incluído, DataFrame indexado pelo
+# id com os tipos do esquema), ou None se o escritório ainda não tem snapshot. O snapshot pode
+# estar atrás do banco; quem lê completa com eventos.alteracoes a partir do seq devolvido.
+# colunas e anos limitam o que é lido: só os arquivos dos anos pedidos e só as colunas pedidas.
+def carregar(colunas=None, anos=None):
+    colunas = ["id"] + [c for c in (colunas or esquema.COLUNAS) if c != "id"]
+    with _trava:
+        manifesto = _ler_manifesto()
+        if manifesto is None or manifesto.get("seq") is None:
+            return None
+        arquivos = _arquivos() if anos is None else [c for c in map(_arquivo, anos) if os.path.exists(c)]
+        tabelas = [pq.read_table(caminho, columns=colunas, memory_map=True) for caminho in arquivos]
+    if tabelas:
+        tabela = pa.concat_tables(tabelas)
+    else:
+        tabela = ESQUEMA_ARROW.empty_table().select(colunas)
+    dados = tabela.to_pandas(types_mapper={pa.string(): esquema.TEXTO}.get)
+    return manifesto["seq"], dados.set_index("id").sort_index()
+
+
+# Pede uma atualização em segundo plano do snapshot do escritório (chamado depois de cada gravação no banco)
+def agendar(escritorio=None):
+    global _thread
+    with _trava_thread:
+        _escritorios_pendentes.add(escritorio or particoes.atual())
+        _pedido.set()
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(target=_atualizador, name="ivp-snapshot", daemon=True)
+            _thread.start()
+
+
+def _atualizador():
+    while True:
+        _pedido.wait()
+        time.sleep(ESPERA_ATUALIZACAO)
+        with _trava_thread:
+            _pedido.clear()
+            escritorios = sorted(_escritorios_pendentes)
+            _escritorios_pendentes.clear()
+        for escritorio in escritorios:
+            try:
+                with particoes.em(escritorio):
+                    # Sem snapshot (ou de uma versão sem o seq dos eventos): refaz tudo
+                    manifesto = _ler_manifesto()
+                    if manifesto is None or manifesto.get("seq") is None:
+                        reconstruir()
+                    else:
+                        atualizar()
+            except Exception:
+                log.exception("Falha ao atualizar o snapshot de %s", escritorio)
+
+
+if __name__ == "__main__":
+    # Uso: python instantaneo.py reconstruir  (refaz o snapshot de todos os escritórios)
+    if len(sys.argv) >= 2 and sys.argv[1] == "reconstruir":
+        for escritorio in particoes.ESCRITORIOS:
+            with particoes.em(escritorio):
+                inicio = time.perf_counter()
+                anos = reconstruir()
+                print(f"Snapshot refeito em {pasta()}: {len(anos)} arquivo(s) em {time.perf_counter() - inicio:.2f}s")
+    else:
+        print("Uso: python instantaneo.py reconstruir")
@@ -0,0 +1,81 @@
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+# Mede a abertura de uma página do Streamlit (por padrão a página inicial) em processos novos:
+# - inicio_frio: do início do interpretador até a página terminar de ser montada
+# - execucao: tempo de execução do script da página (o que o usuário espera a cada rerun)
+# - bytes_pagina: tamanho das mensagens enviadas ao navegador (textos, imagens embutidas)
+# - bytes_imagens: imagens que o navegador baixa para a primeira exibição
+# - modulos_pesados: bibliotecas pesadas carregadas só por abrir a página
+#
+# Uso: python medir_inicio.py [pagina.py] [repeticoes]
+MODULOS_PESADOS = ["pandas", "plotly.express", "fpdf", "PIL.Image", "pyarrow"]
+
+
+def _medir(pagina):
+    inicio = time.perf_counter()
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.testing.v1 import AppTest
+
+    # Soma o tamanho das imagens que a página entrega pelo gerenciador de mídia
+    bytes_midia = []
+    adicionar = MediaFileManager.add
+
+    def contar(self, dados, *args, **kwargs):
+        bytes_midia.append(os.path.getsize(dados) if isinstance(dados, str) else len(dados))
+        return adicionar(self, dados, *args, **kwargs)
+
+    MediaFileManager.add = contar
+    carregados_antes = {m for m in MODULOS_PESADOS if m in sys.modules}
+
+    app = AppTest.from_file(os.path.abspath(pagina), default_timeout=120)
+    inicio_execucao = time.perf_counter()
+    app.run()
+    fim = time.perf_counter()
+
+    def tamanho(no):
+        proprio = no.proto.ByteSize() if getattr(no, "proto", None) is not None else 0
+        return proprio + sum(tamanho(filho) for filho in getattr(no, "children", {}).values())
+
+    bytes_pagina = tamanho(app._tree.main)
+    estaticos = set()
+    for elemento in app.markdown:
+        estaticos.update(re.findall(r"app/static/([^\s\"')]+)", elemento.value))
+    bytes_estaticos = sum(os.path.getsize(os.path.join("static", nome)) for nome in estaticos)
+
+    return {
+        "inicio_frio": fim - inicio,
+        "execucao": fim - inicio_execucao,
+        "bytes_pagina": bytes_pagina,
+        "bytes_imagens": sum(bytes_midia) + bytes_estaticos,
+        "modulos_pesados": sorted({m for m in MODULOS_PESADOS if m in sys.modules} - carregados_antes),
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--interno":
+        print(json.dumps(_medir(sys.argv[2])))
+        sys.exit()
+
+    pagina = sys.argv[1] if len(sys.argv) > 1 else "Pagina_inicial.py"
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    medicoes = []
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, __file__, "--interno", pagina], capture_output=True, text=True, check=True
+        ).stdout
+        medicoes.append(json.loads(saida.strip().splitlines()[-1]))
+
+    # A primeira execução pode gerar as imagens reduzidas; os tamanhos vêm da última
+    ultima = medicoes[-1]
+    print(f"{pagina} ({repeticoes} processos novos, mediana)")
+    print(f"  início a frio:     {statistics.median(m['inicio_frio'] for m in medicoes) * 1000:8.0f} ms")
+    print(f"  execução:          {statistics.median(m['execucao'] for m in medicoes) * 1000:8.0f} ms")
+    print(f"  mensagens:         {ultima['bytes_pagina'] / 1024:8.1f} KB")
+    print(f"  imagens:           {ultima['bytes_imagens'] / 1024:8.1f} KB")
+    print(f"  módulos pesados:   {', '.join(ultima['modulos_pesados']) or 'nenhum'}")
@@ -0,0 +1,223 @@
+import collections
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Instrumentação leve das etapas das páginas: cada trecho medido com `etapa(nome)` entra
+# na execução atual da página (uma por rerun, guardada por thread, que é como o Streamlit
+# roda cada sessão) e no acumulado do processo, que guarda as últimas medições de cada
+# etapa para os percentis. Contadores somam eventos (recargas de cache, acertos, etc.).
+# Opcionalmente cada execução é gravada numa linha JSON e o acumulado é publicado no
+# formato do Prometheus em http://localhost:<porta>/metrics.
+JANELA = 500  # medições guardadas por etapa para os percentis
+PERCENTIS = [50, 90, 99]
+CAMINHO_ARQUIVO = os.environ.get("IVP_METRICAS_ARQUIVO")  # JSONL, uma linha por execução de página
+PORTA_PROMETHEUS = int(os.environ.get("IVP_METRICAS_PORTA", "0"))  # 0 = sem endpoint
+
+_trava = threading.Lock()
+_recentes = {}  # etapa -> últimas durações (segundos)
+_totais = {}  # etapa -> [quantidade, soma] desde o início do processo
+_contadores = collections.Counter()
+_local = threading.local()
+_servidor = None
+_servidor_tentado = False
+
+log = logging.getLogger("ivp.metricas")
+
+
+class Execucao:
+    def __init__(self, pagina):
+        self.pagina = pagina
+        self.quando = datetime.now().isoformat(timespec="seconds")
+        self.inicio = time.perf_counter()
+        self.total = None
+        self.etapas = []  # [nome, segundos, nível de aninhamento], na ordem em que começaram
+        self.contadores = collections.Counter()
+        self.nivel = 0
+
+
+def _registrar(nome, segundos):
+    with _trava:
+        if nome not in _recentes:
+            _recentes[nome] = collections.deque(maxlen=JANELA)
+            _totais[nome] = [0, 0.0]
+        _recentes[nome].append(segundos)
+        _totais[nome][0] += 1
+        _totais[nome][1] += segundos
+
+
+# Começa a medir uma execução da página (chamar no topo do script)
+def iniciar(pagina):
+    if PORTA_PROMETHEUS:
+        iniciar_servidor()
+    _local.execucao = Execucao(pagina)
+    return _local.execucao
+
+
+# Encerra a execução atual: registra o tempo total da página e grava no arquivo, se configurado
+def finalizar():
+    execucao = getattr(_local, "execucao", None)
+    if execucao is None:
+        return None
+    _local.execucao = None
+    execucao.total = time.perf_counter() - execucao.inicio
+    _registrar(f"pagina.{execucao.pagina}", execucao.total)
+    if CAMINHO_ARQUIVO:
+        _gravar(execucao)
+    return execucao
+
+
+# Mede um trecho: with metricas.etapa("consulta.formatacao"): ...
+@contextmanager
+def etapa(nome):
+    execucao = getattr(_local, "execucao", None)
+    registro = None
+    if execucao is not None:
+        registro = [nome, None, execucao.nivel]
+        execucao.etapas.append(registro)
+        execucao.nivel += 1
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        segundos = time.perf_counter() - inicio
+        if registro is not None:
+            registro[1] = segundos
+            execucao.nivel -= 1
+        _registrar(nome, segundos)
+
+
+def contar(nome, quantidade=1):
+    with _trava:
+        _contadores[nome] += quantidade
+    execucao = getattr(_local, "execucao", None)
+    if execucao is not None:
+        execucao.contadores[nome] += quantidade
+
+
+def _percentil(ordenados, p):
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+# Percentis das últimas medições de cada etapa: {etapa: {"quantidade", "p50", "p90", "p99", "media"}}
+def resumo():
+    with _trava:
+        recentes = {nome: sorted(valores) for nome, valores in _recentes.items()}
+        totais = {nome: tuple(total) for nome, total in _totais.items()}
+    return {
+        nome: {
+            "quantidade": totais[nome][0],
+            "media": totais[nome][1] / totais[nome][0],
+            **{f"p{p}": _percentil(valores, p) for p in PERCENTIS},
+        }
+        for nome, valores in sorted(recentes.items())
+    }
+
+
+def contadores():
+    with _trava:
+        return dict(_contadores)
+
+
+def _gravar(execucao):
+    linha = json.dumps({
+        "quando": execucao.quando,
+        "pagina": execucao.pagina,
+        "total": execucao.total,
+        "etapas": [{"etapa": nome, "segundos": segundos} for nome, segundos, _ in execucao.etapas if segundos is not None],
+        "contadores": dict(execucao.contadores),
+    }, ensure_ascii=False)
+    with _trava:
+        os.makedirs(os.path.dirname(CAMINHO_ARQUIVO) or ".", exist_ok=True)
+        with open(CAMINHO_ARQUIVO, "a", encoding="utf-8") as arquivo:
+            arquivo.write(linha + "\n")
+
+
+def _rotulo(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"')
+
+
+# Acumulado do processo no formato de texto do Prometheus (percentis das últimas medições)
+def texto_prometheus():
+    linhas = [
+        "# HELP ivp_etapa_segundos Duração das etapas das páginas (percentis das últimas medições).",
+        "# TYPE ivp_etapa_segundos summary",
+    ]
+    with _trava:
+        totais = {nome: tuple(total) for nome, total in _totais.items()}
+    for nome, estatisticas in resumo().items():
+        for p in PERCENTIS:
+            linhas.append(f'ivp_etapa_segundos{{etapa="{_rotulo(nome)}",quantile="{p / 100}"}} {estatisticas[f"p{p}"]:.6f}')
+        linhas.append(f'ivp_etapa_segundos_sum{{etapa="{_rotulo(nome)}"}} {totais[nome][1]:.6f}')
+        linhas.append(f'ivp_etapa_segundos_count{{etapa="{_rotulo(nome)}"}} {totais[nome][0]}')
+    linhas += ["# HELP ivp_eventos_total Contadores de eventos.", "# TYPE ivp_eventos_total counter"]
+    for nome, valor in sorted(contadores().items()):
+        linhas.append(f'ivp_eventos_total{{evento="{_rotulo(nome)}"}} {valor}')
+    return "\n".join(linhas) + "\n"
+
+
+class _Metricas(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        corpo = texto_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+# Sobe o endpoint /metrics uma única vez por processo (só escuta na máquina local)
+def iniciar_servidor(porta=None):
+    global _servidor, _servidor_tentado
+    with _trava:
+        if _servidor is None and not _servidor_tentado:
+            _servidor_tentado = True
+            porta = porta or PORTA_PROMETHEUS
+            try:
+                _servidor = ThreadingHTTPServer(("127.0.0.1", porta), _Metricas)
+            except OSError as erro:
+                # Porta ocupada (outro processo do app, por exemplo): as páginas seguem sem o endpoint
+                log.warning("Endpoint de métricas desativado: não foi possível usar a porta %s (%s)", porta, erro)
+            else:
+                threading.Thread(target=_servidor.serve_forever, daemon=True, name="ivp-metricas").start()
+    return _servidor
+
+
+def _ms(segundos):
+    return round(segundos * 1000, 1)
+
+
+# Painel de depuração: etapas desta execução e percentis acumulados (mostrar só para administradores)
+def painel(execucao):
+    import streamlit as st
+
+    if execucao is None:
+        return
+    with st.sidebar.expander(f"⏱️ {execucao.pagina}: {_ms(execucao.total)} ms"):
+        st.caption("Esta execução")
+        st.dataframe(
+            [{"Etapa": "· " * nivel + nome, "ms": _ms(segundos)} for nome, segundos, nivel in execucao.etapas if segundos is not None],
+            hide_index=True,
+        )
+        if execucao.contadores:
+            st.caption("Eventos desta execução")
+            st.dataframe([{"Evento": nome, "Quantidade": valor} for nome, valor in execucao.contadores.items()], hide_index=True)
+        st.caption(f"Últimas {JANELA} medições de cada etapa (processo inteiro)")
+        st.dataframe(
+            [
+                {"Etapa": nome, "n": dados["quantidade"], **{f"p{p} ms": _ms(dados[f"p{p}"]) for p in PERCENTIS}}
+                for nome, dados in resumo().items()
+            ],
+            hide_index=True,
+        )
@@ -0,0 +1,95 @@
+import os
+import re
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+# Particionamento dos clientes por escritório: cada escritório tem seu próprio banco SQLite
+# (com o mesmo esquema, gatilhos e resumo mensal) e seu próprio snapshot Parquet.
+# O escritório em uso é guardado por thread, então as funções de armazenamento continuam
+# sem parâmetro novo e só tocam o banco do escritório escolhido; relatórios de vários
+# escritórios consultam cada banco em paralelo e somam os resultados parciais.
+# O primeiro escritório usa os caminhos de sempre (clientes.db, .cache/snapshot);
+# os demais ganham o nome do escritório como sufixo (clientes_anapolis.db, ...).
+ESCRITORIOS = [nome.strip() for nome in os.environ.get("IVP_ESCRITORIOS", "Principal").split(",") if nome.strip()]
+
+_local = threading.local()
+_trava = threading.Lock()
+_executor = None
+
+
+# Nome do escritório em forma de arquivo: "Anápolis Centro" -> "anapolis_centro"
+def identificador(escritorio):
+    texto = unicodedata.normalize("NFKD", escritorio).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^0-9a-z]+", "_", texto.lower()).strip("_")
+
+
+# Caminho de um arquivo (banco, pasta de snapshot) do escritório informado
+def caminho(base, escritorio):
+    if escritorio == ESCRITORIOS[0]:
+        return base
+    raiz, extensao = os.path.splitext(base)
+    return f"{raiz}_{identificador(escritorio)}{extensao}"
+
+
+# Escritório em uso nesta thread (o primeiro, se nenhum foi escolhido)
+def atual():
+    return getattr(_local, "escritorio", None) or ESCRITORIOS[0]
+
+
+def usar(escritorio):
+    if escritorio not in ESCRITORIOS:
+        raise ValueError(f"Escritório desconhecido: {escritorio}")
+    _local.escritorio = escritorio
+
+
+# Executa um trecho no escritório informado e volta ao anterior
+@contextmanager
+def em(escritorio):
+    anterior = getattr(_local, "escritorio", None)
+    usar(escritorio)
+    try:
+        yield
+    finally:
+        _local.escritorio = anterior
+
+
+def _executar_em(escritorio, funcao):
+    with em(escritorio):
+        return funcao()
+
+
+# Roda `funcao` em cada escritório (em paralelo quando são vários); retorna {escritório: resultado}
+def em_cada(funcao, escritorios=None):
+    global _executor
+    escritorios = list(escritorios or ESCRITORIOS)
+    if len(escritorios) == 1:
+        return {escritorios[0]: _executar_em(escritorios[0], funcao)}
+    with _trava:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=len(ESCRITORIOS), thread_name_prefix="ivp-escritorio")
+    futuros = {escritorio: _executor.submit(_executar_em, escritorio, funcao) for escritorio in escritorios}
+    return {escritorio: futuro.result() for escritorio, futuro in futuros.items()}
+
+
+# Usa o escritório escolhido na sessão do Streamlit (para callbacks, que rodam antes da página)
+def da_sessao():
+    import streamlit as st
+
+    escritorio = st.session_state.get("escritorio")
+    usar(escritorio if escritorio in ESCRITORIOS else ESCRITORIOS[0])
+    return atual()
+
+
+# Seletor de escritório na barra lateral (só aparece com mais de um escritório configurado)
+def seletor():
+    import streamlit as st
+
+    escritorio = da_sessao()
+    if len(ESCRITORIOS) > 1:
+        escolhido = st.sidebar.selectbox("Escritório", ESCRITORIOS, index=ESCRITORIOS.index(escritorio))
+        if escolhido != escritorio:
+            st.session_state["escritorio"] = escolhido
+            usar(escolhido)
+    return atual()
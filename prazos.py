@@ -0,0 +1,33 @@
+from datetime import datetime
+
+import pandas as pd
+
+# Processos com estes status já foram julgados e não contam prazo
+STATUS_SEM_PRAZO = ["DEFERIDO", "NEGADO"]
+
+
+# Calcula os dias restantes até o efeito suspensivo para todos os registros de uma vez.
+# Retorna uma série numérica (negativa = vencido, vazia = sem prazo ou sem data).
+def calcular_dias_restantes(dados, agora=None):
+    agora = pd.Timestamp(agora or datetime.now())
+    dias = (dados['DT_Efeito_Susp'] - agora).dt.days
+    return dias.where(~dados['Status'].isin(STATUS_SEM_PRAZO))
+
+
+# Monta o texto do prazo a partir de 'dias_restantes' (usar só nas linhas exibidas)
+def rotular_prazos(dados):
+    dias = dados['dias_restantes']
+    rotulos = pd.Series("Datas ausentes", index=dados.index, dtype=object)
+
+    vencido = dias < 0
+    rotulos[vencido] = "Vencido há " + (-dias[vencido]).astype(int).astype(str) + " dias"
+    no_prazo = dias >= 0
+    rotulos[no_prazo] = "Faltam " + dias[no_prazo].astype(int).astype(str) + " dias"
+
+    rotulos[dados['Status'].isin(STATUS_SEM_PRAZO)] = "Não há Prazo"
+    return rotulos
+
+
+# Quantidade de prazos vencidos (dias restantes negativos), sobre os clientes já tipados do cache
+def contar_vencidos(dados, agora=None):
+    return int((calcular_dias_restantes(dados, agora) < 0).sum())
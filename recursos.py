@@ -0,0 +1,49 @@
+import os
+import threading
+
+# Imagens da página inicial servidas como arquivos estáticos (pasta static/, publicada pelo
+# Streamlit em app/static/ com ETag). As fotos originais são reduzidas para a largura em
+# que aparecem uma única vez; o nome do arquivo gerado muda quando o original muda,
+# então o navegador pode guardar a imagem em cache sem risco de exibir uma versão antiga.
+PASTA_ESTATICA = "static"
+PASTA_GERADA = os.path.join(PASTA_ESTATICA, "gerado")
+URL_ESTATICA = "app/static"
+LARGURA_PAGINA = 704  # largura do conteúdo no layout "centered" do Streamlit
+QUALIDADE = 80
+
+_trava = threading.Lock()
+_geradas = {}
+
+
+# Endereço de um arquivo que já está em static/
+def url(nome):
+    return f"{URL_ESTATICA}/{nome}"
+
+
+# Endereço de uma cópia da imagem reduzida para `largura` pixels (gerada na primeira vez)
+def imagem(original, largura=LARGURA_PAGINA):
+    estado = os.stat(original)
+    chave = (original, estado.st_mtime_ns, estado.st_size, largura)
+    with _trava:
+        if chave not in _geradas:
+            base = os.path.splitext(os.path.basename(original))[0]
+            nome = f"{base}_{largura}_{estado.st_mtime_ns}.jpg"
+            destino = os.path.join(PASTA_GERADA, nome)
+            if not os.path.exists(destino):
+                from PIL import Image
+
+                os.makedirs(PASTA_GERADA, exist_ok=True)
+                with Image.open(original) as foto:
+                    foto = foto.convert("RGB")
+                    if foto.width > largura:
+                        foto = foto.resize((largura, round(foto.height * largura / foto.width)), Image.LANCZOS)
+                    temporario = destino + ".tmp"
+                    foto.save(temporario, "JPEG", quality=QUALIDADE, optimize=True, progressive=True)
+                os.replace(temporario, destino)
+            _geradas[chave] = f"{URL_ESTATICA}/gerado/{nome}"
+        return _geradas[chave]
+
+
+# Imagem ocupando a largura da coluna (equivale ao use_column_width do st.image)
+def html_imagem(endereco, descricao=""):
+    return f'<img src="{endereco}" alt="{descricao}" style="width: 100%; height: auto;">'
@@ -0,0 +1,206 @@
+import io
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cache_documentos
+import documentos
+
+# Serviço de renderização de PDFs em segundo plano.
+# Os documentos são gerados num pool de processos (um por núcleo), fora da thread do
+# Streamlit; a página só envia o trabalho e consulta o andamento até o resultado ficar pronto.
+# Os processos são criados por um servidor próprio (forkserver) e não por fork do servidor
+# do Streamlit, que tem várias threads: um fork no meio de uma trava em uso travaria o filho.
+# Cada processo avisa o principal a cada documento gerado, por uma fila, para a barra de progresso.
+PROCESSOS = int(os.environ.get("IVP_PROCESSOS_PDF", os.cpu_count() or 2))
+CLIENTES_POR_PARTE = 25
+VALIDADE_TRABALHO = 60 * 60  # segundos que um trabalho concluído fica disponível
+_MODO_INICIO = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+_trava = threading.Lock()
+_pool = None
+_trabalhos = {}
+_fila_progresso = None  # nos processos do pool: fila para avisar o processo principal
+
+
+class _Trabalho:
+    def __init__(self, total, juntar):
+        self.total = total  # documentos a gerar
+        self.feitos = 0
+        self.partes = 0
+        self.partes_prontas = 0
+        self.juntar = juntar
+        self.criado = time.time()
+        self.resultado = None
+        self.erro = None
+
+
+def _iniciar_processo(fila):
+    global _fila_progresso
+    _fila_progresso = fila
+    cache_documentos.desativar_limite()
+
+
+# Recebe os avisos de documento gerado enviados pelos processos do pool
+def _receber_progresso(fila):
+    while True:
+        id_trabalho = fila.get()
+        with _trava:
+            trabalho = _trabalhos.get(id_trabalho)
+            if trabalho is not None:
+                trabalho.feitos += 1
+
+
+def _obter_pool():
+    global _pool
+    with _trava:
+        if _pool is None:
+            contexto = multiprocessing.get_context(_MODO_INICIO)
+            fila = contexto.Queue()
+            _pool = ProcessPoolExecutor(
+                max_workers=PROCESSOS, mp_context=contexto, initializer=_iniciar_processo, initargs=(fila,)
+            )
+            threading.Thread(target=_receber_progresso, args=(fila,), name="ivp-progresso-pdf", daemon=True).start()
+        return _pool
+
+
+# Descarta trabalhos antigos para não acumular PDFs na memória
+def _limpar_antigos():
+    limite = time.time() - VALIDADE_TRABALHO
+    with _trava:
+        for id_trabalho in [i for i, t in _trabalhos.items() if t.criado < limite]:
+            del _trabalhos[id_trabalho]
+
+
+# Junta os resultados das partes conforme os processos terminam
+def _acompanhar(trabalho, partes):
+    resultados = {}
+    try:
+        for parte in as_completed(partes):
+            resultados[parte] = parte.result()
+            with _trava:
+                trabalho.partes_prontas += 1
+        resultado = trabalho.juntar([resultados[parte] for parte in partes])
+        with _trava:
+            trabalho.resultado = resultado
+    except Exception as erro:
+        with _trava:
+            trabalho.erro = erro
+    finally:
+        # Os processos do pool gravaram no cache de documentos sem conferir o limite da pasta
+        cache_documentos.conferir_tamanho()
+
+
+# Registra um trabalho e envia suas partes ao pool: cada parte é (função, argumentos) e a
+# função recebe o id do trabalho como primeiro argumento. Retorna o id do trabalho.
+def _enviar(partes, total, juntar):
+    pool = _obter_pool()
+    _limpar_antigos()
+    id_trabalho = uuid.uuid4().hex
+    trabalho = _Trabalho(total, juntar)
+    trabalho.partes = len(partes)
+    with _trava:
+        _trabalhos[id_trabalho] = trabalho  # antes de enviar, para não perder os avisos de progresso
+    futuros = [pool.submit(funcao, id_trabalho, *argumentos) for funcao, argumentos in partes]
+    threading.Thread(target=_acompanhar, args=(trabalho, futuros), name="ivp-trabalho-pdf", daemon=True).start()
+    return id_trabalho
+
+
+# Trabalho já concluído (documento servido do cache, sem passar pelo pool)
+def _registrar_pronto(resultado):
+    _limpar_antigos()
+    id_trabalho = uuid.uuid4().hex
+    trabalho = _Trabalho(1, None)
+    trabalho.resultado = resultado
+    with _trava:
+        _trabalhos[id_trabalho] = trabalho
+    return id_trabalho
+
+
+def _avisar(id_trabalho):
+    _fila_progresso.put(id_trabalho)
+
+
+# Executados nos processos do pool
+def _renderizar_documento(id_trabalho, gerar, *campos):
+    conteudo = gerar(*campos)
+    _avisar(id_trabalho)
+    return conteudo
+
+
+def _renderizar_lote(id_trabalho, clientes, tipos, formato):
+    return documentos.gerar_lote(clientes, tipos, formato, progresso=lambda feitos, total: _avisar(id_trabalho))
+
+
+# Junta os ZIPs parciais de cada processo num único ZIP
+def _juntar_zips(conteudos):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as destino:
+        for conteudo in conteudos:
+            with zipfile.ZipFile(io.BytesIO(conteudo)) as parte:
+                for nome in parte.namelist():
+                    destino.writestr(nome, parte.read(nome))
+    return buffer.getvalue()
+
+
+# Envia a geração de um recibo; retorna o id do trabalho
+def enviar_recibo(nome, valor, data):
+    em_cache = cache_documentos.obter(documentos.chave_recibo(nome, valor, data))
+    if em_cache is not None:
+        return _registrar_pronto(em_cache)
+    return _enviar([(_renderizar_documento, (documentos.gerar_recibo, nome, valor, data))], 1, _primeiro)
+
+
+# Envia a geração de um contrato; retorna o id do trabalho
+def enviar_contrato(nome, servico, valor, data):
+    em_cache = cache_documentos.obter(documentos.chave_contrato(nome, servico, valor, data))
+    if em_cache is not None:
+        return _registrar_pronto(em_cache)
+    return _enviar([(_renderizar_documento, (documentos.gerar_contrato, nome, servico, valor, data))], 1, _primeiro)
+
+
+def _primeiro(resultados):
+    return resultados[0]
+
+
+# Envia um lote. No formato "zip" o lote é dividido entre os processos; o PDF único
+# precisa sair de um só FPDF, então é gerado inteiro por um processo.
+def enviar_lote(clientes, tipos, formato="zip"):
+    tipos = list(tipos)
+    total = len(clientes) * len(tipos)
+    if formato == "pdf":
+        return _enviar([(_renderizar_lote, (clientes, tipos, "pdf"))], total, _primeiro)
+    partes = [
+        (_renderizar_lote, (clientes.iloc[inicio:inicio + CLIENTES_POR_PARTE], tipos, "zip"))
+        for inicio in range(0, len(clientes), CLIENTES_POR_PARTE)
+    ]
+    return _enviar(partes, total, _juntar_zips)
+
+
+# Situação de um trabalho: {"status": "pendente" | "concluido" | "erro" | "desconhecido",
+# "progresso": 0 a 1, "resultado": bytes (quando concluído), "erro": mensagem (quando falhou)}
+def consultar(id_trabalho):
+    with _trava:
+        trabalho = _trabalhos.get(id_trabalho)
+        if trabalho is None:
+            return {"status": "desconhecido", "progresso": 0.0}
+        if trabalho.resultado is not None:
+            return {"status": "concluido", "progresso": 1.0, "resultado": trabalho.resultado}
+        if trabalho.erro is not None:
+            return {"status": "erro", "progresso": 1.0, "erro": str(trabalho.erro)}
+        # Documentos avisados pelos processos ou, se estiverem atrasados, partes já concluídas
+        progresso = max(
+            trabalho.feitos / trabalho.total if trabalho.total else 0.0,
+            trabalho.partes_prontas / trabalho.partes if trabalho.partes else 0.0,
+        )
+    return {"status": "pendente", "progresso": min(progresso, 0.99)}
+
+
+# Remove um trabalho (depois que a página não precisa mais dele)
+def descartar(id_trabalho):
+    with _trava:
+        _trabalhos.pop(id_trabalho, None)
@@ -0,0 +1,116 @@
+from datetime import date, timedelta
+from functools import lru_cache
+
+import pandas as pd
+
+import armazenamento
+import particoes
+
+# Consultas do dashboard financeiro sobre o resumo mensal mantido pelos gatilhos do banco.
+# Meses inteiros dentro do período vêm direto de resumo_mensal; só as pontas de mês
+# incompletas (quando o período começa ou termina no meio de um mês) são somadas a
+# partir dos clientes, usando o índice de DT_contrato.
+# Relatórios de vários escritórios consultam o banco de cada um em paralelo e somam os
+# resumos parciais (quantidade e valor_total se somam por mês e combinação de campos).
+COLUNAS_RESUMO = ["mes", "Pagamento", "Tipo_de_Processo", "Status", "Orgao", "quantidade", "valor_total"]
+_CHAVE = COLUNAS_RESUMO[:5]
+
+_SQL_RESUMO = "SELECT mes, Pagamento, Tipo_de_Processo, Status, Orgao, quantidade, valor_total FROM resumo_mensal WHERE mes BETWEEN ? AND ?"
+
+_SQL_BRUTO = """
+SELECT substr(DT_contrato, 1, 7) AS mes, COALESCE(Pagamento, '') AS Pagamento,
+       COALESCE(Tipo_de_Processo, '') AS Tipo_de_Processo, COALESCE(Status, '') AS Status,
+       COALESCE(Orgao, '') AS Orgao, COUNT(*) AS quantidade, COALESCE(SUM(Valor), 0) AS valor_total
+FROM clientes WHERE DT_contrato BETWEEN ? AND ?
+GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+def _primeiro_dia_do_proximo_mes(dia):
+    return (dia.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _como_data(valor):
+    return valor.date() if hasattr(valor, "date") and callable(valor.date) else valor
+
+
+# Resumo do período [inicio, fim] (datas inclusivas), uma linha por mês e combinação de campos.
+# escritorios: lista de escritórios a somar (padrão: só o escritório em uso).
+def consultar_resumo(inicio, fim, escritorios=None):
+    inicio, fim = _como_data(inicio), _como_data(fim)
+    if not escritorios:
+        return _consultar_resumo(inicio, fim)
+    partes = particoes.em_cada(lambda: _consultar_resumo(inicio, fim), escritorios)
+    return somar_resumos(list(partes.values()))
+
+
+# Junta resumos parciais (de escritórios diferentes) num só
+def somar_resumos(partes):
+    if len(partes) == 1:
+        return partes[0]
+    resumo = pd.concat(partes, ignore_index=True)
+    resumo = resumo.groupby(_CHAVE, as_index=False, sort=False, dropna=False)[["quantidade", "valor_total"]].sum()
+    return resumo.sort_values("mes", kind="stable", ignore_index=True)
+
+
+def _consultar_resumo(inicio, fim):
+    primeiro_completo = inicio if inicio.day == 1 else _primeiro_dia_do_proximo_mes(inicio)
+    ultimo_completo = fim if _primeiro_dia_do_proximo_mes(fim) - timedelta(days=1) == fim else fim.replace(day=1) - timedelta(days=1)
+
+    partes, parametros = [], []
+    if primeiro_completo <= ultimo_completo:
+        partes.append(_SQL_RESUMO)
+        parametros += [primeiro_completo.strftime("%Y-%m"), ultimo_completo.strftime("%Y-%m")]
+        pontas = []
+        if inicio < primeiro_completo:
+            pontas.append((inicio, primeiro_completo - timedelta(days=1)))
+        if fim > ultimo_completo:
+            pontas.append((ultimo_completo + timedelta(days=1), fim))
+    else:
+        pontas = [(inicio, fim)]
+    for de, ate in pontas:
+        partes.append(_SQL_BRUTO)
+        parametros += [de.isoformat(), ate.isoformat()]
+
+    sql = f"""
+    SELECT mes, Pagamento, Tipo_de_Processo, Status, Orgao, SUM(quantidade), SUM(valor_total)
+    FROM ({" UNION ALL ".join(partes)})
+    GROUP BY mes, Pagamento, Tipo_de_Processo, Status, Orgao
+    ORDER BY mes
+    """
+    linhas = armazenamento.conectar().execute(sql, parametros).fetchall()
+    return pd.DataFrame(linhas, columns=COLUNAS_RESUMO)
+
+
+def _primeira_data_contrato():
+    return armazenamento.conectar().execute("SELECT MIN(DT_contrato) FROM clientes").fetchone()[0]
+
+
+# Data do contrato mais antigo (para o seletor de período), no escritório em uso ou nos informados
+def primeira_data_contrato(escritorios=None):
+    valores = particoes.em_cada(_primeira_data_contrato, escritorios or [particoes.atual()]).values()
+    valores = [valor for valor in valores if valor]
+    return date.fromisoformat(min(valores)) if valores else None
+
+
+# Soma 'valor_total' (e 'quantidade') agrupando o resumo pelas colunas pedidas
+def totalizar(resumo, colunas):
+    return resumo.groupby(colunas, as_index=False)[["quantidade", "valor_total"]].sum()
+
+
+# Faturamento mensal por forma de pagamento: um único agrupamento mês x Pagamento sobre o
+# resumo, com uma coluna por forma de pagamento encontrada e a coluna 'Total'.
+# Fica em cache por (versão dos dados de cada escritório, início, fim), então ir e voltar nas
+# datas não recalcula.
+def faturamento_por_pagamento(inicio, fim, escritorios=None):
+    versoes = particoes.em_cada(armazenamento.versao, escritorios or [particoes.atual()])
+    return _faturamento_por_pagamento(tuple(versoes.items()), _como_data(inicio), _como_data(fim)).copy()
+
+
+@lru_cache(maxsize=64)
+def _faturamento_por_pagamento(versoes, inicio, fim):
+    resumo = consultar_resumo(inicio, fim, [escritorio for escritorio, _ in versoes])
+    tabela = resumo.pivot_table(index="mes", columns="Pagamento", values="valor_total", aggfunc="sum", fill_value=0)
+    tabela.columns.name = None
+    tabela["Total"] = tabela.sum(axis=1)
+    return tabela
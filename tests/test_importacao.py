@@ -0,0 +1,37 @@
+import io
+
+import pandas as pd
+import pytest
+
+import importacao
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("1.234,56", 1234.56),
+    ("1,234.56", 1234.56),
+    ("R$ 1.234.567,89", 1234567.89),
+    ("1,234,567.89", 1234567.89),
+    ("150,5", 150.5),
+    ("150.5", 150.5),
+    ("1500", 1500.0),
+])
+def test_valores_monetarios_separadores(texto, esperado):
+    assert importacao._valores_monetarios(pd.Series([texto])).iloc[0] == pytest.approx(esperado)
+
+
+@pytest.mark.parametrize("texto", ["1,2,3", "1.234.5,6,7", "abc"])
+def test_valores_monetarios_invalidos(texto):
+    assert pd.isna(importacao._valores_monetarios(pd.Series([texto])).iloc[0])
+
+
+def test_importacao_com_separadores_misturados():
+    planilha = io.BytesIO(
+        "Nome;DT_contrato;Valor\n"
+        "Ana;01/02/2024;\"1,234.56\"\n"
+        "Bia;01/02/2024;\"1.234,56\"\n"
+        "Caio;01/02/2024;\"1,2,3\"\n".encode("utf-8")
+    )
+    linhas, recusadas = importacao.preparar_importacao(planilha, "clientes.csv")[:2]
+    valores = [linha[importacao.esquema.COLUNAS.index("Valor")] for linha in linhas]
+    assert valores == [pytest.approx(1234.56), pytest.approx(1234.56)]
+    assert recusadas["Motivo"].str.contains("Valor inválido").tolist() == [True]